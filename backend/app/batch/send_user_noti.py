@@ -3,6 +3,7 @@
 마지막 로그인 시간이 1주 또는 한달 이상인 사용자에게 식단 등록 알림을 보내는 배치 스크립트입니다.
 - 마지막 로그인 시간 + 7일 또는 30일 이상인 사용자에게 FCM 푸시 알림을 전송합니다.
 - 특정 요일(일요일) 또는 매월 1일에 실행하도록 스케줄링할 수 있습니다.
+- 사용자는 스트리밍으로 조회하면서 토큰을 500개씩 묶어 multicast 로 동시 전송하고, 무효 토큰은 전송 후 일괄 삭제합니다. (push_service 참고)
 """
 
 
@@ -12,59 +13,56 @@ import os
 # backend 루트 디렉토리를 sys.path에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
-from app.libs.utils.fcm import send_fcm
+from app.core.config import settings
 from app.core.database import SessionLocal
-from app.services.users_service import get_users_last_login
+from app.services.push_service import send_push_to_tokens
+from app.services.users_service import iter_users_last_login
 
 def validate_user(user):
     if not user.fcm_token:
         return False
 
-    if not user.is_push_agree or user.is_push_agree == 0:
+    if not user.push_agree or user.push_agree == 0:
         return False
 
     return True
 
-def user_noti_week():
+def send_meal_remind(days: int, body: str):
     db = SessionLocal()
 
-    users = get_users_last_login(db, 7, is_push_agree=1)
-
-    for user in users:
-        if validate_user(user) == False:
-            continue
+    try:
+        # 조회하면서 바로 전송 (전체 사용자를 메모리에 올리지 않음)
+        users = iter_users_last_login(db, days, is_push_agree=1, batch_size=settings.USER_SCAN_BATCH_SIZE)
+        tokens = (user.fcm_token for user in users if validate_user(user))
 
-        send_fcm(
-            token=user.fcm_token,
+        stats = send_push_to_tokens(
+            db,
+            tokens,
             title="🥗 BML 식단 알림",
-            body="오늘 식단을 아직 등록하지 않으셨어요!",
+            body=body,
             data={
                 "type": "meal_remind",
                 "screen": "MealPlan"
             }
         )
+        print(
+            f"식단 알림 전송 완료 ({days}일): 토큰 {stats['tokens']}개, 성공 {stats['success']}, 실패 {stats['failure']}, "
+            f"무효 토큰 삭제 {stats['cleared']}, 묶음 {stats['batches']}개 (실패 {stats['failed_batches']}), "
+            f"{stats['elapsed_sec']}초 ({stats['per_sec']}/s)"
+        )
+        for error in stats["errors"]:
+            print(f"⚠️ FCM 전송 오류: {error}")
+    finally:
+        db.close()
 
-def user_noti_month():
-    db = SessionLocal()
-
-    users = get_users_last_login(db, 30, is_push_agree=1)
-
-    for user in users:
-        if validate_user(user) == False:
-            continue
+def user_noti_week():
+    send_meal_remind(7, "오늘 식단을 아직 등록하지 않으셨어요!")
 
-        send_fcm(
-            token=user.fcm_token,
-            title="🥗 BML 식단 알림",
-            body="한 달 동안 식단을 등록하지 않으셨어요!",
-            data={
-                "type": "meal_remind",
-                "screen": "MealPlan"
-            }
-        )
+def user_noti_month():
+    send_meal_remind(30, "한 달 동안 식단을 등록하지 않으셨어요!")
 
 if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "week":
         user_noti_week()
     elif len(sys.argv) > 1 and sys.argv[1] == "month":
-        user_noti_month()
\ No newline at end of file
+        user_noti_month()
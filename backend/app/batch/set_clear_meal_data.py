@@ -1,59 +1,50 @@
 """
 삭제된 식단을 정리하는 배치 작업
 - 삭제 기간
-    - 전월 1일부터 전월 말일까지 삭제
-    - is_active 가 "N"인 식단 중에서 삭제 기간에 해당하는 식단을 대상으로 함
+    - 삭제(is_active = "N") 후 30일이 지난 식단을 대상으로 함
 
-- 삭제 대상
+- 삭제 대상 (청크 단위 일괄 DELETE, meals_purge_service 참고)
     - meals_calrendar
     - attaches_files
     - meal_ingredient_mappers
     - meals_likes
     - meals_comments
-    - meals_summaries
-    - 실제 업로드된 파일 삭제
+    - meals_scraps
+    - meals_feed_projection
+    - 실제 업로드된 파일 삭제 (공유 파일은 참조가 모두 없어진 경우만)
+
+- 중단되면 PURGE_CHECKPOINT_PATH 의 체크포인트부터 이어서 처리
 """
 from datetime import datetime, timedelta
 import sys
 import os
 # backend 루트 디렉토리를 sys.path에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from app.core.config import settings
 from app.core.database import SessionLocal
 
-from app.services.meals_service import get_deleted_meals, delete_meal_calendar
-from app.services.meals_summaries_service import delete_meal_summary_by_id
-from app.services.meals_likes_service import delete_meal_like_by_meal_calendar
-from app.services.ingredients_mappers_service import delete_ingredient_mapper
-from app.services.meals_comments_service import delete_comments_by_meal_calendar_id
-from app.services.attaches_files_service import hard_delete_file
+from app.services.meals_purge_service import purge_deleted_meals
 
 db = SessionLocal()
 def set_clear_meal_date():
 
-    search_param = {
-        "is_active": "N",
-        "search_date": (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-    }
-
-    delete_meal = get_deleted_meals(db, search_param=search_param)
+    search_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
 
     try:
-        for meal in delete_meal:
-            # ai 요약 정보 삭제
-            delete_meal_summary_by_id(db, meal.id)
-            # 좋아요 정보 삭제
-            delete_meal_like_by_meal_calendar(db, meal)
-            # 재료 매핑 정보 삭제
-            delete_ingredient_mapper(db, meal.id)
-            # 코멘트 정보 삭제
-            delete_comments_by_meal_calendar_id(db, meal.id)
-            # 첨부파일 및 attaches_files 삭제
-            hard_delete_file(db, model="Meals", model_id=meal.id)
-            # meals_calendar 삭제
-            delete_meal_calendar(db, meal)
-            db.commit()
-
+        stats = purge_deleted_meals(
+            db,
+            search_date=search_date,
+            chunk_size=settings.PURGE_CHUNK_SIZE,
+            checkpoint_path=settings.PURGE_CHECKPOINT_PATH,
+            unlink_workers=settings.PURGE_UNLINK_WORKERS,
+        )
+        print(
+            f"삭제 식단 정리 완료: 식단 {stats['meals']}건, 행 {sum(stats['rows'].values())}건 ({stats['rows_per_sec']}/s), "
+            f"파일 {stats['files']}개 ({stats['files_per_sec']}/s), {stats['elapsed_sec']}초 - {stats['rows']}"
+        )
     except Exception as e:
-        return
+        print(f"⚠️ 삭제 식단 정리 실패 (체크포인트부터 재시도 가능): {str(e)}")
+    finally:
+        db.close()
 
-set_clear_meal_date()
\ No newline at end of file
+set_clear_meal_date()
@@ -0,0 +1,25 @@
+"""
+피드 목록용 식단 집계(meals_feed_projection) 재구성 배치
+- 최초 적재 및 정합성 보정용 (쓰기 경로 갱신 누락 대비)
+- 댓글 수 / 대표 이미지 / 재료 태그 / 스크랩 집계를 전체 다시 계산
+"""
+import sys
+import os
+# backend 루트 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from app.core.database import SessionLocal
+
+from app.services.meals_feed_projections_service import rebuild_meal_feed_projection
+
+db = SessionLocal()
+def set_meals_feed_projection():
+    try:
+        rebuild_meal_feed_projection(db)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"식단 집계 재구성 실패: {str(e)}")
+    finally:
+        db.close()
+
+set_meals_feed_projection()
@@ -0,0 +1,25 @@
+"""
+회원 집계(users_stats) 재계산 배치
+- 최초 적재 및 정합성 보정용 (쓰기 경로 증감 누락 대비)
+- 좋아요 수 / 식단 수 / 공개 식단 수를 원본 테이블에서 회원 id 순으로 청크 단위 재계산
+"""
+import sys
+import os
+# backend 루트 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from app.core.config import settings
+from app.core.database import SessionLocal
+
+from app.services.users_stats_service import reconcile_users_stats
+
+db = SessionLocal()
+def set_users_stats():
+    try:
+        stats = reconcile_users_stats(db, settings.USERS_STATS_RECONCILE_CHUNK)
+        print(f"회원 집계 재계산 완료: 회원 {stats['users']}명, 청크 {stats['chunks']}개, {stats['elapsed_sec']}초 ({stats['users_per_sec']}/s)")
+    except Exception as e:
+        print(f"회원 집계 재계산 실패: {str(e)}")
+    finally:
+        db.close()
+
+set_users_stats()
@@ -0,0 +1,329 @@
+"""
+광고 클릭 write-behind 버퍼
+- 클릭은 워커별 append-only spool 파일(JSON lines)에 기록하고 즉시 응답
+- 백그라운드 스레드가 주기적으로 spool 을 pending 파일로 교체한 뒤
+    - ads_clicks_logs 는 bulk INSERT
+    - ads.click_count 는 광고별 1회 click_count = click_count + N
+- DB 연결 오류로 실패하면 남은 pending 파일은 그대로 두고 다음 주기에 재시도
+- 데이터 오류(삭제된 광고 FK 등)로 실패한 파일은 건너뛰고 다음 파일을 계속 처리,
+  max_attempts 회 실패하면 .failed 로 이름을 바꿔 보관 (뒤의 파일이 막히지 않도록)
+- 워커 재시작 시 종료된 프로세스의 spool / pending 파일을 이어받아 반영 (replay)
+- 파일 소유자는 프로세스별 고유 토큰({pid}_{시작 ns}), 소유 프로세스는 살아 있는 동안 owner-{토큰}.lock 에 flock 유지
+  -> 잠금을 얻을 수 있으면 종료된 프로세스 (컨테이너에서 pid 가 재사용되어도 구분됨)
+"""
+import glob
+import json
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy.exc import InterfaceError, OperationalError
+
+from app.core.config import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows (로컬 개발) - pid 로만 확인
+    fcntl = None
+
+SPOOL_SUFFIX = ".log"
+PENDING_SUFFIX = ".pending"
+FAILED_SUFFIX = ".failed"
+LOCK_PREFIX = "owner-"
+LOCK_SUFFIX = ".lock"
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _owner_token(path: str):
+    # clicks-{token}.log / clicks-{token}-{ts}.pending
+    name = os.path.basename(path).split(".", 1)[0]
+    parts = name.split("-")
+    return parts[1] if len(parts) > 1 and parts[1] else None
+
+
+class AdsClickBuffer:
+
+    def __init__(self, spool_dir: str, flush_interval: float = 5.0, max_attempts: int = 5):
+        self.spool_dir = spool_dir
+        self.flush_interval = flush_interval
+        self.max_attempts = max(1, max_attempts)
+        self._lock = threading.Lock()
+        self._owner_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._owner = None
+        self._owner_pid = None
+        self._owner_fd = None
+        self._attempts = {}
+
+    def _lock_path(self, token: str) -> str:
+        return os.path.join(self.spool_dir, f"{LOCK_PREFIX}{token}{LOCK_SUFFIX}")
+
+    @property
+    def owner(self) -> str:
+        """
+        현재 프로세스의 소유자 토큰 (fork 이후 pid 가 달라지면 새로 발급)
+        """
+        with self._owner_lock:
+            if self._owner_pid != os.getpid():
+                if self._owner_fd is not None:
+                    # 부모 프로세스에서 물려받은 잠금 fd (닫아도 부모의 잠금은 유지)
+                    os.close(self._owner_fd)
+                    self._owner_fd = None
+
+                self._owner = f"{os.getpid()}_{time.time_ns()}"
+                self._owner_pid = os.getpid()
+                self._attempts = {}
+
+                if fcntl is not None:
+                    os.makedirs(self.spool_dir, exist_ok=True)
+                    fd = os.open(self._lock_path(self._owner), os.O_RDWR | os.O_CREAT, 0o644)
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    self._owner_fd = fd
+
+            return self._owner
+
+    def _owner_alive(self, token: str) -> bool:
+        if token == self.owner:
+            return True
+
+        if fcntl is None:
+            pid = token.split("_", 1)[0]
+            return pid.isdigit() and _pid_alive(int(pid))
+
+        try:
+            fd = os.open(self._lock_path(token), os.O_RDWR)
+        except FileNotFoundError:
+            # 잠금 파일이 없는 소유자 (이전 형식 파일 / 정리된 소유자)
+            return False
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return True
+        finally:
+            os.close(fd)
+        return False
+
+    @property
+    def spool_path(self) -> str:
+        return os.path.join(self.spool_dir, f"clicks-{self.owner}{SPOOL_SUFFIX}")
+
+    def add(self, ads_id: int, user_id: int, ip: str, user_agent: str):
+        """
+        클릭 1건 spool 기록
+        """
+        line = json.dumps({
+            "ads_id": ads_id,
+            "user_id": user_id,
+            "ip": (ip or "")[:20],
+            "user_agent": user_agent,
+            "created_at": datetime.now().isoformat(),
+        }, ensure_ascii=False)
+
+        spool_path = self.spool_path
+        with self._lock:
+            os.makedirs(self.spool_dir, exist_ok=True)
+            with open(spool_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def _rotate(self):
+        """
+        현재 spool 을 pending 파일로 교체 (이후 클릭은 새 spool 에 기록)
+        """
+        spool_path = self.spool_path
+        with self._lock:
+            if not os.path.exists(spool_path) or os.path.getsize(spool_path) == 0:
+                return
+
+            pending_path = os.path.join(
+                self.spool_dir,
+                f"clicks-{self.owner}-{time.time_ns()}{PENDING_SUFFIX}"
+            )
+            os.replace(spool_path, pending_path)
+
+    def _claim_orphans(self):
+        """
+        종료된 워커가 남긴 spool / pending 을 현재 워커 소유 pending 으로 이어받음
+        (rename 은 원자적이므로 여러 워커가 동시에 시도해도 한 곳에서만 처리)
+        """
+        orphan_files = glob.glob(os.path.join(self.spool_dir, f"clicks-*{SPOOL_SUFFIX}"))
+        orphan_files += glob.glob(os.path.join(self.spool_dir, f"clicks-*{PENDING_SUFFIX}"))
+
+        alive = {}
+        for path in orphan_files:
+            token = _owner_token(path)
+            if token is None:
+                continue
+            if token not in alive:
+                alive[token] = self._owner_alive(token)
+            if alive[token]:
+                continue
+
+            claimed = os.path.join(
+                self.spool_dir,
+                f"clicks-{self.owner}-{time.time_ns()}{PENDING_SUFFIX}"
+            )
+            try:
+                os.replace(path, claimed)
+            except FileNotFoundError:
+                # 다른 워커가 먼저 가져감
+                continue
+
+        # 종료된 소유자의 잠금 파일 정리
+        for lock_path in glob.glob(os.path.join(self.spool_dir, f"{LOCK_PREFIX}*{LOCK_SUFFIX}")):
+            token = os.path.basename(lock_path)[len(LOCK_PREFIX):-len(LOCK_SUFFIX)]
+            if token not in alive:
+                alive[token] = self._owner_alive(token)
+            if alive[token]:
+                continue
+
+            try:
+                os.remove(lock_path)
+            except FileNotFoundError:
+                continue
+
+    def _pending_files(self) -> list:
+        owner = self.owner
+        files = []
+        for path in sorted(glob.glob(os.path.join(self.spool_dir, f"clicks-*{PENDING_SUFFIX}"))):
+            if _owner_token(path) == owner:
+                files.append(path)
+        return files
+
+    def _dead_letter(self, path: str):
+        """
+        반복 실패한 pending 파일을 .failed 로 보관 (수동 확인 / 재처리용)
+        """
+        failed_path = path[:-len(PENDING_SUFFIX)] + FAILED_SUFFIX
+        try:
+            os.replace(path, failed_path)
+            print(f"⚠️ 광고 클릭 반영 {self.max_attempts}회 실패, 보관 처리: {failed_path}")
+        except OSError as e:
+            print(f"⚠️ 광고 클릭 실패 파일 보관 실패 ({path}): {str(e)}")
+
+    @staticmethod
+    def _read_clicks(path: str) -> list:
+        clicks = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    click = json.loads(line)
+                except ValueError:
+                    # 비정상 종료로 잘린 마지막 줄
+                    print(f"⚠️ 광고 클릭 spool 손상 라인 무시: {path}")
+                    continue
+                click["created_at"] = datetime.fromisoformat(click["created_at"])
+                clicks.append(click)
+        return clicks
+
+    @staticmethod
+    def _write_clicks(clicks: list):
+        from app.core.database import SessionLocal
+        from app.repository.ads_repository import AdsRepository
+        from app.repository.ads_clicks_logs_repository import AdsClicksLogsRepository
+
+        db = SessionLocal()
+        try:
+            AdsClicksLogsRepository.bulk_add_logs(db, clicks)
+
+            for ads_id, count in Counter(click["ads_id"] for click in clicks).items():
+                AdsRepository.increase_click_count(db, ads_id, count)
+
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def flush(self) -> int:
+        """
+        spool -> DB 반영, 반영한 클릭 수 반환
+        """
+        with self._flush_lock:
+            if not os.path.isdir(self.spool_dir):
+                return 0
+
+            self._rotate()
+            self._claim_orphans()
+
+            flushed = 0
+            for path in self._pending_files():
+                try:
+                    clicks = self._read_clicks(path)
+                    if clicks:
+                        self._write_clicks(clicks)
+                    os.remove(path)
+                    self._attempts.pop(path, None)
+                    flushed += len(clicks)
+                except FileNotFoundError:
+                    continue
+                except (OperationalError, InterfaceError) as e:
+                    # DB 연결 오류 - 남은 파일도 실패하므로 다음 주기에 재시도 (실패 횟수에 포함하지 않음)
+                    print(f"⚠️ 광고 클릭 반영 실패 ({path}): {str(e)}")
+                    break
+                except Exception as e:
+                    # 이 파일의 데이터 오류 - 건너뛰고 다음 파일 처리
+                    attempts = self._attempts.get(path, 0) + 1
+                    print(f"⚠️ 광고 클릭 반영 실패 ({path}, {attempts}/{self.max_attempts}회): {str(e)}")
+                    if attempts >= self.max_attempts:
+                        self._attempts.pop(path, None)
+                        self._dead_letter(path)
+                    else:
+                        self._attempts[path] = attempts
+
+            return flushed
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"⚠️ 광고 클릭 flush 오류: {str(e)}")
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ads-click-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        스레드 종료 후 남은 클릭 반영
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.flush_interval + 5)
+            self._thread = None
+
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"⚠️ 광고 클릭 종료 flush 오류: {str(e)}")
+
+
+ads_click_buffer = AdsClickBuffer(
+    spool_dir=settings.ADS_CLICK_SPOOL_DIR,
+    flush_interval=settings.ADS_CLICK_FLUSH_INTERVAL,
+    max_attempts=settings.ADS_CLICK_MAX_ATTEMPTS,
+)
@@ -7,6 +7,15 @@ load_dotenv()
 class Settings():
     # 데이터베이스 설정
     DATABASE_URL: str = os.getenv("DATABASE_URL")
+    ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL", "")
+
+    # 커넥션 풀 설정 (워커 1개 기준, sync/async 엔진 각각 적용)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "10"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "False").lower() == "true"
+    DB_ECHO: bool = os.getenv("DB_ECHO", "False").lower() == "true"
 
     # API 설정
     API_V1_STR: str = "/api/v1"
@@ -22,10 +31,92 @@ class Settings():
     PASSWORD_RESET_DAILY_LIMIT: int = int(os.getenv("PASSWORD_RESET_DAILY_LIMIT", "5"))
     OPENAI_API_KEY:str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_CALL_URL:str = os.getenv("OPENAI_CALL_URL", "")
+    # OpenAI 호출 (시도당 타임아웃 / 연결 타임아웃 초, 재시도 횟수, backoff 기준 초, 워커 프로세스별 동시 호출 수)
+    OPENAI_TIMEOUT: float = float(os.getenv("OPENAI_TIMEOUT", "60"))
+    OPENAI_CONNECT_TIMEOUT: float = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "5"))
+    OPENAI_MAX_RETRIES: int = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+    OPENAI_BACKOFF_BASE: float = float(os.getenv("OPENAI_BACKOFF_BASE", "0.5"))
+    OPENAI_CONCURRENCY: int = int(os.getenv("OPENAI_CONCURRENCY", "8"))
+
+    # AI 식단 요약 캐시 (TTL 초, 최대 항목 수, 재료 양(score) 반올림 단위)
+    SUMMARY_CACHE_TTL: int = int(os.getenv("SUMMARY_CACHE_TTL", "86400"))
+    SUMMARY_CACHE_MAX_ITEMS: int = int(os.getenv("SUMMARY_CACHE_MAX_ITEMS", "10000"))
+    SUMMARY_CACHE_SCORE_STEP: float = float(os.getenv("SUMMARY_CACHE_SCORE_STEP", "0.1"))
+
+    # AI 요약 작업 (워커 프로세스별 동시 실행 수, 결과 보관 초, long-polling 최대 대기 초, 다른 워커 작업 DB 확인 간격 초)
+    SUMMARY_JOB_CONCURRENCY: int = int(os.getenv("SUMMARY_JOB_CONCURRENCY", "8"))
+    SUMMARY_JOB_RESULT_TTL: int = int(os.getenv("SUMMARY_JOB_RESULT_TTL", "600"))
+    SUMMARY_JOB_MAX_WAIT: float = float(os.getenv("SUMMARY_JOB_MAX_WAIT", "30"))
+    SUMMARY_JOB_POLL_INTERVAL: float = float(os.getenv("SUMMARY_JOB_POLL_INTERVAL", "1"))
     STATIC_BASE_URL:str = os.getenv("STATIC_BASE_URL", "")
     FREE_SUMMARY_AGENT_COUNT:int = int(os.getenv("FREE_SUMMARY_AGENT_COUNT", "10"))
     PROMPT_TEMPLATES_DIR: str = os.getenv("PROMPT_TEMPLATES_DIR", "prompts")
+    # 프롬프트 템플릿 변경 확인 간격 (초, 0 이면 시작 시 한 번만 읽음)
+    PROMPT_RELOAD_INTERVAL: float = float(os.getenv("PROMPT_RELOAD_INTERVAL", "5"))
     GOOGLE_SECRET_KEY: str = os.getenv("GOOGLE_SECRET_KEY", "")
     GOOGLE_CLIENT_ID: str = os.getenv("GOOGLE_CLIENT_ID", "")
     GOOGLE_REDIRECT_URI: str = os.getenv("GOOGLE_REDIRECT_URI", "http://localhost")
+
+    # 피드/커뮤니티 광고 인벤토리 캐시 (초)
+    ADS_INVENTORY_CACHE_TTL: int = int(os.getenv("ADS_INVENTORY_CACHE_TTL", "300"))
+
+    # 광고 클릭 write-behind (spool 디렉토리, flush 주기 초, 데이터 오류 재시도 횟수 - 초과 시 .failed 로 보관)
+    ADS_CLICK_SPOOL_DIR: str = os.getenv("ADS_CLICK_SPOOL_DIR", "spool/ads_clicks")
+    ADS_CLICK_FLUSH_INTERVAL: float = float(os.getenv("ADS_CLICK_FLUSH_INTERVAL", "5"))
+    ADS_CLICK_MAX_ATTEMPTS: int = int(os.getenv("ADS_CLICK_MAX_ATTEMPTS", "5"))
+
+    # 조회수 카운터 (flush 주기 초, 같은 사용자 재조회 무시 윈도우 초 - 0 이면 사용 안함)
+    COUNTER_FLUSH_INTERVAL: float = float(os.getenv("COUNTER_FLUSH_INTERVAL", "10"))
+    VIEW_DEDUPE_WINDOW: float = float(os.getenv("VIEW_DEDUPE_WINDOW", "600"))
+
+    # 업로드 이미지 변환 (프로세스 풀 워커 수 - 0 이면 요청 내 동기 처리, 사이즈별 WebP method 0~6)
+    IMAGE_WORKERS: int = int(os.getenv("IMAGE_WORKERS", "2"))
+    IMAGE_WEBP_METHODS: str = os.getenv("IMAGE_WEBP_METHODS", "original:4,large:4,medium:4,small:3,thumbnail:2")
+
+    # 업로드 제한 (디코딩 전 해상도 상한, crop 업로드 최대 MB, multipart 요청 전체 최대 MB)
+    IMAGE_MAX_PIXELS: int = int(os.getenv("IMAGE_MAX_PIXELS", "50000000"))
+    UPLOAD_CROP_MAX_MB: int = int(os.getenv("UPLOAD_CROP_MAX_MB", "20"))
+    UPLOAD_MAX_REQUEST_MB: int = int(os.getenv("UPLOAD_MAX_REQUEST_MB", "60"))
+
+    # 이미지 crop (프로세스 풀 워커 수 - 0 이면 스레드풀, 워커 프로세스별 동시 실행 수 / 최대 대기 수, 결과 긴 변 최대 px - 0 이면 제한 없음)
+    CROP_WORKERS: int = int(os.getenv("CROP_WORKERS", "2"))
+    CROP_CONCURRENCY: int = int(os.getenv("CROP_CONCURRENCY", "2"))
+    CROP_MAX_QUEUE: int = int(os.getenv("CROP_MAX_QUEUE", "16"))
+    CROP_MAX_OUTPUT: int = int(os.getenv("CROP_MAX_OUTPUT", "0"))
+    # crop 영역이 원본 면적의 이 비율 이하이면 JPEG 축소 디코딩 (결과 긴 변은 CROP_DRAFT_MIN_SIDE px 이상 유지, 0 이면 사용 안함)
+    CROP_DRAFT_AREA_RATIO: float = float(os.getenv("CROP_DRAFT_AREA_RATIO", "0.25"))
+    CROP_DRAFT_MIN_SIDE: int = int(os.getenv("CROP_DRAFT_MIN_SIDE", "1200"))
+
+    # 삭제 식단 정리 배치 (청크 크기, 파일 삭제 스레드 수, 체크포인트 파일)
+    PURGE_CHUNK_SIZE: int = int(os.getenv("PURGE_CHUNK_SIZE", "500"))
+    PURGE_UNLINK_WORKERS: int = int(os.getenv("PURGE_UNLINK_WORKERS", "8"))
+    PURGE_CHECKPOINT_PATH: str = os.getenv("PURGE_CHECKPOINT_PATH", "spool/purge_meals.json")
+
+    # 재료 × 영양소 행렬 캐시 - 변경 확인 간격 (초)
+    NUTRIENT_MATRIX_CHECK_INTERVAL: float = float(os.getenv("NUTRIENT_MATRIX_CHECK_INTERVAL", "60"))
+
+    # 배치 사용자 스트리밍 조회 시 한 번에 읽는 행 수
+    USER_SCAN_BATCH_SIZE: int = int(os.getenv("USER_SCAN_BATCH_SIZE", "1000"))
+
+    # 푸시 알림 배치 (multicast 1회당 토큰 수 - 최대 500, 동시 전송 스레드 수)
+    FCM_BATCH_SIZE: int = min(int(os.getenv("FCM_BATCH_SIZE", "500")), 500)
+    FCM_PUSH_WORKERS: int = int(os.getenv("FCM_PUSH_WORKERS", "4"))
+
+    # 회원 집계(users_stats) 재계산 배치 - 한 번에 처리하는 회원 수
+    USERS_STATS_RECONCILE_CHUNK: int = int(os.getenv("USERS_STATS_RECONCILE_CHUNK", "1000"))
+
+    # 주간 리포트 배치 (AI 동시 호출 수, 분당 호출 수, 대상 사용자 id - 콤마 구분, 비우면 전체)
+    WEEK_REPORT_CONCURRENCY: int = int(os.getenv("WEEK_REPORT_CONCURRENCY", "4"))
+    WEEK_REPORT_RATE_PER_MIN: float = float(os.getenv("WEEK_REPORT_RATE_PER_MIN", "60"))
+    WEEK_REPORT_USER_IDS: str = os.getenv("WEEK_REPORT_USER_IDS", "")
+
+    # 업로드 시 바로 만드는 사이즈 (나머지 사이즈 / 임의 width 는 요청 시 생성 후 디스크 캐시, 캐시 용량 MB)
+    IMAGE_EAGER_SIZES: str = os.getenv("IMAGE_EAGER_SIZES", "original,medium,thumbnail")
+    IMAGE_VARIANT_WIDTHS: str = os.getenv("IMAGE_VARIANT_WIDTHS", "150,400,800,1200")
+    IMAGE_VARIANT_CACHE_DIR: str = os.getenv("IMAGE_VARIANT_CACHE_DIR", "attaches/variants")
+    IMAGE_VARIANT_CACHE_MAX_MB: int = int(os.getenv("IMAGE_VARIANT_CACHE_MAX_MB", "1024"))
+
+    # 첨부 이미지 서빙 (stat 캐시 초, nginx X-Accel-Redirect internal location - 비어있으면 앱에서 직접 전송)
+    ATTACHES_STAT_CACHE_TTL: float = float(os.getenv("ATTACHES_STAT_CACHE_TTL", "5"))
+    ATTACHES_ACCEL_REDIRECT: str = os.getenv("ATTACHES_ACCEL_REDIRECT", "")
 settings = Settings()
@@ -0,0 +1,117 @@
+"""
+조회수 카운터 버퍼
+- 요청마다 UPDATE 하지 않고 (테이블, pk, 컬럼) 별 증가분을 메모리에 모아둠
+- 백그라운드 스레드가 주기적으로 col = col + delta 로 일괄 반영
+- viewer_key 를 넘기면 중복 방지 윈도우 동안 같은 사용자의 재조회는 집계하지 않음
+- 반영 실패 시 증가분을 다시 버퍼에 합쳐 다음 주기에 재시도
+"""
+import threading
+from collections import defaultdict
+
+from app.core.config import settings
+from app.libs.cache_utils import TTLCache
+
+
+class CounterBuffer:
+
+    def __init__(self, flush_interval: float = 10.0, dedupe_window: float = 600, dedupe_maxsize: int = 100000):
+        self.flush_interval = flush_interval
+        self.dedupe_window = dedupe_window
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._deltas = defaultdict(int)
+        self._models = {}
+        self._seen = TTLCache(ttl=dedupe_window, maxsize=dedupe_maxsize)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def incr(self, model, row_id: int, column: str = "view_count", delta: int = 1, viewer_key=None) -> bool:
+        """
+        증가분 기록 (중복 조회로 무시되면 False)
+        """
+        table = model.__tablename__
+
+        if viewer_key is not None and self.dedupe_window > 0:
+            if not self._seen.add((table, row_id, column, viewer_key)):
+                return False
+
+        with self._lock:
+            self._models[table] = model
+            self._deltas[(table, row_id, column)] += delta
+
+        return True
+
+    def pending(self, model, row_id: int, column: str = "view_count") -> int:
+        """
+        아직 DB 에 반영되지 않은 증가분 (응답 표시용)
+        """
+        with self._lock:
+            return self._deltas.get((model.__tablename__, row_id, column), 0)
+
+    def flush(self) -> int:
+        """
+        버퍼 -> DB 반영, 반영한 행 수 반환
+        """
+        from app.core.database import SessionLocal
+        from app.repository.counters_repository import CountersRepository
+
+        with self._flush_lock:
+            with self._lock:
+                if not self._deltas:
+                    return 0
+                deltas = self._deltas
+                models = dict(self._models)
+                self._deltas = defaultdict(int)
+
+            db = SessionLocal()
+            try:
+                for (table, row_id, column), delta in deltas.items():
+                    if delta:
+                        CountersRepository.add(db, models[table], row_id, column, delta)
+                db.commit()
+            except Exception:
+                db.rollback()
+                # 다음 주기에 재시도
+                with self._lock:
+                    for key, delta in deltas.items():
+                        self._deltas[key] += delta
+                raise
+            finally:
+                db.close()
+
+            return len(deltas)
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"⚠️ 카운터 flush 오류: {str(e)}")
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="counter-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        스레드 종료 후 남은 증가분 반영
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.flush_interval + 5)
+            self._thread = None
+
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"⚠️ 카운터 종료 flush 오류: {str(e)}")
+
+
+counter_buffer = CounterBuffer(
+    flush_interval=settings.COUNTER_FLUSH_INTERVAL,
+    dedupe_window=settings.VIEW_DEDUPE_WINDOW,
+)
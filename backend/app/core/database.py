@@ -1,7 +1,10 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from app.core.config import settings
+from app.core.db_metrics import pool_metrics, InstrumentedQueuePool, InstrumentedAsyncQueuePool
 
 import ssl
 import os
@@ -83,12 +86,25 @@ if ssl_context:
 # SQLAlchemy Engine
 # -------------------------
 
+# 풀 설정은 환경변수(DB_POOL_*)로 조정
+# - pool_recycle 로 MySQL wait_timeout 이전에 커넥션을 교체하므로 pre_ping 은 기본 비활성 (checkout 마다 왕복 1회 절약)
+# - echo 는 DB_ECHO=true 일 때만 (운영에서 모든 SQL 을 콘솔에 찍지 않도록)
+pool_options = {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    "echo": settings.DB_ECHO,
+}
+
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,   # 연결 끊김 방지
-    echo=True,            # 쿼리 로그 출력 (개발용, 운영에서는 False 추천)
+    poolclass=InstrumentedQueuePool,
     connect_args=connect_args,
+    **pool_options,
 )
+pool_metrics.register("sync", engine.pool)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -99,4 +115,44 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# -------------------------
+# SQLAlchemy Async Engine
+# - async def 라우트에서 DB 대기 시간 동안 이벤트 루프가 막히지 않도록 aiomysql 드라이버 사용
+# - ASYNC_DATABASE_URL 이 없으면 DATABASE_URL 의 드라이버만 교체해서 사용
+# -------------------------
+
+def get_async_database_url():
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+
+    return make_url(settings.DATABASE_URL).set(drivername="mysql+aiomysql")
+
+async_connect_args = {
+    "init_command": "SET time_zone = '+09:00'",
+    "connect_timeout": 10,
+}
+
+if ssl_context:
+    async_connect_args["ssl"] = ssl_context
+
+async_engine = create_async_engine(
+    get_async_database_url(),
+    poolclass=InstrumentedAsyncQueuePool,
+    connect_args=async_connect_args,
+    **pool_options,
+)
+pool_metrics.register("async", async_engine.sync_engine.pool)
+
+# commit 이후에도 ORM 객체 속성에 접근할 수 있도록 expire_on_commit=False (async 에서는 lazy load 불가)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""
+DB 커넥션 풀 계측
+- QueuePool 의 checkout(_do_get) 시간을 측정하여 풀 대기 시간/히스토그램을 수집
+- 엔진별 풀 상태(size, checked_out, overflow)를 스냅샷으로 제공
+- /admin/system/db-pool 에서 조회
+"""
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+# checkout 대기시간 히스토그램 버킷 (ms, 상한 포함)
+CHECKOUT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class PoolMetrics:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pools = {}
+        self._stats = {}
+
+    def _empty_stats(self):
+        return {
+            "checkout_count": 0,
+            "checkout_timeouts": 0,
+            "wait_total_ms": 0.0,
+            "wait_max_ms": 0.0,
+            "histogram": [0] * (len(CHECKOUT_BUCKETS_MS) + 1),
+        }
+
+    def register(self, name: str, pool):
+        with self._lock:
+            self._pools[name] = pool
+            self._stats.setdefault(name, self._empty_stats())
+
+    def observe_checkout(self, name: str, elapsed: float, timed_out: bool = False):
+        elapsed_ms = elapsed * 1000
+
+        with self._lock:
+            stats = self._stats.setdefault(name, self._empty_stats())
+
+            if timed_out:
+                stats["checkout_timeouts"] += 1
+                return
+
+            stats["checkout_count"] += 1
+            stats["wait_total_ms"] += elapsed_ms
+            stats["wait_max_ms"] = max(stats["wait_max_ms"], elapsed_ms)
+
+            bucket = len(CHECKOUT_BUCKETS_MS)
+            for idx, upper in enumerate(CHECKOUT_BUCKETS_MS):
+                if elapsed_ms <= upper:
+                    bucket = idx
+                    break
+            stats["histogram"][bucket] += 1
+
+    def reset(self):
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = self._empty_stats()
+
+    def snapshot(self) -> dict:
+        result = {}
+
+        with self._lock:
+            for name, pool in self._pools.items():
+                stats = self._stats.get(name, self._empty_stats())
+                count = stats["checkout_count"]
+
+                histogram = {
+                    f"le_{upper}ms": stats["histogram"][idx]
+                    for idx, upper in enumerate(CHECKOUT_BUCKETS_MS)
+                }
+                histogram["inf"] = stats["histogram"][-1]
+
+                result[name] = {
+                    "pool_size": pool.size(),
+                    "checked_in": pool.checkedin(),
+                    "checked_out": pool.checkedout(),
+                    "overflow": pool.overflow(),
+                    "checkout_count": count,
+                    "checkout_timeouts": stats["checkout_timeouts"],
+                    "wait_avg_ms": round(stats["wait_total_ms"] / count, 3) if count else 0,
+                    "wait_max_ms": round(stats["wait_max_ms"], 3),
+                    "wait_histogram": histogram,
+                }
+
+        return result
+
+
+pool_metrics = PoolMetrics()
+
+
+class _InstrumentedPoolMixin:
+    metrics_name = "default"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.observe_checkout(self.metrics_name, time.perf_counter() - started, timed_out=True)
+            raise
+
+        pool_metrics.observe_checkout(self.metrics_name, time.perf_counter() - started)
+        return conn
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    metrics_name = "sync"
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    metrics_name = "async"
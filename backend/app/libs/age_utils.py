@@ -1,16 +1,12 @@
 from datetime import date, datetime
 
-def format_child_age(birth_date: str) -> str:
-    """
-    생년월일을 받아 '아이 나이: 0세 (1개월)' 형태로 반환
+# 개월 수 구간 (상한 미포함) - 이유식 단계 / 영양 기준이 바뀌는 시점
+AGE_BUCKET_MONTHS = (4, 6, 9, 12, 18, 24, 36, 48, 60, 72)
 
-    Args:
-        birth_date (str): YYYY-MM-DD
-
-    Returns:
-        str
+def get_child_age_months(birth_date) -> int:
+    """
+    생년월일 (YYYY-MM-DD 또는 date) -> 만 개월 수 (0 이상)
     """
-
     if isinstance(birth_date, str):
         birth = datetime.strptime(birth_date, "%Y-%m-%d").date()
     elif isinstance(birth_date, date):
@@ -26,10 +22,35 @@ def format_child_age(birth_date: str) -> str:
     if today.day < birth.day:
         months -= 1
 
-    if months < 0:
-        months = 0
+    return max(months, 0)
+
+def get_age_bucket(birth_date) -> str:
+    """
+    생년월일 -> 나이 구간 (예: "6-9m", "72m+")
+    """
+    months = get_child_age_months(birth_date)
+
+    lower = 0
+    for upper in AGE_BUCKET_MONTHS:
+        if months < upper:
+            return f"{lower}-{upper}m"
+        lower = upper
+
+    return f"{lower}m+"
+
+def format_child_age(birth_date: str) -> str:
+    """
+    생년월일을 받아 '아이 나이: 0세 (1개월)' 형태로 반환
+
+    Args:
+        birth_date (str): YYYY-MM-DD
+
+    Returns:
+        str
+    """
+    months = get_child_age_months(birth_date)
 
     years = months // 12
     remain_months = months % 12
 
-    return f"아이 나이: {years}세 ({remain_months}개월)"
\ No newline at end of file
+    return f"아이 나이: {years}세 ({remain_months}개월)"
@@ -0,0 +1,202 @@
+"""
+첨부 이미지 응답
+- 사이즈 변환 파일({base}_{size}.webp)은 파일명이 업로드마다 고유하고 내용이 바뀌지 않으므로 immutable 캐시
+- 강한 ETag (inode-크기-mtime) + If-None-Match 304
+- 단일 Range 요청 (206 / 416), If-Range
+- 서버가 zerocopysend 확장을 지원하면 sendfile, ATTACHES_ACCEL_REDIRECT 설정 시 nginx 에 전송 위임
+- stat 결과는 짧게 캐시 (존재하지 않는 파일은 캐시하지 않음 - 변환 완료 즉시 반영)
+  캐시 이후 삭제된 파일(purge / blob 정리)은 응답 시 열기 실패로 확인 -> 캐시에서 지우고 404
+"""
+import mimetypes
+import os
+import re
+import stat
+from email.utils import formatdate
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import anyio
+from fastapi.responses import Response
+
+from app.core.config import settings
+from app.libs.cache_utils import TTLCache
+from app.libs.file_utils import IMAGE_SIZES
+
+CHUNK_SIZE = 64 * 1024
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+DEFAULT_CACHE_CONTROL = "public, max-age=3600"
+
+_VARIANT_PATTERN = re.compile(r"_(%s)\.webp$" % "|".join(IMAGE_SIZES.keys()))
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+stat_cache = TTLCache(ttl=settings.ATTACHES_STAT_CACHE_TTL, maxsize=10000)
+
+
+@lru_cache(maxsize=64)
+def guess_media_type(ext: str) -> str:
+    if ext == ".webp":
+        return "image/webp"
+    media_type, _ = mimetypes.guess_type("file" + ext)
+    return media_type or "application/octet-stream"
+
+
+def get_stat(full_path: str) -> Optional[os.stat_result]:
+    stat_result = stat_cache.get(full_path)
+    if stat_result is not None:
+        return stat_result
+
+    try:
+        stat_result = os.stat(full_path)
+    except OSError:
+        return None
+
+    if not stat.S_ISREG(stat_result.st_mode):
+        return None
+
+    stat_cache.set(full_path, stat_result)
+    return stat_result
+
+
+def make_etag(stat_result: os.stat_result) -> str:
+    return f'"{stat_result.st_ino:x}-{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    # 비교 시 약한 ETag(W/) 도 동일하게 취급
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
+def parse_range(range_header: Optional[str], file_size: int) -> Optional[Tuple[int, int]]:
+    """
+    단일 바이트 범위 파싱 -> (start, end) (end 포함)
+    - Range 없음 / 형식 오류 / 다중 범위: None (전체 응답)
+    - 만족할 수 없는 범위: ValueError
+    """
+    if not range_header:
+        return None
+
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match:
+        return None
+
+    start, end = match.groups()
+    if not start and not end:
+        return None
+
+    if not start:
+        # 마지막 N 바이트
+        length = int(end)
+        if length == 0:
+            raise ValueError("unsatisfiable range")
+        return max(file_size - length, 0), file_size - 1
+
+    start = int(start)
+    end = int(end) if end else file_size - 1
+    if start >= file_size or start > end:
+        raise ValueError("unsatisfiable range")
+
+    return start, min(end, file_size - 1)
+
+
+class FileRangeResponse(Response):
+    """
+    파일의 일부(offset, count)를 전송 (zerocopysend 지원 서버면 sendfile)
+    - 헤더 전송 전에 파일을 열어, 그 사이 삭제된 파일은 404 로 응답
+    """
+
+    def __init__(self, path: str, offset: int, count: int, status_code: int, headers: dict, media_type: str):
+        super().__init__(status_code=status_code, headers=headers, media_type=media_type)
+        self.path = path
+        self.offset = offset
+        self.count = count
+        self.headers["content-length"] = str(count)
+
+    async def __call__(self, scope, receive, send):
+        try:
+            f = await anyio.to_thread.run_sync(open, self.path, "rb")
+        except FileNotFoundError:
+            # stat 캐시 이후 삭제된 파일 - 캐시에서 지워 다음 요청부터 바로 404
+            stat_cache.invalidate(self.path)
+            await Response(status_code=404)(scope, receive, send)
+            return
+
+        async with anyio.wrap_file(f) as af:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+
+            if scope["method"].upper() == "HEAD":
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+                return
+
+            if "http.response.zerocopysend" in scope.get("extensions", {}):
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": f.fileno(),
+                    "offset": self.offset,
+                    "count": self.count,
+                    "more_body": False,
+                })
+                return
+
+            await af.seek(self.offset)
+            remaining = self.count
+            while remaining > 0:
+                chunk = await af.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+
+        if remaining > 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def file_response(request, full_path: str, stat_result: os.stat_result, cache_control: Optional[str] = None) -> Response:
+    """
+    ETag / 304 / Range 를 처리한 파일 응답
+    """
+    media_type = guess_media_type(os.path.splitext(full_path)[1].lower())
+    etag = make_etag(stat_result)
+
+    if cache_control is None:
+        cache_control = IMMUTABLE_CACHE_CONTROL if _VARIANT_PATTERN.search(full_path) else DEFAULT_CACHE_CONTROL
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": cache_control,
+        "Accept-Ranges": "bytes",
+    }
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    file_size = stat_result.st_size
+    byte_range = None
+
+    # If-Range 가 현재 ETag 와 다르면 전체 응답
+    if_range = request.headers.get("if-range")
+    if not if_range or if_range.strip() == etag:
+        try:
+            byte_range = parse_range(request.headers.get("range"), file_size)
+        except ValueError:
+            headers["Content-Range"] = f"bytes */{file_size}"
+            return Response(status_code=416, headers=headers)
+
+    if settings.ATTACHES_ACCEL_REDIRECT:
+        # nginx internal location 으로 전송 위임 (Range / sendfile 은 nginx 가 처리)
+        relative_path = os.path.relpath(full_path, "attaches").replace(os.sep, "/")
+        headers["X-Accel-Redirect"] = settings.ATTACHES_ACCEL_REDIRECT.rstrip("/") + "/" + relative_path
+        return Response(status_code=200, headers=headers, media_type=media_type)
+
+    if byte_range is not None:
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+        return FileRangeResponse(full_path, start, end - start + 1, status_code=206, headers=headers, media_type=media_type)
+
+    headers["Last-Modified"] = formatdate(stat_result.st_mtime, usegmt=True)
+    return FileRangeResponse(full_path, 0, file_size, status_code=200, headers=headers, media_type=media_type)
@@ -0,0 +1,78 @@
+"""
+프로세스 내 TTL 캐시
+- 워커 프로세스마다 독립적으로 유지 (다른 워커의 무효화는 TTL 만료로 반영)
+- thread-safe (sync 라우트는 threadpool 에서 실행됨)
+"""
+import threading
+import time
+from collections import OrderedDict
+
+class TTLCache:
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._items = OrderedDict()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return default
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                self._items.pop(key, None)
+                return default
+
+            return value
+
+    def _store(self, key, value, ttl: float = None):
+        # lock 을 잡은 상태에서 호출
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+
+        if key in self._items:
+            self._items.move_to_end(key)
+        elif len(self._items) >= self.maxsize:
+            # 가장 오래 전에 저장된 항목부터 제거
+            self._items.popitem(last=False)
+
+        self._items[key] = (expires_at, value)
+
+    def set(self, key, value, ttl: float = None):
+        with self._lock:
+            self._store(key, value, ttl)
+
+    def add(self, key, value=True, ttl: float = None) -> bool:
+        """
+        유효한 항목이 없을 때만 저장 (저장했으면 True)
+        - 중복 방지 윈도우 용도
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None and item[0] > time.monotonic():
+                return False
+
+            self._store(key, value, ttl)
+            return True
+
+    def get_or_set(self, key, loader, ttl: float = None):
+        """
+        캐시에 없으면 loader() 결과를 저장 후 반환
+        - loader 는 lock 밖에서 실행 (동시 miss 시 중복 로드는 허용)
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        value = loader()
+        self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._items.clear()
+            else:
+                self._items.pop(key, None)
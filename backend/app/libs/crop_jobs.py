@@ -0,0 +1,186 @@
+"""
+이미지 crop 작업 풀
+- 디코딩 / crop / JPEG 인코딩을 프로세스 풀에서 실행 (이벤트 루프 블로킹 방지)
+- 워커 프로세스(uvicorn)별 동시 실행 수 제한 (CROP_CONCURRENCY), 대기열이 CROP_MAX_QUEUE 를 넘으면 즉시 거절
+- 대기 / 처리 시간 계측 - /admin/system/crop-pool 에서 조회
+- 업로드 변환(image_jobs)과 풀을 분리해 업로드가 몰려도 crop 응답이 밀리지 않도록 함
+"""
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from app.core.config import settings
+from app.libs.file_utils import crop_image_file
+
+# 대기 / 처리 시간 히스토그램 버킷 (ms, 상한 포함)
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class CropQueueFull(Exception):
+    pass
+
+
+class CropMetrics:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.in_flight = 0
+            self.waiting = 0
+            self.waiting_max = 0
+            self.completed = 0
+            self.failed = 0
+            self.rejected = 0
+            self.wait_total_ms = 0.0
+            self.run_total_ms = 0.0
+            self.run_max_ms = 0.0
+            self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def enter_queue(self):
+        with self._lock:
+            self.waiting += 1
+            self.waiting_max = max(self.waiting_max, self.waiting)
+
+    def start(self, wait_ms: float):
+        with self._lock:
+            self.waiting -= 1
+            self.in_flight += 1
+            self.wait_total_ms += wait_ms
+
+    def leave_queue(self):
+        # 대기 중 취소 (클라이언트 연결 종료 등)
+        with self._lock:
+            self.waiting -= 1
+
+    def reject(self):
+        with self._lock:
+            self.rejected += 1
+
+    def finish(self, run_ms: float, failed: bool = False):
+        with self._lock:
+            self.in_flight -= 1
+            if failed:
+                self.failed += 1
+                return
+
+            self.completed += 1
+            self.run_total_ms += run_ms
+            self.run_max_ms = max(self.run_max_ms, run_ms)
+
+            bucket = len(LATENCY_BUCKETS_MS)
+            for idx, upper in enumerate(LATENCY_BUCKETS_MS):
+                if run_ms <= upper:
+                    bucket = idx
+                    break
+            self.histogram[bucket] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            started = self.completed + self.failed + self.in_flight
+            histogram = {f"le_{upper}ms": self.histogram[idx] for idx, upper in enumerate(LATENCY_BUCKETS_MS)}
+            histogram["inf"] = self.histogram[-1]
+
+            return {
+                "workers": settings.CROP_WORKERS,
+                "concurrency": settings.CROP_CONCURRENCY,
+                "max_queue": settings.CROP_MAX_QUEUE,
+                "in_flight": self.in_flight,
+                "waiting": self.waiting,
+                "waiting_max": self.waiting_max,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "wait_avg_ms": round(self.wait_total_ms / started, 3) if started else 0,
+                "run_avg_ms": round(self.run_total_ms / self.completed, 3) if self.completed else 0,
+                "run_max_ms": round(self.run_max_ms, 3),
+                "run_histogram": histogram,
+            }
+
+
+crop_metrics = CropMetrics()
+
+_executor = None
+_executor_lock = threading.Lock()
+_semaphore = None
+
+
+def _init_worker(max_pixels: int):
+    # crop 전용 프로세스에서만 PIL 해상도 상한 변경 (스레드풀 사용 시 다른 이미지 처리에 영향 없도록)
+    from PIL import Image
+
+    Image.MAX_IMAGE_PIXELS = max_pixels
+
+
+def _get_executor():
+    global _executor
+
+    with _executor_lock:
+        if _executor is None and settings.CROP_WORKERS > 0:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.CROP_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(settings.IMAGE_MAX_PIXELS,),
+            )
+        return _executor
+
+
+def _get_semaphore():
+    # 이벤트 루프 안에서 생성
+    global _semaphore
+
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(max(1, settings.CROP_CONCURRENCY))
+    return _semaphore
+
+
+async def crop(source_path: str, dest_path: str, origin_x: int, origin_y: int, width: int, height: int, quality: int = 80) -> dict:
+    """
+    crop 실행 (CROP_WORKERS=0 이면 스레드풀)
+
+    Raises:
+        CropQueueFull: 대기열 초과
+    """
+    if crop_metrics.waiting >= settings.CROP_MAX_QUEUE:
+        crop_metrics.reject()
+        raise CropQueueFull("이미지 처리 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+
+    crop_metrics.enter_queue()
+    queued_at = time.perf_counter()
+
+    try:
+        await _get_semaphore().acquire()
+    except BaseException:
+        crop_metrics.leave_queue()
+        raise
+
+    started = time.perf_counter()
+    crop_metrics.start((started - queued_at) * 1000)
+
+    failed = True
+    try:
+        result = await asyncio.get_running_loop().run_in_executor(
+            _get_executor(), crop_image_file,
+            source_path, dest_path, origin_x, origin_y, width, height, quality,
+            settings.CROP_MAX_OUTPUT, settings.IMAGE_MAX_PIXELS,
+            settings.CROP_DRAFT_AREA_RATIO, settings.CROP_DRAFT_MIN_SIDE,
+        )
+        failed = False
+        return result
+    finally:
+        crop_metrics.finish((time.perf_counter() - started) * 1000, failed=failed)
+        _get_semaphore().release()
+
+
+def shutdown():
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
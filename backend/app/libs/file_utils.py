@@ -6,12 +6,18 @@ from typing import Tuple, Optional, List, Dict
 from PIL import Image
 import io
 
+from app.core.config import settings
+
 # 업로드 가능한 이미지 확장자
 ALLOWED_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
 
 # 최대 파일 크기 (5MB)
 MAX_FILE_SIZE = 5 * 1024 * 1024
 
+# 업로드 스트리밍 읽기 단위 / 메모리 보관 한도 (초과분은 임시 파일)
+UPLOAD_CHUNK_SIZE = 64 * 1024
+UPLOAD_SPOOL_MAX_MEMORY = 1024 * 1024
+
 # 이미지 리사이즈 설정 (width 기준)
 IMAGE_SIZES = {
     'original': None,      # 원본 크기 유지
@@ -21,6 +27,45 @@ IMAGE_SIZES = {
     'thumbnail': 150,      # 썸네일
 }
 
+# WebP 품질
+WEBP_QUALITY = 85
+
+# 원본 업로드 파일 접미사 (사이즈 변환 완료 전까지 보관)
+SOURCE_SUFFIX = "_source"
+
+# 내용 주소 저장소 (sha256 기준 경로, attaches_files.content_hash 로 참조 수 관리)
+BLOB_DIR = os.path.join("attaches", "blobs")
+
+def parse_webp_methods(value: str) -> Dict[str, int]:
+    """
+    사이즈별 WebP 인코더 method(0=빠름 ~ 6=느림/고압축) 설정 파싱
+    ex) "original:4,large:4,medium:4,small:3,thumbnail:2"
+    """
+    methods = {size_name: 4 for size_name in IMAGE_SIZES}
+    for item in (value or "").split(","):
+        if ":" not in item:
+            continue
+        size_name, method = item.split(":", 1)
+        size_name = size_name.strip()
+        if size_name in methods and method.strip().isdigit():
+            methods[size_name] = max(0, min(6, int(method)))
+    return methods
+
+WEBP_METHODS = parse_webp_methods(settings.IMAGE_WEBP_METHODS)
+
+def parse_eager_sizes(value: str) -> Dict[str, Optional[int]]:
+    """
+    업로드 시 바로 만드는 사이즈 (나머지는 요청 시 image_variants 에서 생성)
+    - original 은 요청 시 변환의 원본이므로 항상 포함
+    """
+    names = {item.strip() for item in (value or "").split(",")} | {'original'}
+    return {size_name: width for size_name, width in IMAGE_SIZES.items() if size_name in names}
+
+EAGER_SIZES = parse_eager_sizes(settings.IMAGE_EAGER_SIZES)
+
+# 요청 시 변환 출력 형식
+VARIANT_FORMATS = {'webp': 'WEBP', 'jpeg': 'JPEG'}
+
 def get_file_extension(filename: str) -> str:
     """파일 확장자 추출"""
     return os.path.splitext(filename)[1].lower()
@@ -30,6 +75,107 @@ def is_allowed_image(filename: str) -> bool:
     ext = get_file_extension(filename)
     return ext in ALLOWED_IMAGE_EXTENSIONS
 
+def sniff_image_format(header: bytes) -> Optional[str]:
+    """파일 앞부분 시그니처로 이미지 형식 판별 (확장자 / Content-Type 은 신뢰하지 않음)"""
+    if header.startswith(b'\xff\xd8\xff'):
+        return 'JPEG'
+    if header.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'PNG'
+    if header[:6] in (b'GIF87a', b'GIF89a'):
+        return 'GIF'
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'WEBP'
+    return None
+
+async def read_upload_limited(file: UploadFile, max_size: int = MAX_FILE_SIZE):
+    """
+    업로드 파일을 청크 단위로 읽어 임시 파일(SpooledTemporaryFile)에 보관
+    - max_size 를 넘는 순간 중단 (전체를 메모리에 올리지 않음)
+    - 읽으면서 sha256 계산
+
+    Returns:
+        (임시 파일 (위치 0), 크기, sha256)
+
+    Raises:
+        ValueError: 크기 초과 / 빈 파일
+    """
+    import hashlib
+    import tempfile
+
+    spool = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_MEMORY)
+    digest = hashlib.sha256()
+    total = 0
+
+    try:
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            total += len(chunk)
+            if total > max_size:
+                raise ValueError(f"파일 크기가 너무 큽니다. (최대 {max_size // (1024 * 1024)}MB)")
+
+            digest.update(chunk)
+            spool.write(chunk)
+
+        if total == 0:
+            raise ValueError("빈 파일입니다.")
+    except Exception:
+        spool.close()
+        raise
+
+    spool.seek(0)
+    return spool, total, digest.hexdigest()
+
+def probe_image(stream, max_pixels: int = None) -> Tuple[str, int, int]:
+    """
+    헤더만 읽어 이미지 형식 / 크기 확인 (픽셀 디코딩 없음)
+    - 시그니처와 실제 형식이 다르거나, 픽셀 수가 max_pixels 를 넘으면 ValueError
+
+    Returns:
+        (형식, width, height)
+    """
+    max_pixels = settings.IMAGE_MAX_PIXELS if max_pixels is None else max_pixels
+
+    stream.seek(0)
+    header_format = sniff_image_format(stream.read(16))
+    if header_format is None:
+        raise ValueError("지원하지 않는 파일 형식입니다. (jpg, jpeg, png, gif, webp만 가능)")
+
+    stream.seek(0)
+    try:
+        with Image.open(stream) as probe:
+            image_format = probe.format
+            width, height = probe.size
+    except Exception:
+        raise ValueError("이미지 파일을 읽을 수 없습니다.")
+    finally:
+        stream.seek(0)
+
+    if image_format != header_format or width <= 0 or height <= 0:
+        raise ValueError("이미지 파일을 읽을 수 없습니다.")
+
+    if width * height > max_pixels:
+        raise ValueError("이미지 해상도가 너무 큽니다.")
+
+    return image_format, width, height
+
+def write_stream_atomic(stream, file_path: str):
+    """스트림을 임시 파일에 복사한 뒤 rename (부분 파일 노출 방지)"""
+    import shutil
+
+    temp_path = f"{file_path}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        stream.seek(0)
+        with open(temp_path, 'wb') as f:
+            shutil.copyfileobj(stream, f, UPLOAD_CHUNK_SIZE)
+        os.replace(temp_path, file_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
 def generate_unique_filename(original_filename: str) -> str:
     """고유한 파일명 생성 (UUID + 타임스탬프)"""
     ext = get_file_extension(original_filename)
@@ -53,21 +199,22 @@ async def save_upload_file(file: UploadFile, save_dir: str) -> Tuple[bool, str,
         if not is_allowed_image(file.filename):
             return False, "지원하지 않는 파일 형식입니다. (jpg, jpeg, png, gif, webp만 가능)", None
 
-        # 파일 크기 검증
-        file_content = await file.read()
-        if len(file_content) > MAX_FILE_SIZE:
-            return False, "파일 크기가 너무 큽니다. (최대 5MB)", None
+        # 파일 크기 검증 (청크 단위로 읽으며 제한)
+        try:
+            spool, _, _ = await read_upload_limited(file)
+        except ValueError as e:
+            return False, str(e), None
 
-        # 저장 디렉토리 생성
-        os.makedirs(save_dir, exist_ok=True)
+        with spool:
+            # 저장 디렉토리 생성
+            os.makedirs(save_dir, exist_ok=True)
 
-        # 고유한 파일명 생성
-        new_filename = generate_unique_filename(file.filename)
-        file_path = os.path.join(save_dir, new_filename)
+            # 고유한 파일명 생성
+            new_filename = generate_unique_filename(file.filename)
+            file_path = os.path.join(save_dir, new_filename)
 
-        # 파일 저장
-        with open(file_path, 'wb') as f:
-            f.write(file_content)
+            # 파일 저장
+            write_stream_atomic(spool, file_path)
 
         return True, file_path, file.filename
 
@@ -118,62 +265,105 @@ def get_file_url(file_path: str, base_url: str = "", remove_size_suffix: bool =
 
     return result_path
 
-def resize_and_convert_to_webp(image_content: bytes, base_filename: str, save_dir: str) -> Tuple[bool, List[Dict[str, str]], str]:
+def variant_dimensions(original_width: int, original_height: int, target_width: Optional[int]) -> Tuple[int, int]:
+    """
+    사이즈별 결과 크기 (비율 유지, 원본보다 크게 만들지 않음)
+    """
+    if target_width is None or target_width >= original_width:
+        return original_width, original_height
+    return target_width, int(original_height * (target_width / original_width))
+
+def _flatten_to_rgb(img: Image.Image) -> Image.Image:
+    """
+    투명 배경은 흰색으로 채워 RGB 로 변환
+    """
+    if img.mode in ('RGBA', 'LA', 'P'):
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+        return background
+    if img.mode != 'RGB':
+        return img.convert('RGB')
+    return img
+
+def resize_and_convert_to_webp(image_content: bytes, base_filename: str, save_dir: str, sizes: Optional[Dict[str, Optional[int]]] = None) -> Tuple[bool, List[Dict[str, str]], str, Dict[str, float]]:
     """
     이미지를 여러 사이즈로 리사이징하고 WebP 형식으로 변환
+    - 한 번만 디코딩 (JPEG 은 원본 크기 재인코딩이 없으면 축소 사이즈 중 최대 크기에 맞춰 draft() 로 축소 디코딩)
+    - 큰 사이즈부터 만들고, 다음 사이즈는 직전 결과에서 축소 (전체 해상도에서 매번 LANCZOS 하지 않음)
+    - 입력이 이미 WebP(RGB)이면 original 은 재인코딩 없이 그대로 저장
 
     Args:
         image_content: 이미지 바이트 데이터
         base_filename: 기본 파일명 (확장자 없이)
         save_dir: 저장할 디렉토리
+        sizes: 생성할 사이즈 {이름: width} (기본값 IMAGE_SIZES)
 
     Returns:
-        (성공여부, 생성된 파일 정보 리스트, 에러 메시지)
+        (성공여부, 생성된 파일 정보 리스트, 에러 메시지, 단계별 소요시간(ms))
     """
+    import time
+
+    sizes = IMAGE_SIZES if sizes is None else sizes
+    timings = {}
+
+    def _elapsed(started):
+        return round((time.perf_counter() - started) * 1000, 2)
+
     try:
-        # 이미지 열기
+        started = time.perf_counter()
         img = Image.open(io.BytesIO(image_content))
+        source_format = img.format
+        original_width, original_height = img.size
+
+        targets = {
+            size_name: variant_dimensions(original_width, original_height, target_width)
+            for size_name, target_width in sizes.items()
+        }
+
+        # JPEG: 필요한 최대 크기 이상으로만 축소 디코딩 (1/2, 1/4, 1/8 배율)
+        # - 원본 크기를 다시 인코딩해야 하면 전체 해상도가 필요하므로 축소하지 않음
+        resized = [wh for wh in targets.values() if wh[0] < original_width]
+        needs_full = len(resized) < len(targets)
+        if source_format == 'JPEG' and resized and not needs_full:
+            img.draft('RGB', max(resized, key=lambda wh: wh[0]))
+
+        img.load()
+        timings['decode'] = _elapsed(started)
 
-        # RGBA로 변환 (투명도 지원)
-        if img.mode in ('RGBA', 'LA', 'P'):
-            # 투명 배경을 흰색으로 변환
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-            img = background
-        elif img.mode != 'RGB':
-            img = img.convert('RGB')
+        started = time.perf_counter()
+        has_alpha = img.mode in ('RGBA', 'LA', 'P')
+        img = _flatten_to_rgb(img)
+        timings['convert'] = _elapsed(started)
 
         # 저장 디렉토리 생성
         os.makedirs(save_dir, exist_ok=True)
 
         created_files = []
-        original_width, original_height = img.size
-
-        # 각 사이즈별로 이미지 생성
-        for size_name, target_width in IMAGE_SIZES.items():
-            if target_width is None:
-                # original 사이즈는 원본 크기 유지
-                resized_img = img
-                width, height = original_width, original_height
-            elif target_width >= original_width:
-                # 타깃 크기가 원본보다 크면 원본 크기 사용
-                resized_img = img
-                width, height = original_width, original_height
-            else:
-                # 비율 유지하며 리사이징
-                ratio = target_width / original_width
-                new_height = int(original_height * ratio)
-                resized_img = img.resize((target_width, new_height), Image.Resampling.LANCZOS)
-                width, height = target_width, new_height
+        previous = img
 
-            # WebP 파일명 생성
+        # 큰 사이즈부터 순서대로 (직전 결과에서 축소)
+        for size_name, (width, height) in sorted(targets.items(), key=lambda item: item[1][0], reverse=True):
             filename = f"{base_filename}_{size_name}.webp"
             file_path = os.path.join(save_dir, filename)
 
-            # WebP로 저장 (품질 85)
-            resized_img.save(file_path, 'WEBP', quality=85, method=6)
+            if (width, height) == (original_width, original_height) and source_format == 'WEBP' and not has_alpha:
+                # 이미 WebP 인 원본 크기는 그대로 저장
+                started = time.perf_counter()
+                with open(file_path, 'wb') as f:
+                    f.write(image_content)
+                timings[f'{size_name}_copy'] = _elapsed(started)
+            else:
+                started = time.perf_counter()
+                if previous.size != (width, height):
+                    previous = previous.resize((width, height), Image.Resampling.LANCZOS)
+                timings[f'{size_name}_resize'] = _elapsed(started)
+
+                # WebP로 저장 (사이즈별 인코더 method)
+                started = time.perf_counter()
+                previous.save(file_path, 'WEBP', quality=WEBP_QUALITY, method=WEBP_METHODS.get(size_name, 4))
+                timings[f'{size_name}_encode'] = _elapsed(started)
 
             created_files.append({
                 'size': size_name,
@@ -183,42 +373,248 @@ def resize_and_convert_to_webp(image_content: bytes, base_filename: str, save_di
                 'filename': filename
             })
 
-        return True, created_files, ""
+        # 호출부에서는 IMAGE_SIZES 순서를 기대
+        order = list(sizes.keys())
+        created_files.sort(key=lambda f: order.index(f['size']))
+
+        return True, created_files, "", timings
 
     except Exception as e:
-        return False, [], f"이미지 변환 중 오류가 발생했습니다: {str(e)}"
+        return False, [], f"이미지 변환 중 오류가 발생했습니다: {str(e)}", timings
+
+def get_blob_dir(content_hash: str) -> str:
+    """내용 해시 저장 디렉토리 (attaches/blobs/ab/cd)"""
+    return os.path.join(BLOB_DIR, content_hash[:2], content_hash[2:4])
+
+def has_all_variants(base_filename: str, save_dir: str) -> bool:
+    """업로드 시 만드는 사이즈(EAGER_SIZES) WebP 가 모두 생성되어 있는지"""
+    return all(
+        os.path.exists(os.path.join(save_dir, f"{base_filename}_{size_name}.webp"))
+        for size_name in EAGER_SIZES
+    )
+
+def split_variant_path(full_path: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    사이즈 파일 경로 -> (기본 경로, 사이즈명)
+    ex) attaches/blobs/ab/cd/abcd_medium.webp -> ('attaches/blobs/ab/cd/abcd', 'medium')
+    """
+    if not full_path.lower().endswith(".webp"):
+        return None, None
+
+    base, _, size_name = full_path[:-len(".webp")].rpartition("_")
+    if not base or size_name not in IMAGE_SIZES:
+        return None, None
+    return base, size_name
+
+def render_image_variant(master_path: str, width: Optional[int], fmt: str, dest_path: str) -> Dict:
+    """
+    원본(_original.webp)에서 요청한 width / 형식 하나를 생성 (이미지 변환 워커에서 실행)
+    - 임시 파일에 쓴 뒤 rename (다른 요청이 만들다 만 파일을 읽지 않도록)
+    """
+    img = Image.open(master_path)
+    target_width, target_height = variant_dimensions(img.width, img.height, width)
+
+    if img.format == 'JPEG' and target_width < img.width:
+        img.draft('RGB', (target_width, target_height))
+
+    img = _flatten_to_rgb(img)
+    if img.size != (target_width, target_height):
+        img = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
 
-async def save_upload_file_with_resize(file: UploadFile, save_dir: str) -> Tuple[bool, str, Optional[str], List[Dict]]:
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    temp_path = f"{dest_path}.{uuid.uuid4().hex[:8]}.tmp"
+    if fmt == 'jpeg':
+        img.save(temp_path, 'JPEG', quality=WEBP_QUALITY, optimize=True)
+    else:
+        img.save(temp_path, 'WEBP', quality=WEBP_QUALITY, method=4)
+    os.replace(temp_path, dest_path)
+
+    return {'width': target_width, 'height': target_height, 'size': os.path.getsize(dest_path)}
+
+def crop_image_file(source_path: str, dest_path: str, origin_x: int, origin_y: int, width: int, height: int, quality: int = 80, max_output: int = 0, max_pixels: int = None, draft_area_ratio: float = None, draft_min_side: int = None) -> Dict:
+    """
+    업로드 원본에서 영역을 잘라 JPEG 로 저장 (crop 워커에서 실행, 처리 후 원본 삭제)
+    - 좌표는 EXIF 방향 적용 후 기준 (React Native Image.getSize()와 동일)
+    - 잘라낼 영역이 원본 면적의 draft_area_ratio 이하이면 JPEG 을 축소 디코딩(draft) - 결과 긴 변은 draft_min_side 이상 유지
+    - max_output 이 있으면 결과 긴 변을 그 이하로 제한 (기본 제한 없음)
+    - max_pixels 를 넘는 이미지는 디코딩하지 않음 (decompression bomb 방지, Image.MAX_IMAGE_PIXELS 전역값은 변경하지 않음)
+    """
+    from PIL import ImageOps
+    import math
+    import time
+
+    max_pixels = settings.IMAGE_MAX_PIXELS if max_pixels is None else max_pixels
+    draft_area_ratio = settings.CROP_DRAFT_AREA_RATIO if draft_area_ratio is None else draft_area_ratio
+    draft_min_side = settings.CROP_DRAFT_MIN_SIDE if draft_min_side is None else draft_min_side
+    timings = {}
+
+    try:
+        started = time.perf_counter()
+        img = Image.open(source_path)
+        raw_w, raw_h = img.size
+        if raw_w * raw_h > max_pixels:
+            raise ValueError("이미지 해상도가 너무 큽니다.")
+
+        # 결과에 필요한 만큼만 디코딩 (배율은 가로/세로 동일하므로 EXIF 회전과 무관)
+        crop_side = max(width, height)
+        scale = 1.0
+        if max_output and crop_side > max_output:
+            scale = max_output / crop_side
+        if draft_area_ratio > 0 and draft_min_side and crop_side > draft_min_side and width * height <= raw_w * raw_h * draft_area_ratio:
+            # 원본에 비해 작은 영역 - 전체를 원본 해상도로 디코딩하지 않음
+            scale = min(scale, draft_min_side / crop_side)
+        if img.format == 'JPEG' and scale < 1.0:
+            img.draft('RGB', (math.ceil(raw_w * scale), math.ceil(raw_h * scale)))
+
+        img.load()
+        decoded_scale = img.width / raw_w
+        timings['decode'] = round((time.perf_counter() - started) * 1000, 2)
+
+        started = time.perf_counter()
+        # EXIF 방향 적용 - React Native Image.getSize()와 동일한 기준으로 맞춤
+        img = ImageOps.exif_transpose(img)
+
+        # 디코딩 배율에 맞춰 좌표 변환
+        origin_x = int(origin_x * decoded_scale)
+        origin_y = int(origin_y * decoded_scale)
+        width = max(1, int(width * decoded_scale))
+        height = max(1, int(height * decoded_scale))
+
+        img_w, img_h = img.size
+        # clamp to image bounds
+        origin_x = max(0, min(origin_x, img_w - 1))
+        origin_y = max(0, min(origin_y, img_h - 1))
+        width = max(1, min(width, img_w - origin_x))
+        height = max(1, min(height, img_h - origin_y))
+
+        cropped = img.crop((origin_x, origin_y, origin_x + width, origin_y + height))
+
+        if max_output and max(cropped.size) > max_output:
+            cropped.thumbnail((max_output, max_output), Image.Resampling.LANCZOS)
+
+        if cropped.mode in ("RGBA", "P"):
+            cropped = cropped.convert("RGB")
+        timings['crop'] = round((time.perf_counter() - started) * 1000, 2)
+
+        started = time.perf_counter()
+        temp_path = f"{dest_path}.{uuid.uuid4().hex[:8]}.tmp"
+        cropped.save(temp_path, "JPEG", quality=quality)
+        os.replace(temp_path, dest_path)
+        timings['encode'] = round((time.perf_counter() - started) * 1000, 2)
+
+        return {'width': cropped.width, 'height': cropped.height, 'timings': timings}
+    finally:
+        if os.path.exists(source_path):
+            os.remove(source_path)
+
+def predict_variant_sizes(base_filename: str, save_dir: str, original_width: int, original_height: int) -> List[Dict]:
+    """
+    변환 전 사이즈별 파일 정보 (resize_and_convert_to_webp 와 동일한 규칙으로 크기 계산)
+    """
+    variants = []
+    for size_name, target_width in IMAGE_SIZES.items():
+        width, height = variant_dimensions(original_width, original_height, target_width)
+
+        filename = f"{base_filename}_{size_name}.webp"
+        variants.append({
+            'size': size_name,
+            'width': width,
+            'height': height,
+            'path': os.path.join(save_dir, filename),
+            'filename': filename,
+            'pending': True,
+        })
+    return variants
+
+def generate_image_variants(source_path: str, base_filename: str, save_dir: str) -> Dict:
+    """
+    보관된 원본 파일로 업로드 시 사이즈(EAGER_SIZES) WebP 생성 후 원본 삭제 (이미지 변환 워커에서 실행)
+    - 반환값: {"files": 생성된 파일 목록, "timings": 단계별 소요시간(ms)}
+    """
+    if not os.path.exists(source_path) and has_all_variants(base_filename, save_dir):
+        # 같은 내용이 동시에 업로드되어 다른 작업이 먼저 변환한 경우
+        return {"files": [], "timings": {}}
+
+    with open(source_path, 'rb') as f:
+        image_content = f.read()
+
+    success, created_files, error_msg, timings = resize_and_convert_to_webp(image_content, base_filename, save_dir, sizes=EAGER_SIZES)
+    if not success:
+        raise RuntimeError(error_msg)
+
+    os.remove(source_path)
+    return {"files": created_files, "timings": timings}
+
+async def save_upload_file_with_resize(file: UploadFile, save_dir: str, content_addressed: bool = False) -> Tuple[bool, str, Optional[str], List[Dict]]:
     """
     업로드된 파일을 여러 사이즈로 리사이징하여 WebP로 저장
+    - 원본만 즉시 저장하고 사이즈별 변환은 이미지 변환 워커(image_jobs)에서 처리
+    - 반환되는 파일 목록은 예상 크기 정보이며 'pending' 이 True
+    - content_addressed: 내용 해시 경로(attaches/blobs)에 저장, 같은 내용이 이미 있으면 파일을 다시 만들지 않음
+      (파일 정보에 'content_hash' 포함)
 
     Args:
         file: FastAPI UploadFile 객체
-        save_dir: 저장할 디렉토리 경로
+        save_dir: 저장할 디렉토리 경로 (content_addressed 이면 무시)
+        content_addressed: 내용 주소 저장 여부
 
     Returns:
         (성공여부, 대표 파일 경로 or 에러 메시지, 원본 파일명, 생성된 파일 목록)
     """
+    from app.libs import image_jobs
+
     try:
         # 파일 확장자 검증
         if not is_allowed_image(file.filename):
             return False, "지원하지 않는 파일 형식입니다. (jpg, jpeg, png, gif, webp만 가능)", None, []
 
-        # 파일 크기 검증
-        file_content = await file.read()
-        if len(file_content) > MAX_FILE_SIZE:
-            return False, "파일 크기가 너무 큽니다. (최대 5MB)", None, []
-
-        # 고유한 기본 파일명 생성 (확장자 없이)
-        timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-        unique_id = str(uuid.uuid4())[:8]
-        base_filename = f"{timestamp}_{unique_id}"
-
-        # 이미지 리사이징 및 WebP 변환
-        success, created_files, error_msg = resize_and_convert_to_webp(file_content, base_filename, save_dir)
-
-        if not success:
-            return False, error_msg, None, []
+        # 파일 크기 검증 (청크 단위로 읽으며 제한) 후 헤더만 읽어 이미지 여부 / 크기 확인 (전체 디코딩은 워커에서)
+        try:
+            spool, _, file_hash = await read_upload_limited(file)
+        except ValueError as e:
+            return False, str(e), None, []
+
+        with spool:
+            try:
+                _, original_width, original_height = probe_image(spool)
+            except ValueError as e:
+                return False, str(e), None, []
+
+            content_hash = None
+            if content_addressed:
+                # 같은 내용은 같은 경로
+                content_hash = file_hash
+                base_filename = content_hash
+                save_dir = get_blob_dir(content_hash)
+            else:
+                # 고유한 기본 파일명 생성 (확장자 없이)
+                timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
+                unique_id = str(uuid.uuid4())[:8]
+                base_filename = f"{timestamp}_{unique_id}"
+
+            created_files = predict_variant_sizes(base_filename, save_dir, original_width, original_height)
+            image_url = "/" + os.path.join(save_dir, base_filename).replace('\\', '/')
+
+            if content_hash and has_all_variants(base_filename, save_dir):
+                # 이미 저장된 내용 - 파일 생성 없이 참조만 추가
+                done = True
+            elif content_hash and not image_jobs.claim(image_url):
+                # 같은 내용이 변환 대기 중 (다른 요청이 이미 등록)
+                done = image_jobs.is_ready(image_url)
+            else:
+                # 원본 즉시 저장 (임시 파일 -> rename 으로 부분 파일 노출 방지)
+                os.makedirs(save_dir, exist_ok=True)
+                source_path = os.path.join(save_dir, f"{base_filename}{SOURCE_SUFFIX}{get_file_extension(file.filename)}")
+                write_stream_atomic(spool, source_path)
+
+                # 사이즈별 변환은 백그라운드 처리 (완료 시 attaches_files 상태 갱신)
+                done = image_jobs.submit_variants(source_path, base_filename, save_dir, image_url)
+
+        for created in created_files:
+            created['content_hash'] = content_hash
+            if done:
+                # 워커 미사용(IMAGE_WORKERS=0) 또는 이미 변환된 내용
+                created['pending'] = False
 
         # 대표 이미지는 medium 사이즈 (없으면 처음 생성된 파일)
         main_file = next((f for f in created_files if f['size'] == 'medium'), created_files[0])
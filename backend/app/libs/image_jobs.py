@@ -0,0 +1,185 @@
+"""
+업로드 이미지 변환 작업 큐
+- 사이즈별 WebP 변환을 프로세스 풀에서 실행 (요청 / 이벤트 루프와 분리)
+- 완료 시 attaches_files.status 를 R(완료)로, 실패 시 F 로 변경
+- 완료 시점에 attaches_files 행이 아직 없을 수 있으므로 완료 목록을 보관하고,
+  행 생성 시(save_upload_file) is_ready() 로 한 번 더 확인
+- 선점(claim)은 변환이 끝나면(성공 / 실패) 해제, 완료 목록은 파일이 실제로 있을 때만 신뢰
+  (공유 파일이 삭제된 뒤 같은 내용이 다시 올라오면 새로 변환)
+- 처리 수 / 단계별 소요시간은 image_job_metrics 에 집계 (/admin/system/image-jobs)
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from app.core.config import settings
+from app.libs.cache_utils import TTLCache
+from app.libs.file_utils import generate_image_variants, has_all_variants
+
+STATUS_PENDING = "P"
+STATUS_READY = "R"
+STATUS_FAILED = "F"
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# 변환 완료된 image_url (행 생성보다 변환이 먼저 끝난 경우 대비)
+ready_images = TTLCache(ttl=3600, maxsize=10000)
+
+# 변환 중인 내용 주소 image_url (같은 내용 동시 업로드 시 한 번만 변환)
+claimed_images = TTLCache(ttl=3600, maxsize=10000)
+
+
+def _get_executor():
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.IMAGE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _set_status(image_url: str, status: str):
+    from app.core.database import SessionLocal
+    from app.repository.attaches_files_repository import AttachesFilesRepository
+
+    db = SessionLocal()
+    try:
+        AttachesFilesRepository.update_status_by_image_url(db, image_url, status)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️ 이미지 상태 변경 실패 ({image_url}): {str(e)}")
+    finally:
+        db.close()
+
+
+class ImageJobMetrics:
+    """
+    업로드 변환 처리 수 / 단계별(decode, convert, 사이즈별 resize·encode) 소요시간 집계
+    - /admin/system/image-jobs 에서 조회
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+        self.stages = {}
+
+    def record(self, timings: dict):
+        with self._lock:
+            self.completed += 1
+            for stage, elapsed_ms in (timings or {}).items():
+                stat = self.stages.setdefault(stage, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+                stat["count"] += 1
+                stat["total_ms"] += elapsed_ms
+                stat["max_ms"] = max(stat["max_ms"], elapsed_ms)
+
+    def fail(self):
+        with self._lock:
+            self.failed += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "completed": self.completed,
+                "failed": self.failed,
+                "stages": {
+                    stage: {
+                        "count": stat["count"],
+                        "avg_ms": round(stat["total_ms"] / stat["count"], 2),
+                        "max_ms": round(stat["max_ms"], 2),
+                    }
+                    for stage, stat in sorted(self.stages.items())
+                },
+            }
+
+
+image_job_metrics = ImageJobMetrics()
+
+
+def _on_done(image_url: str, future):
+    error = future.exception()
+    if error is not None:
+        print(f"⚠️ 이미지 변환 실패 ({image_url}): {str(error)}")
+        image_job_metrics.fail()
+        claimed_images.invalidate(image_url)
+        _set_status(image_url, STATUS_FAILED)
+        return
+
+    image_job_metrics.record(future.result().get("timings"))
+
+    # 완료 표시를 먼저 남긴 뒤 선점 해제 / DB 갱신
+    ready_images.set(image_url, True)
+    claimed_images.invalidate(image_url)
+    _set_status(image_url, STATUS_READY)
+
+
+def submit_variants(source_path: str, base_filename: str, save_dir: str, image_url: str) -> bool:
+    """
+    사이즈별 변환 작업 등록
+    - 반환값: 즉시 완료 여부 (IMAGE_WORKERS=0 이면 현재 프로세스에서 동기 처리)
+    """
+    # 이전 변환의 완료 표시는 새 작업이 끝날 때까지 무효
+    ready_images.invalidate(image_url)
+
+    if settings.IMAGE_WORKERS <= 0:
+        try:
+            result = generate_image_variants(source_path, base_filename, save_dir)
+        except Exception:
+            image_job_metrics.fail()
+            raise
+        finally:
+            claimed_images.invalidate(image_url)
+        image_job_metrics.record(result.get("timings"))
+        ready_images.set(image_url, True)
+        return True
+
+    future = _get_executor().submit(generate_image_variants, source_path, base_filename, save_dir)
+    future.add_done_callback(lambda f: _on_done(image_url, f))
+    return False
+
+
+async def run(fn, *args):
+    """
+    이미지 작업 하나를 워커에서 실행하고 결과 대기 (IMAGE_WORKERS=0 이면 스레드풀)
+    """
+    import asyncio
+
+    executor = _get_executor() if settings.IMAGE_WORKERS > 0 else None
+    return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+
+
+def claim(image_url: str) -> bool:
+    """
+    같은 image_url 변환 작업 선점 (이미 등록되어 있으면 False)
+    """
+    return claimed_images.add(image_url)
+
+
+def is_ready(image_url: str) -> bool:
+    """
+    변환 완료 여부 (완료 표시가 있어도 파일이 지워졌으면 False)
+    """
+    if not ready_images.get(image_url):
+        return False
+
+    save_dir, base_filename = os.path.split(image_url.lstrip("/"))
+    if has_all_variants(base_filename, save_dir):
+        return True
+
+    ready_images.invalidate(image_url)
+    return False
+
+
+def shutdown():
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
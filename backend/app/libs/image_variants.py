@@ -0,0 +1,156 @@
+"""
+요청 시 이미지 사이즈 변환 + 디스크 캐시
+- 업로드 시에는 EAGER_SIZES 만 만들고, 나머지 사이즈 / 임의 width 는 처음 요청될 때 _original.webp 에서 생성
+- 캐시 위치: IMAGE_VARIANT_CACHE_DIR/{attaches 기준 경로}_w{width}.{format}
+- 용량 제한 (IMAGE_VARIANT_CACHE_MAX_MB): 초과 시 mtime 이 오래된 파일부터 삭제 (조회 시 mtime 갱신 = LRU)
+- 같은 변환의 동시 요청은 워커 프로세스 내에서 하나의 작업으로 합침
+"""
+import asyncio
+import os
+from glob import escape, glob
+import threading
+import time
+from typing import Dict, Optional
+
+import anyio
+
+from app.core.config import settings
+from app.libs import image_jobs
+from app.libs.file_utils import IMAGE_SIZES, VARIANT_FORMATS, render_image_variant
+
+# 허용 width (캐시 키 폭주 방지) - 설정에 추가하면 기존 이미지도 별도 작업 없이 바로 사용 가능
+VARIANT_WIDTHS = sorted(
+    {int(width) for width in settings.IMAGE_VARIANT_WIDTHS.split(",") if width.strip().isdigit()}
+    | {width for width in IMAGE_SIZES.values() if width}
+)
+
+# 조회 시 mtime 갱신 최소 간격 (초) - 매 요청 utime 방지
+TOUCH_INTERVAL = 300
+
+# 용량 초과 시 이 비율까지 줄임
+EVICT_TARGET_RATIO = 0.9
+
+
+class VariantDiskCache:
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total = None
+
+    def base_for(self, base_path: str) -> str:
+        """이미지 기본 경로 -> 캐시 파일 기본 경로 (접미사 없이)"""
+        return os.path.join(self.root, os.path.relpath(base_path, "attaches"))
+
+    def path_for(self, base_path: str, width: Optional[int], fmt: str) -> str:
+        suffix = f"_w{width}" if width else "_original"
+        return f"{self.base_for(base_path)}{suffix}.{fmt}"
+
+    def touch(self, path: str):
+        try:
+            if time.time() - os.stat(path).st_mtime > TOUCH_INTERVAL:
+                os.utime(path)
+        except OSError:
+            pass
+
+    def _scan(self):
+        entries = []
+        for dir_path, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                path = os.path.join(dir_path, filename)
+                try:
+                    stat_result = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat_result.st_mtime, stat_result.st_size, path))
+        return entries
+
+    def added(self, nbytes: int) -> int:
+        """
+        새 캐시 파일 크기 반영, 용량 초과면 오래된 파일 삭제 (삭제한 파일 수 반환)
+        - 합계는 워커 프로세스별 추정치, 초과 시 디렉토리를 다시 스캔해 정확한 값으로 보정
+        """
+        with self._lock:
+            if self._total is None:
+                self._total = sum(size for _, size, _ in self._scan())
+            else:
+                self._total += nbytes
+
+            if self._total <= self.max_bytes:
+                return 0
+
+            entries = sorted(self._scan())
+            total = sum(size for _, size, _ in entries)
+            target = self.max_bytes * EVICT_TARGET_RATIO
+
+            removed = 0
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                    removed += 1
+                except OSError:
+                    continue
+
+            self._total = total
+            return removed
+
+    def remove_for(self, base_path: str):
+        """
+        원본 삭제 시 해당 이미지의 캐시 파일 삭제
+        """
+        for path in glob(escape(self.base_for(base_path)) + "_*"):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+
+
+variant_cache = VariantDiskCache(
+    root=settings.IMAGE_VARIANT_CACHE_DIR,
+    max_bytes=settings.IMAGE_VARIANT_CACHE_MAX_MB * 1024 * 1024,
+)
+
+# 진행 중인 변환 (캐시 경로 -> Future)
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+def get_master_path(base_path: str) -> Optional[str]:
+    master_path = f"{base_path}_original.webp"
+    return master_path if os.path.exists(master_path) else None
+
+
+async def _render(master_path: str, width: Optional[int], fmt: str, cache_path: str):
+    result = await image_jobs.run(render_image_variant, master_path, width, fmt, cache_path)
+    await anyio.to_thread.run_sync(variant_cache.added, result['size'])
+
+
+async def get_variant(base_path: str, width: Optional[int], fmt: str = "webp") -> Optional[str]:
+    """
+    변환 파일 경로 반환 (없으면 생성), 원본이 없으면 None
+    - base_path: attaches 상대 경로 기준 이미지 경로 (확장자 / 사이즈 접미사 없이)
+    """
+    if fmt not in VARIANT_FORMATS:
+        raise ValueError("지원하지 않는 이미지 형식입니다.")
+
+    cache_path = variant_cache.path_for(base_path, width, fmt)
+    if os.path.exists(cache_path):
+        variant_cache.touch(cache_path)
+        return cache_path
+
+    master_path = get_master_path(base_path)
+    if master_path is None:
+        return None
+
+    task = _inflight.get(cache_path)
+    if task is None:
+        task = asyncio.ensure_future(_render(master_path, width, fmt, cache_path))
+        _inflight[cache_path] = task
+        task.add_done_callback(lambda _: _inflight.pop(cache_path, None))
+
+    # 먼저 요청한 쪽이 연결을 끊어도 변환은 계속
+    await asyncio.shield(task)
+    return cache_path
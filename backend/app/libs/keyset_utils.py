@@ -0,0 +1,179 @@
+"""
+Keyset(cursor) 페이징 공통 유틸
+- 정렬 키 전체(ex. like_count, id)를 불투명(opaque) cursor 토큰으로 인코딩
+- cursor 토큰에서 정렬 방향에 맞는 seek 조건 (k1 < v1) OR (k1 = v1 AND k2 < v2) ... 를 생성
+- 기존 클라이언트가 보내던 숫자 cursor(마지막 행 id)는 해당 행의 정렬 키를 조회하여 동일하게 처리
+
+사용 예)
+    paginator = KeysetPaginator([
+        KeysetKey.for_column(Feeds.like_count, "desc"),
+        KeysetKey.for_column(Feeds.id, "desc"),
+    ])
+    query = paginator.apply(session, query, params.get("cursor"))
+    next_cursor = paginator.encode(rows[-1]) if rows else None
+"""
+import base64
+import json
+from datetime import date, datetime
+
+from sqlalchemy import and_, or_
+
+class KeysetKey:
+    """
+    정렬 키 1개
+    - name: 결과 row 에서 값을 꺼낼 속성명 (select 컬럼 label 과 동일해야 함)
+    - column: 정렬/비교에 사용할 컬럼 또는 표현식
+    - direction: "asc" | "desc"
+    - nullable: NULL 이 올 수 있는 컬럼 여부 (MySQL 은 NULL 을 가장 작은 값으로 정렬)
+    """
+
+    def __init__(self, name: str, column, direction: str = "desc", nullable: bool = False):
+        self.name = name
+        self.column = column
+        self.direction = "asc" if direction == "asc" else "desc"
+        self.nullable = nullable
+
+    @classmethod
+    def for_column(cls, column, direction: str = "desc"):
+        """
+        ORM 컬럼 속성으로 생성 (name / nullable 은 컬럼 정의에서 가져옴)
+        """
+        return cls(column.key, column, direction, nullable=column.property.columns[0].nullable)
+
+    def order_by(self):
+        return self.column.asc() if self.direction == "asc" else self.column.desc()
+
+    def equal(self, value):
+        if value is None:
+            return self.column.is_(None)
+        return self.column == value
+
+    def after(self, value):
+        """
+        정렬 순서상 value 다음에 오는 행 조건 (없으면 None)
+        """
+        if self.direction == "desc":
+            if value is None:
+                return None
+            if self.nullable:
+                return or_(self.column < value, self.column.is_(None))
+            return self.column < value
+
+        if value is None:
+            return self.column.isnot(None)
+        return self.column > value
+
+def _dump_value(value):
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$d": value.isoformat()}
+    return value
+
+def _load_value(value):
+    if isinstance(value, dict):
+        if "$dt" in value:
+            return datetime.fromisoformat(value["$dt"])
+        if "$d" in value:
+            return date.fromisoformat(value["$d"])
+    return value
+
+class KeysetPaginator:
+
+    def __init__(self, keys: list, id_column=None):
+        """
+        keys: KeysetKey 리스트 (마지막 키는 유일해야 함 - 보통 pk)
+        id_column: 숫자 cursor(레거시) 를 해석할 pk 컬럼 (기본값: 마지막 키)
+        """
+        self.keys = keys
+        self.id_column = id_column if id_column is not None else keys[-1].column
+
+    def signature(self) -> str:
+        return ",".join(f"{key.name}:{key.direction}" for key in self.keys)
+
+    def encode(self, row) -> str:
+        """
+        결과 row 의 정렬 키 값을 cursor 토큰으로 인코딩
+        """
+        payload = {
+            "s": self.signature(),
+            "v": [_dump_value(getattr(row, key.name)) for key in self.keys],
+        }
+        raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def decode(self, token: str) -> list:
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        except Exception:
+            raise ValueError("유효하지 않은 cursor 입니다.")
+
+        if not isinstance(payload, dict) or payload.get("s") != self.signature():
+            raise ValueError("정렬 조건이 변경되어 cursor 를 사용할 수 없습니다.")
+
+        values = payload.get("v")
+        if not isinstance(values, list) or len(values) != len(self.keys):
+            raise ValueError("유효하지 않은 cursor 입니다.")
+
+        return [_load_value(value) for value in values]
+
+    def _anchor_row(self, session, row_id: int):
+        return (
+            session.query(*[key.column.label(key.name) for key in self.keys])
+            .filter(self.id_column == row_id)
+            .first()
+        )
+
+    def resolve(self, session, cursor) -> list:
+        """
+        cursor -> 정렬 키 값 리스트
+        - 숫자(레거시 id cursor): 해당 행의 정렬 키를 pk 로 조회
+        - 그 외: 토큰 디코드
+        """
+        if cursor is None or cursor == "":
+            return None
+
+        if isinstance(cursor, int) or (isinstance(cursor, str) and cursor.isdigit()):
+            anchor = self._anchor_row(session, int(cursor))
+            if not anchor:
+                raise ValueError("유효하지 않은 cursor 입니다.")
+            return [getattr(anchor, key.name) for key in self.keys]
+
+        return self.decode(cursor)
+
+    def encode_by_id(self, session, row_id: int) -> str:
+        """
+        pk 로 정렬 키 값을 조회하여 cursor 토큰 생성 (결과 row 에 정렬 키가 없는 경우)
+        """
+        anchor = self._anchor_row(session, row_id)
+        return self.encode(anchor) if anchor else None
+
+    def seek_condition(self, values: list):
+        """
+        (k1 after v1) OR (k1 = v1 AND k2 after v2) OR ...
+        """
+        branches = []
+        for idx, key in enumerate(self.keys):
+            after = key.after(values[idx])
+            if after is None:
+                continue
+
+            equals = [self.keys[j].equal(values[j]) for j in range(idx)]
+            branches.append(and_(*equals, after) if equals else after)
+
+        # 더 이상 다음 행이 없는 cursor
+        if not branches:
+            return self.id_column.is_(None)
+
+        return or_(*branches)
+
+    def apply(self, session, query, cursor=None):
+        """
+        정렬 + seek 조건 적용 (limit 은 호출부에서)
+        """
+        values = self.resolve(session, cursor)
+        if values is not None:
+            query = query.filter(self.seek_condition(values))
+
+        return query.order_by(*[key.order_by() for key in self.keys])
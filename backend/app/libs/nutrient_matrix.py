@@ -0,0 +1,107 @@
+"""
+재료 × 영양소 행렬
+- ingredients / ingredients_nutritions / nutrients 조인 결과를 한 번만 읽어 재료별 영양소 벡터로 보관
+- 영양소는 인덱스로 다루고, 재료 벡터는 값이 있는 영양소만 (인덱스, 함량) 으로 저장 (대부분 재료는 일부 영양소만 가짐)
+- 합산은 고정 길이 배열에 누적 (재료별 dict 복사 / 이름 비교 없음)
+- version: 생성 시점의 ingredients_nutritions 버전 (변경 감지용, ingredients_nutritions_services 참고)
+"""
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class NutrientMatrix:
+
+    def __init__(self, version=None):
+        self.version = version
+        self.nutrient_names: List[str] = []
+        self.nutrient_units: List[str] = []
+        self.ingredient_names: Dict[int, str] = {}
+        self._nutrient_index: Dict[str, int] = {}
+        self._vectors: Dict[int, List[Tuple[int, float]]] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable, version=None) -> "NutrientMatrix":
+        """
+        get_ingredients_join_nutrient 결과로 생성
+        - 같은 재료에 같은 영양소가 여러 번 있으면 처음 값 사용 (기존 주간 리포트와 동일)
+        """
+        matrix = cls(version)
+        seen = set()
+
+        for row in rows:
+            ingredient_id = row.ingredient_id
+            matrix.ingredient_names.setdefault(ingredient_id, row.ingredient_name)
+            vector = matrix._vectors.setdefault(ingredient_id, [])
+
+            if not row.nutrient_name or (ingredient_id, row.nutrient_name) in seen:
+                continue
+            seen.add((ingredient_id, row.nutrient_name))
+
+            index = matrix._nutrient_index.get(row.nutrient_name)
+            if index is None:
+                index = len(matrix.nutrient_names)
+                matrix._nutrient_index[row.nutrient_name] = index
+                matrix.nutrient_names.append(row.nutrient_name)
+                matrix.nutrient_units.append(row.nutrient_unit)
+
+            vector.append((index, float(row.amount) if row.amount else 0))
+
+        return matrix
+
+    def __contains__(self, ingredient_id) -> bool:
+        return ingredient_id in self._vectors
+
+    @property
+    def size(self) -> int:
+        return len(self.nutrient_names)
+
+    def zeros(self) -> array:
+        return array("d", bytes(8 * self.size))
+
+    def accumulate(self, totals: array, ingredient_id: int, count: float = 1) -> bool:
+        """
+        totals 배열에 재료 영양소 × count 누적 (없는 재료면 False)
+        """
+        vector = self._vectors.get(ingredient_id)
+        if vector is None:
+            return False
+
+        for index, amount in vector:
+            totals[index] += amount * count
+        return True
+
+    def total(self, pairs) -> array:
+        """
+        [(재료 id, 배수)] 또는 {재료 id: 배수} -> 영양소 합계 배열
+        - 배수: 횟수 또는 100g 대비 비율(score)
+        """
+        if isinstance(pairs, dict):
+            pairs = pairs.items()
+
+        totals = self.zeros()
+        for ingredient_id, count in pairs:
+            self.accumulate(totals, ingredient_id, count)
+        return totals
+
+    def ingredient_nutrients(self, ingredient_id: int, count: float = 1) -> Optional[Dict[str, Dict]]:
+        """
+        재료 한 개의 영양소 {이름: {amount, unit}} (count 배)
+        """
+        vector = self._vectors.get(ingredient_id)
+        if vector is None:
+            return None
+
+        return {
+            self.nutrient_names[index]: {"amount": amount * count, "unit": self.nutrient_units[index]}
+            for index, amount in vector
+        }
+
+    def to_named(self, totals: array, digits: int = 2) -> Dict[str, Dict]:
+        """
+        합계 배열 -> {영양소명: {amount, unit}} (0 은 제외)
+        """
+        return {
+            self.nutrient_names[index]: {"amount": round(value, digits), "unit": self.nutrient_units[index]}
+            for index, value in enumerate(totals)
+            if value
+        }
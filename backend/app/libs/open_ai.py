@@ -1,9 +1,161 @@
 """
 open ai 유틸리티 함수
+- httpx.AsyncClient 하나를 공유 (커넥션 재사용), 호출마다 타임아웃 적용
+- 408 / 429 / 5xx / 네트워크 오류(타임아웃 포함)는 OPENAI_MAX_RETRIES 회까지 backoff 후 재시도 (Retry-After 헤더 우선)
+- 워커 프로세스 내 동시 호출 수 제한 (OPENAI_CONCURRENCY)
+- 지연시간 / 토큰 사용량 계측 - /admin/system/openai 에서 조회
 """
-import requests
-from app.core.config import settings
+import asyncio
 import os
+import random
+import threading
+import time
+
+import httpx
+
+from app.core.config import settings
+
+# 응답 지연시간 히스토그램 버킷 (ms, 상한 포함)
+LATENCY_BUCKETS_MS = (1000, 2500, 5000, 10000, 20000, 40000)
+
+# 재시도 대상 상태 코드
+RETRY_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# 재시도 대기 상한 (초)
+MAX_BACKOFF_SEC = 30
+
+
+class OpenAIMetrics:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.in_flight = 0
+            self.waiting = 0
+            self.completed = 0
+            self.failed = 0
+            self.retries = 0
+            self.status_codes = {}
+            self.wait_total_ms = 0.0
+            self.latency_total_ms = 0.0
+            self.latency_max_ms = 0.0
+            self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+            self.prompt_tokens = 0
+            self.completion_tokens = 0
+            self.total_tokens = 0
+
+    def enter_queue(self):
+        with self._lock:
+            self.waiting += 1
+
+    def start(self, wait_ms: float):
+        with self._lock:
+            self.waiting -= 1
+            self.in_flight += 1
+            self.wait_total_ms += wait_ms
+
+    def leave_queue(self):
+        with self._lock:
+            self.waiting -= 1
+
+    def attempt_done(self, status_code=None):
+        with self._lock:
+            self.in_flight -= 1
+            key = str(status_code) if status_code else "error"
+            self.status_codes[key] = self.status_codes.get(key, 0) + 1
+
+    def retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def finish(self, latency_ms: float, usage: dict = None, failed: bool = False):
+        with self._lock:
+            if failed:
+                self.failed += 1
+                return
+
+            self.completed += 1
+            self.latency_total_ms += latency_ms
+            self.latency_max_ms = max(self.latency_max_ms, latency_ms)
+
+            bucket = len(LATENCY_BUCKETS_MS)
+            for idx, upper in enumerate(LATENCY_BUCKETS_MS):
+                if latency_ms <= upper:
+                    bucket = idx
+                    break
+            self.histogram[bucket] += 1
+
+            if usage:
+                self.prompt_tokens += usage.get("prompt_tokens", 0) or 0
+                self.completion_tokens += usage.get("completion_tokens", 0) or 0
+                self.total_tokens += usage.get("total_tokens", 0) or 0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            attempts = sum(self.status_codes.values())
+            histogram = {f"le_{upper}ms": self.histogram[idx] for idx, upper in enumerate(LATENCY_BUCKETS_MS)}
+            histogram["inf"] = self.histogram[-1]
+
+            return {
+                "concurrency": settings.OPENAI_CONCURRENCY,
+                "timeout_sec": settings.OPENAI_TIMEOUT,
+                "max_retries": settings.OPENAI_MAX_RETRIES,
+                "in_flight": self.in_flight,
+                "waiting": self.waiting,
+                "completed": self.completed,
+                "failed": self.failed,
+                "retries": self.retries,
+                "status_codes": dict(self.status_codes),
+                "wait_avg_ms": round(self.wait_total_ms / attempts, 3) if attempts else 0,
+                "latency_avg_ms": round(self.latency_total_ms / self.completed, 3) if self.completed else 0,
+                "latency_max_ms": round(self.latency_max_ms, 3),
+                "latency_histogram": histogram,
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "total_tokens": self.total_tokens,
+            }
+
+
+openai_metrics = OpenAIMetrics()
+
+# 이벤트 루프별로 생성 (배치는 asyncio.run 마다 새 루프)
+_client = None
+_semaphore = None
+_loop = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client, _semaphore, _loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _loop is not loop or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.OPENAI_TIMEOUT, connect=settings.OPENAI_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=max(1, settings.OPENAI_CONCURRENCY),
+                max_keepalive_connections=max(1, settings.OPENAI_CONCURRENCY),
+            ),
+        )
+        _semaphore = asyncio.Semaphore(max(1, settings.OPENAI_CONCURRENCY))
+        _loop = loop
+    return _client
+
+
+def _backoff_delay(attempt: int, response: httpx.Response = None) -> float:
+    if response is not None:
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(float(retry_after), MAX_BACKOFF_SEC)
+            except ValueError:
+                pass
+
+    delay = settings.OPENAI_BACKOFF_BASE * (2 ** attempt)
+    return min(delay + random.uniform(0, delay), MAX_BACKOFF_SEC)
+
 
 """ OpenAI API 키 가져오기 """
 def get_openai_api_key():
@@ -16,8 +168,11 @@ def get_openai_api_key():
     return api_key
 
 """ OpenAI API 호출 함수"""
-def openai_call(message_format: list, model="gpt-4o-mini"):
-
+async def openai_call(message_format: list, model="gpt-4o-mini", timeout: float = None):
+    """
+    실패 시 {"error": 메세지} 반환 (기존 응답 형식 유지)
+    - timeout: 시도 1회의 타임아웃 (초), 없으면 OPENAI_TIMEOUT
+    """
     api_key = get_openai_api_key()
     url = settings.OPENAI_CALL_URL if hasattr(settings, 'OPENAI_CALL_URL') else os.getenv('OPENAI_CALL_URL')
 
@@ -32,10 +187,67 @@ def openai_call(message_format: list, model="gpt-4o-mini"):
         "max_tokens": 2000
     }
 
-    try:
-        response = requests.post(url, headers=headers, json=data)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        print(f"OpenAI API 요청 오류: {e}")
-        return {"error": str(e)}
\ No newline at end of file
+    client = _get_client()
+    semaphore = _semaphore
+    started = time.perf_counter()
+    error = None
+
+    for attempt in range(settings.OPENAI_MAX_RETRIES + 1):
+        if attempt:
+            openai_metrics.retry()
+
+        openai_metrics.enter_queue()
+        queued_at = time.perf_counter()
+        try:
+            await semaphore.acquire()
+        except BaseException:
+            openai_metrics.leave_queue()
+            raise
+
+        openai_metrics.start((time.perf_counter() - queued_at) * 1000)
+        response = None
+        try:
+            response = await client.post(url, headers=headers, json=data, timeout=timeout or httpx.USE_CLIENT_DEFAULT)
+        except httpx.HTTPError as e:
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            openai_metrics.attempt_done(response.status_code if response is not None else None)
+            semaphore.release()
+
+        if response is not None:
+            if response.status_code < 400:
+                try:
+                    result = response.json()
+                except ValueError:
+                    # 프록시 / 게이트웨이의 HTML 응답 등 - 재시도하지 않음
+                    error = f"{response.status_code} 응답 JSON 파싱 실패: {response.text[:300]}"
+                    break
+
+                if isinstance(result, dict):
+                    openai_metrics.finish((time.perf_counter() - started) * 1000, result.get("usage"))
+                    return result
+
+                error = f"{response.status_code} 응답 형식 오류: {response.text[:300]}"
+                break
+
+            error = f"{response.status_code} {response.reason_phrase}: {response.text[:300]}"
+            if response.status_code not in RETRY_STATUS_CODES:
+                break
+
+        if attempt < settings.OPENAI_MAX_RETRIES:
+            await asyncio.sleep(_backoff_delay(attempt, response))
+
+    openai_metrics.finish((time.perf_counter() - started) * 1000, failed=True)
+    print(f"OpenAI API 요청 오류: {error}")
+    return {"error": error}
+
+
+async def aclose():
+    """
+    공유 클라이언트 종료 (앱 shutdown / 배치 종료 시)
+    """
+    global _client
+
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
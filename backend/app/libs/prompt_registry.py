@@ -0,0 +1,115 @@
+"""
+프롬프트 템플릿 레지스트리
+- PROMPT_TEMPLATES_DIR 의 템플릿을 시작 시 모두 읽어 메모리에 보관 (요청마다 파일 읽기 없음)
+- 템플릿별 content hash 제공 - AI 응답 캐시 키에 포함해 프롬프트 수정 시 이전 캐시를 쓰지 않도록 함
+- PROMPT_RELOAD_INTERVAL 초마다(조회 시점) 디렉토리 mtime / 크기를 확인해 바뀐 파일만 다시 읽음 - 워커 재시작 없이 반영
+"""
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+TEMPLATE_EXTENSIONS = (".md", ".txt")
+
+
+class PromptTemplate:
+
+    def __init__(self, name: str, content: str, mtime_ns: int, size: int):
+        self.name = name
+        self.content = content
+        self.hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        self.mtime_ns = mtime_ns
+        self.size = size
+
+
+class PromptRegistry:
+
+    def __init__(self, templates_dir: str, reload_interval: float):
+        self.templates_dir = templates_dir
+        self.reload_interval = reload_interval
+        self._templates: Dict[str, PromptTemplate] = {}
+        self._lock = threading.Lock()
+        self._checked_at = None
+        self.reloads = 0
+
+    def _resolve_dir(self) -> Path:
+        path = Path(self.templates_dir)
+
+        # 상대경로인 경우 backend 기준 절대경로 변환 (backend/prompts/)
+        if not path.is_absolute():
+            path = Path(__file__).resolve().parent.parent.parent / self.templates_dir
+        return path
+
+    def _scan(self) -> Dict[str, os.stat_result]:
+        entries = {}
+        try:
+            with os.scandir(self._resolve_dir()) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(TEMPLATE_EXTENSIONS):
+                        entries[entry.name] = entry.stat()
+        except FileNotFoundError:
+            print(f"⚠️ 프롬프트 템플릿 디렉토리가 없습니다: {self._resolve_dir()}")
+        return entries
+
+    def reload(self) -> int:
+        """
+        바뀐 템플릿만 다시 읽기, 다시 읽은(추가 / 수정) 파일 수 반환
+        """
+        with self._lock:
+            base_dir = self._resolve_dir()
+            entries = self._scan()
+            templates = {}
+            changed = 0
+
+            for name, stat in entries.items():
+                template = self._templates.get(name)
+                if template is not None and template.mtime_ns == stat.st_mtime_ns and template.size == stat.st_size:
+                    templates[name] = template
+                    continue
+
+                try:
+                    with open(base_dir / name, "r", encoding="utf-8") as file:
+                        templates[name] = PromptTemplate(name, file.read(), stat.st_mtime_ns, stat.st_size)
+                    changed += 1
+                except OSError as e:
+                    print(f"⚠️ 프롬프트 템플릿 읽기 실패 ({name}): {str(e)}")
+                    if template is not None:
+                        templates[name] = template
+
+            if changed or len(templates) != len(self._templates):
+                self._templates = templates
+                self.reloads += 1
+
+            self._checked_at = time.monotonic()
+            return changed
+
+    def _maybe_reload(self):
+        if self._checked_at is None:
+            self.reload()
+        elif self.reload_interval > 0 and time.monotonic() - self._checked_at >= self.reload_interval:
+            self.reload()
+
+    def get(self, name: str) -> Optional[PromptTemplate]:
+        self._maybe_reload()
+        return self._templates.get(name)
+
+    def snapshot(self) -> dict:
+        return {
+            "templates_dir": str(self._resolve_dir()),
+            "reload_interval": self.reload_interval,
+            "reloads": self.reloads,
+            "templates": {
+                name: {"hash": template.hash, "size": template.size, "mtime_ns": template.mtime_ns}
+                for name, template in sorted(self._templates.items())
+            },
+        }
+
+
+prompt_registry = PromptRegistry(
+    templates_dir=settings.PROMPT_TEMPLATES_DIR,
+    reload_interval=settings.PROMPT_RELOAD_INTERVAL,
+)
@@ -0,0 +1,105 @@
+"""
+푸시 알림 일괄 전송
+- 토큰을 FCM multicast 단위(최대 500개)로 묶어 스레드풀에서 동시에 전송 (FCM_PUSH_WORKERS)
+- 입력 토큰은 iterable 로 받아 순서대로 묶음 - 전체 목록을 메모리에 올리지 않아도 됨
+- 진행 중인 묶음 수를 워커 수의 2배로 제한 (입력이 커도 대기 Future 가 쌓이지 않음)
+- 무효 토큰(앱 삭제 / 만료) 목록과 처리량 / 실패 통계 반환 - 토큰 정리는 호출부에서 일괄 처리
+- send_batch 를 바꿔 끼우면 실제 FCM 없이 동작 확인 가능
+"""
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Optional
+
+
+class PushDispatcher:
+
+    def __init__(self, send_batch: Optional[Callable] = None, batch_size: int = 500, workers: int = 4):
+        """
+        send_batch(tokens, title, body, data) -> {"success", "failure", "invalid_tokens"}
+        """
+        if send_batch is None:
+            from app.libs.utils.fcm import send_fcm_multicast
+            send_batch = send_fcm_multicast
+
+        self.send_batch = send_batch
+        self.batch_size = max(1, batch_size)
+        self.workers = max(1, workers)
+
+    def _batches(self, tokens: Iterable[str]):
+        # 중복 제거는 묶음 안에서만 (전체 토큰 집합을 들고 있지 않도록)
+        seen = set()
+        batch = []
+        for token in tokens:
+            if not token or token in seen:
+                continue
+            seen.add(token)
+            batch.append(token)
+
+            if len(batch) >= self.batch_size:
+                yield batch
+                seen = set()
+                batch = []
+
+        if batch:
+            yield batch
+
+    def _send(self, batch: list, title: str, body: str, data: dict) -> dict:
+        started = time.perf_counter()
+        try:
+            result = self.send_batch(batch, title, body, data)
+            result["error"] = None
+        except Exception as e:
+            # 묶음 전체 실패 (인증 / 네트워크 등) - 토큰은 무효 처리하지 않음
+            result = {"success": 0, "failure": len(batch), "invalid_tokens": [], "error": str(e)}
+        result["elapsed_ms"] = (time.perf_counter() - started) * 1000
+        return result
+
+    def dispatch(self, tokens: Iterable[str], title: str, body: str, data: dict = None) -> dict:
+        """
+        전송 후 통계 반환
+
+        Returns:
+            tokens / success / failure / invalid_tokens / batches / failed_batches / errors / elapsed_sec / per_sec / batch_max_ms
+        """
+        started = time.perf_counter()
+        stats = {
+            "tokens": 0,
+            "success": 0,
+            "failure": 0,
+            "invalid_tokens": [],
+            "batches": 0,
+            "failed_batches": 0,
+            "errors": [],
+            "batch_max_ms": 0.0,
+        }
+
+        def collect(future):
+            result = future.result()
+            stats["success"] += result["success"]
+            stats["failure"] += result["failure"]
+            stats["invalid_tokens"].extend(result["invalid_tokens"])
+            stats["batch_max_ms"] = max(stats["batch_max_ms"], round(result["elapsed_ms"], 3))
+            if result["error"]:
+                stats["failed_batches"] += 1
+                if len(stats["errors"]) < 10:
+                    stats["errors"].append(result["error"])
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = set()
+            for batch in self._batches(tokens):
+                stats["tokens"] += len(batch)
+                stats["batches"] += 1
+                pending.add(executor.submit(self._send, batch, title, body, data))
+
+                if len(pending) >= self.workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future)
+
+            for future in pending:
+                collect(future)
+
+        elapsed = time.perf_counter() - started
+        stats["elapsed_sec"] = round(elapsed, 3)
+        stats["per_sec"] = round(stats["tokens"] / elapsed, 1) if elapsed > 0 else 0
+        return stats
@@ -0,0 +1,27 @@
+"""
+asyncio 요청 간격 제한
+- 분당 rate_per_minute 회를 넘지 않도록 호출 시점을 균등하게 분산
+- 0 이하이면 제한 없음
+"""
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+
+    def __init__(self, rate_per_minute: float):
+        self.interval = 60.0 / rate_per_minute if rate_per_minute > 0 else 0
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+
+        if delay > 0:
+            await asyncio.sleep(delay)
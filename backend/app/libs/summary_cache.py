@@ -0,0 +1,100 @@
+"""
+AI 식단 요약 캐시 (영양 입력 기준)
+- 키: 나이 구간 / 성별 / 식단 단계 / 카테고리 / 재료 id + 양(score, SUMMARY_CACHE_SCORE_STEP 단위로 반올림) / 프롬프트 hash
+- 사용자 / 날짜 / 자녀 / 식단 내용 텍스트가 달라도 영양 입력이 같으면 같은 분석 결과 재사용
+- 결과의 아이 이름은 저장 시 CHILD_NAME_TOKEN 으로 바꾸고, 조회 시 요청한 아이 이름으로 되돌림
+- 워커 프로세스별 TTLCache, 적중률은 /admin/system/summary-cache 에서 조회
+"""
+import hashlib
+import json
+import threading
+
+from app.core.config import settings
+from app.libs.cache_utils import TTLCache
+
+CHILD_NAME_TOKEN = "{{child_name}}"
+
+
+def _replace_text(value, old: str, new: str):
+    if isinstance(value, str):
+        return value.replace(old, new)
+    if isinstance(value, dict):
+        return {key: _replace_text(item, old, new) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_replace_text(item, old, new) for item in value]
+    return value
+
+
+def quantize_score(score, step: float = None) -> float:
+    step = step or settings.SUMMARY_CACHE_SCORE_STEP
+    return round(round(float(score or 0) / step) * step, 4)
+
+
+def make_summary_cache_key(age_bucket: str, gender: str, meal_stage, meal_stage_detail, category_code, ingredients: list, prompt_hash: str) -> str:
+    """
+    ingredients: [{"ingredient_id", "score"}] - 순서 / 중복과 무관하게 같은 키 (같은 재료는 양 합산)
+    """
+    amounts = {}
+    for ingredient in ingredients:
+        ingredient_id = int(ingredient.get("ingredient_id"))
+        amounts[ingredient_id] = amounts.get(ingredient_id, 0) + float(ingredient.get("score") or 0)
+
+    payload = json.dumps([
+        age_bucket,
+        gender,
+        meal_stage,
+        meal_stage_detail,
+        category_code,
+        [[ingredient_id, quantize_score(score)] for ingredient_id, score in sorted(amounts.items())],
+        prompt_hash,
+    ], ensure_ascii=False)
+
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+
+    def __init__(self, ttl: float, maxsize: int):
+        self._cache = TTLCache(ttl=ttl, maxsize=maxsize)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def get(self, key: str, child_name: str = None):
+        value = self._cache.get(key)
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return _replace_text(value, CHILD_NAME_TOKEN, child_name or "아이")
+
+    def set(self, key: str, value: dict, child_name: str = None):
+        if child_name:
+            value = _replace_text(value, child_name, CHILD_NAME_TOKEN)
+
+        self._cache.set(key, value)
+        with self._lock:
+            self.stores += 1
+
+    def invalidate(self):
+        self._cache.invalidate()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "ttl": self._cache.ttl,
+                "maxsize": self._cache.maxsize,
+                "size": len(self._cache._items),
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0,
+            }
+
+
+summary_cache = SummaryCache(ttl=settings.SUMMARY_CACHE_TTL, maxsize=settings.SUMMARY_CACHE_MAX_ITEMS)
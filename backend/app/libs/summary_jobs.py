@@ -0,0 +1,152 @@
+"""
+AI 요약 작업 실행기
+- 요약 요청은 작업으로 등록하고 바로 job_id 반환, 실제 AI 호출 / 저장은 요청과 별개의 asyncio 작업에서 실행
+  (요청의 DB 세션 / 커넥션을 AI 응답 대기 동안 잡고 있지 않음)
+- job_id 는 입력으로 정해지는 값 (식단 요약: view_hash, 피드 요약: 피드 id + 재료 해시) - 같은 작업이 진행 중이면 새로 만들지 않고 합침
+- 완료 / 실패 결과는 SUMMARY_JOB_RESULT_TTL 초 동안 보관 (폴링 / long-polling 용)
+- 워커 프로세스별 동시 실행 수 제한 (SUMMARY_JOB_CONCURRENCY)
+- 작업 목록은 워커 프로세스별 - 다른 워커의 작업은 조회 API 에서 DB 저장 결과로 확인
+- owner_id: 작업을 등록한 회원 (조회 API 의 소유자 확인용, 회원과 무관한 공유 결과는 None)
+"""
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.libs.cache_utils import TTLCache
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+class SummaryJob:
+
+    def __init__(self, job_id: str, kind: str, owner_id: int = None):
+        self.job_id = job_id
+        self.kind = kind
+        self.owner_id = owner_id
+        self.status = STATUS_PENDING
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self.done = asyncio.Event()
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class SummaryJobRunner:
+
+    def __init__(self, result_ttl: float, concurrency: int):
+        self.concurrency = max(1, concurrency)
+        self._active: Dict[str, SummaryJob] = {}
+        self._finished = TTLCache(ttl=result_ttl, maxsize=10000)
+        self._tasks = set()
+        self._semaphore = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.deduplicated = 0
+        self.completed = 0
+        self.failed = 0
+
+    def _get_semaphore(self):
+        # 이벤트 루프 안에서 생성
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    def get(self, job_id: str) -> Optional[SummaryJob]:
+        return self._active.get(job_id) or self._finished.get(job_id)
+
+    def submit(self, job_id: str, kind: str, run: Callable[[], Awaitable], owner_id: int = None) -> SummaryJob:
+        """
+        작업 등록 (같은 job_id 가 진행 중이거나 성공 결과가 남아 있으면 그 작업 반환)
+        - run: 결과를 반환하는 코루틴 함수, 예외 시 실패 처리 (메세지는 error 로 전달)
+        """
+        job = self.get(job_id)
+        if job is not None and job.status != STATUS_FAILED:
+            with self._lock:
+                self.deduplicated += 1
+            return job
+
+        job = SummaryJob(job_id, kind, owner_id)
+        self._active[job_id] = job
+        with self._lock:
+            self.submitted += 1
+
+        task = asyncio.get_running_loop().create_task(self._run(job, run))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def _run(self, job: SummaryJob, run: Callable[[], Awaitable]):
+        try:
+            async with self._get_semaphore():
+                job.status = STATUS_RUNNING
+                job.result = await run()
+                job.status = STATUS_DONE
+                with self._lock:
+                    self.completed += 1
+        except Exception as e:
+            job.status = STATUS_FAILED
+            job.error = str(e)
+            with self._lock:
+                self.failed += 1
+            print(f"⚠️ 요약 작업 실패 ({job.job_id}): {str(e)}")
+        finally:
+            job.finished_at = time.time()
+            self._finished.set(job.job_id, job)
+            self._active.pop(job.job_id, None)
+            job.done.set()
+
+    async def wait(self, job: SummaryJob, timeout: float = None) -> SummaryJob:
+        """
+        완료될 때까지 대기 (timeout 초 경과 시 현재 상태 그대로 반환)
+        """
+        if timeout is not None and timeout <= 0:
+            return job
+
+        try:
+            await asyncio.wait_for(asyncio.shield(job.done.wait()), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return job
+
+    async def shutdown(self, timeout: float = 10):
+        """
+        앱 종료 시 진행 중인 작업 완료 대기 (timeout 초 후 취소)
+        """
+        if not self._tasks:
+            return
+
+        _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        for task in pending:
+            task.cancel()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "concurrency": self.concurrency,
+                "active": len(self._active),
+                "running": sum(1 for job in list(self._active.values()) if job.status == STATUS_RUNNING),
+                "submitted": self.submitted,
+                "deduplicated": self.deduplicated,
+                "completed": self.completed,
+                "failed": self.failed,
+            }
+
+
+summary_jobs = SummaryJobRunner(
+    result_ttl=settings.SUMMARY_JOB_RESULT_TTL,
+    concurrency=settings.SUMMARY_JOB_CONCURRENCY,
+)
@@ -1,12 +1,22 @@
 # app/libs/utils/fcm.py
 
 import os
+import threading
 import firebase_admin
 from firebase_admin import credentials, messaging
 
+_init_lock = threading.Lock()
+
 
 def init_firebase():
-    if not firebase_admin._apps:
+    # PushDispatcher 워커 스레드에서 동시에 호출됨 - 한 스레드만 초기화
+    if firebase_admin._apps:
+        return
+
+    with _init_lock:
+        if firebase_admin._apps:
+            return
+
         cred = credentials.Certificate({
             "type": "service_account",
             "project_id": os.getenv("FCM_PROJECT_ID"),
@@ -18,24 +28,78 @@ def init_firebase():
         firebase_admin.initialize_app(cred)
 
 
+# 한 번의 multicast 요청에 담을 수 있는 최대 토큰 수 (FCM 제한)
+MULTICAST_MAX_TOKENS = 500
+
+
+def _build_notification(title: str, body: str):
+    # 🔥 앱 꺼져도 보이게 하는 핵심
+    return messaging.Notification(
+        title=title,
+        body=body,
+    )
+
+
+def _build_android_config():
+    return messaging.AndroidConfig(
+        priority="high",
+        notification=messaging.AndroidNotification(
+            # channel_id 미지정 시 Firebase가 자동으로 fcm_fallback_notification_channel 사용
+            color="#FF9AA2",
+            sound="default",
+        ),
+    )
+
+
+def is_invalid_token_error(exception) -> bool:
+    """
+    더 이상 사용할 수 없는 토큰 오류 (앱 삭제 / 토큰 만료 / 다른 프로젝트 토큰)
+    """
+    if isinstance(exception, (messaging.UnregisteredError, messaging.SenderIdMismatchError)):
+        return True
+
+    # 토큰 형식 오류도 INVALID_ARGUMENT 로 옴 (메세지 내용 오류와 구분)
+    return getattr(exception, "code", None) == "INVALID_ARGUMENT" and "token" in str(exception).lower()
+
+
+def send_fcm_multicast(tokens: list, title: str, body: str, data: dict = None) -> dict:
+    """
+    같은 알림을 여러 토큰에 한 번에 전송 (최대 MULTICAST_MAX_TOKENS 개)
+
+    Returns:
+        {"success": 성공 수, "failure": 실패 수, "invalid_tokens": 삭제 대상 토큰}
+    """
+    init_firebase()
+
+    message = messaging.MulticastMessage(
+        notification=_build_notification(title, body),
+        android=_build_android_config(),
+        data=data or {},
+        tokens=tokens,
+    )
+
+    response = messaging.send_each_for_multicast(message)
+
+    invalid_tokens = [
+        token
+        for token, result in zip(tokens, response.responses)
+        if not result.success and is_invalid_token_error(result.exception)
+    ]
+
+    return {
+        "success": response.success_count,
+        "failure": response.failure_count,
+        "invalid_tokens": invalid_tokens,
+    }
+
+
 def send_fcm(token: str, title: str, body: str, data: dict = None):
     init_firebase()
 
     message = messaging.Message(
-        # 🔥 앱 꺼져도 보이게 하는 핵심
-        notification=messaging.Notification(
-            title=title,
-            body=body,
-        ),
+        notification=_build_notification(title, body),
 
-        android=messaging.AndroidConfig(
-            priority="high",
-            notification=messaging.AndroidNotification(
-                # channel_id 미지정 시 Firebase가 자동으로 fcm_fallback_notification_channel 사용
-                color="#FF9AA2",
-                sound="default",
-            ),
-        ),
+        android=_build_android_config(),
 
         data=data or {},
 
@@ -2,7 +2,13 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from app.routes import auth_router, notices_router, categories_codes_router, users_router, feeds_router, meals_router, summary_router, communities_router, attaches_router, likes_router, admin_router, ingredients_router, growths_router, advertisers_router, ads_router, image_router
-from app.middleware import JWTAuthMiddleware
+from app.middleware import JWTAuthMiddleware, UploadSizeLimitMiddleware
+from app.core.config import settings
+from app.core.ads_click_buffer import ads_click_buffer
+from app.core.counter_buffer import counter_buffer
+from app.libs import image_jobs, crop_jobs, open_ai
+from app.libs.summary_jobs import summary_jobs
+from app.libs.prompt_registry import prompt_registry
 from fastapi.exceptions import RequestValidationError
 import os
 import app.models  # noqa: F401 - 모델 관계 mapper 등록
@@ -21,6 +27,9 @@ app.add_middleware(
 # JWT 인증 미들웨어 추가
 app.add_middleware(JWTAuthMiddleware)
 
+# 업로드 요청 크기 제한 (본문 수신 전 차단)
+app.add_middleware(UploadSizeLimitMiddleware, max_bytes=settings.UPLOAD_MAX_REQUEST_MB * 1024 * 1024)
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
 
@@ -60,6 +69,29 @@ app.include_router(advertisers_router, prefix="/advertisers", tags=["advertisers
 app.include_router(ads_router, prefix="/ads", tags=["ads"])
 app.include_router(image_router, prefix="/image", tags=["image"])
 
+@app.on_event("startup")
+def start_background_flushers():
+    # 프롬프트 템플릿 미리 로드
+    prompt_registry.reload()
+
+    # 이전 워커가 남긴 광고 클릭 spool 반영 후 주기 flush 시작
+    ads_click_buffer.flush()
+    ads_click_buffer.start()
+    counter_buffer.start()
+
+@app.on_event("shutdown")
+def stop_background_flushers():
+    ads_click_buffer.stop()
+    counter_buffer.stop()
+    image_jobs.shutdown()
+    crop_jobs.shutdown()
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    # 진행 중인 요약 작업이 끝난 뒤 클라이언트 종료
+    await summary_jobs.shutdown()
+    await open_ai.aclose()
+
 @app.get("/")
 def root():
     return {"message": "Welcome to the BML Backend API"}
\ No newline at end of file
@@ -3,6 +3,7 @@ JWT 인증 미들웨어
 Authorization 헤더에서 JWT 토큰을 추출하고 검증하여 request.state에 사용자 정보 저장
 """
 from fastapi import Request
+from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from app.libs.jwt_utils import verify_token
 
@@ -58,3 +59,30 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
 
         response = await call_next(request)
         return response
+
+
+class UploadSizeLimitMiddleware:
+    """
+    multipart 요청 본문 크기 제한 (Content-Length 기준, 본문을 읽기 전에 413 응답)
+    - 파일별 제한은 file_utils.read_upload_limited 에서 청크 단위로 확인
+    """
+
+    def __init__(self, app, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            headers = dict(scope["headers"])
+            content_type = headers.get(b"content-type", b"")
+            content_length = headers.get(b"content-length", b"")
+
+            if content_type.startswith(b"multipart/") and content_length.isdigit() and int(content_length) > self.max_bytes:
+                response = JSONResponse(
+                    status_code=413,
+                    content={"success": False, "error": "업로드 용량이 너무 큽니다.", "data": None},
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
@@ -27,3 +27,6 @@ from .users_childs import UsersChilds
 from .password_reset_token import PasswordResetToken
 from .users_childs_allergies import UsersChildsAllergies
 from .ingredients_requests import IngredientsRequests
+from .meals_feed_projection import MealsFeedProjections
+from .meals_week_reports import MealsWeekReports
+from .users_stats import UsersStats
@@ -14,3 +14,5 @@ class AttachesFiles(Base):
     height = Column(Integer, nullable=True, comment="원본 height")
     created_at = Column(DateTime, default=datetime.utcnow)
     is_active = Column(Enum("Y", "N"), default="Y", nullable=True, comment="사용여부")
+    status = Column(Enum("P", "R", "F"), default="R", nullable=False, comment="사이즈 변환 상태 (P:대기, R:완료, F:실패)")
+    content_hash = Column(String(64), nullable=True, index=True, comment="내용 sha256 (attaches/blobs 공유 파일, 같은 해시 행 수 = 참조 수)")
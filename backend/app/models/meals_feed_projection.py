@@ -0,0 +1,20 @@
+from sqlalchemy import Column, BigInteger, Integer, String, Text, DateTime, func
+from app.core.database import Base
+
+class MealsFeedProjections(Base):
+    """
+    피드 목록용 식단별 집계 테이블
+    - 댓글/첨부파일/재료/스크랩 쓰기 경로에서 해당 식단 행만 갱신
+    - MealsCalendarsRepository.build_base_query 는 전체 테이블 GROUP BY 대신 이 테이블을 조인
+    """
+    __tablename__ = "meals_feed_projection"
+
+    meal_id = Column(BigInteger, primary_key=True, autoincrement=False, comment="meals_calendars.pk")
+    comment_count = Column(Integer, nullable=False, default=0, comment="활성 댓글 수")
+    image_url = Column(String(500), nullable=True, comment="대표 이미지 경로")
+    mapped_tags = Column(Text, nullable=True, comment="재료명 (콤마 구분)")
+    mapped_scores = Column(Text, nullable=True, comment="재료 score (콤마 구분)")
+    mapped_ids = Column(Text, nullable=True, comment="재료 pk (콤마 구분)")
+    scrap_count = Column(Integer, nullable=False, default=0, comment="활성 스크랩 수")
+    pinned_count = Column(Integer, nullable=False, default=0, comment="핀 고정 스크랩 수")
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now(), comment="갱신일시")
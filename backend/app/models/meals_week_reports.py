@@ -0,0 +1,26 @@
+from sqlalchemy import Column, BigInteger, Integer, String, Text, Date, DateTime, UniqueConstraint, func
+from app.core.database import Base
+
+class MealsWeekReports(Base):
+    """
+    자녀별 주간 식단 리포트 (set_summaries_week 배치)
+    - (user_id, child_id, week_start) 당 한 행, 이미 완료된 행은 재실행 시 건너뜀
+    """
+    __tablename__ = "meals_week_reports"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, nullable=False, comment="users.pk")
+    child_id = Column(Integer, nullable=False, default=0, comment="users_childs.pk")
+    week_start = Column(Date, nullable=False, comment="집계 시작일")
+    week_end = Column(Date, nullable=False, comment="집계 종료일")
+    meal_count = Column(Integer, nullable=False, default=0, comment="집계 식단 수")
+    totals_json = Column(Text, nullable=True, comment="영양소 합계 JSON")
+    report_json = Column(Text, nullable=True, comment="AI 분석 결과 JSON")
+    status = Column(String(1), nullable=False, default="P", comment="상태 (P:대기, R:완료, F:실패)")
+    error = Column(String(500), nullable=True, comment="실패 사유")
+    created_at = Column(DateTime, nullable=False, server_default=func.now(), comment="생성일시")
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now(), comment="갱신일시")
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "child_id", "week_start", name="unq_week_report"),
+    )
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, DateTime, func
+from app.core.database import Base
+
+class UsersStats(Base):
+    """
+    회원별 집계 (프로필 / 내 정보 화면)
+    - 좋아요 / 식단 쓰기 경로에서 증감, set_users_stats 배치로 주기적 재계산
+    """
+    __tablename__ = "users_stats"
+
+    user_id = Column(Integer, primary_key=True, autoincrement=False, comment="users.pk")
+    like_count = Column(Integer, nullable=False, default=0, comment="누른 좋아요 수 (feeds_likes + meals_likes)")
+    meal_count = Column(Integer, nullable=False, default=0, comment="등록 식단 수 (삭제 제외)")
+    public_meal_count = Column(Integer, nullable=False, default=0, comment="공개 식단 수 (삭제 제외)")
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now(), comment="갱신일시")
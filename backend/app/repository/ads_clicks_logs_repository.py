@@ -1,5 +1,5 @@
 from app.models.ads import Ads
-from sqlalchemy import func
+from sqlalchemy import func, insert
 from app.models.ad_clicks_logs import AdsClickLog
 
 class AdsClicksLogsRepository:
@@ -18,4 +18,24 @@ class AdsClicksLogsRepository:
         session.add(click_log)
         session.flush()
         session.refresh(click_log)
-        return click_log
\ No newline at end of file
+        return click_log
+
+    @staticmethod
+    def bulk_add_logs(session, clicks: list):
+        """
+        광고 클릭 로그 일괄 생성
+        - clicks: [{ads_id, user_id, ip, user_agent, created_at}, ...]
+        """
+        if not clicks:
+            return
+
+        session.execute(insert(AdsClickLog), [
+            {
+                "ads_id": click["ads_id"],
+                "user_id": click["user_id"],
+                "ip": click["ip"],
+                "user_agent": click["user_agent"],
+                "created_at": click["created_at"],
+            }
+            for click in clicks
+        ])
\ No newline at end of file
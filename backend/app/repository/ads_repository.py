@@ -18,17 +18,14 @@ class AdsRepository:
         return total_amount
 
     @staticmethod
-    def set_click_count(session, ad_id, click_count):
+    def increase_click_count(session, ad_id, count: int = 1):
         """
-        광고 클릭 수 업데이트
+        광고 클릭 수 증가 (DB 에서 click_count = click_count + count)
         """
-        ad = session.query(Ads).filter(Ads.id == ad_id).first()
-        if ad:
-            ad.click_count = click_count
-            session.flush()
-            session.refresh(ad)
-            return ad
-        return None
+        session.query(Ads).filter(Ads.id == ad_id).update(
+            {Ads.click_count: Ads.click_count + count},
+            synchronize_session=False
+        )
 
     @staticmethod
     def get_ads_list(session, params):
@@ -1,3 +1,4 @@
+from sqlalchemy import func
 from app.models.attaches_files import AttachesFiles
 
 class AttachesFilesRepository:
@@ -26,7 +27,7 @@ class AttachesFilesRepository:
         db.flush()
 
     @staticmethod
-    def create(db, model: str, model_id: int, image_url: str, width: int, height: int, sort_order: int = 0):
+    def create(db, model: str, model_id: int, image_url: str, width: int, height: int, sort_order: int = 0, status: str = "R", content_hash: str = None):
         new_file = AttachesFiles(
             img_model=model,
             img_model_id=model_id,
@@ -34,9 +35,69 @@ class AttachesFilesRepository:
             width=width,
             height=height,
             sort_order=sort_order,
-            is_active="Y"
+            is_active="Y",
+            status=status,
+            content_hash=content_hash
         )
         db.add(new_file)
         db.flush()
         db.refresh(new_file)
-        return new_file
\ No newline at end of file
+        return new_file
+
+    @staticmethod
+    def update_status_by_image_url(db, image_url: str, status: str):
+        """
+        사이즈 변환 상태 변경 (이미지 변환 워커 완료 시)
+        """
+        updated = db.query(AttachesFiles).filter(
+            AttachesFiles.image_url == image_url
+        ).update({"status": status}, synchronize_session=False)
+        db.flush()
+        return updated
+
+    @staticmethod
+    def count_by_content_hashes(db, content_hashes: list, for_update: bool = False) -> dict:
+        """
+        내용 해시별 참조 수 (is_active 무관 - soft delete 된 행도 파일을 참조)
+        - for_update: 잠금 조회 - 커밋 전까지 같은 해시 행 추가(동시 업로드)를 대기시킴 (파일 삭제 직전 사용)
+        """
+        if not content_hashes:
+            return {}
+
+        if for_update:
+            rows = db.query(AttachesFiles.id, AttachesFiles.content_hash).filter(
+                AttachesFiles.content_hash.in_(content_hashes)
+            ).with_for_update().all()
+
+            counts = {}
+            for _, content_hash in rows:
+                counts[content_hash] = counts.get(content_hash, 0) + 1
+            return counts
+
+        rows = db.query(AttachesFiles.content_hash, func.count(AttachesFiles.id)).filter(
+            AttachesFiles.content_hash.in_(content_hashes)
+        ).group_by(AttachesFiles.content_hash).all()
+        return {content_hash: count for content_hash, count in rows}
+
+    @staticmethod
+    def get_by_model_ids(db, model: str, model_ids: list):
+        """
+        여러 모델 id 의 첨부파일 (is_active 무관 - 영구 삭제용)
+        """
+        if not model_ids:
+            return []
+        return db.query(AttachesFiles).filter(
+            AttachesFiles.img_model == model,
+            AttachesFiles.img_model_id.in_(model_ids)
+        ).all()
+
+    @staticmethod
+    def hard_delete_by_model_ids(db, model: str, model_ids: list) -> int:
+        if not model_ids:
+            return 0
+        deleted = db.query(AttachesFiles).filter(
+            AttachesFiles.img_model == model,
+            AttachesFiles.img_model_id.in_(model_ids)
+        ).delete(synchronize_session=False)
+        db.flush()
+        return deleted
@@ -5,17 +5,19 @@ from app.models.communities import Communities
 from app.models.users_childs import UsersChilds
 
 from app.libs.hash_utils import generate_sha256_hash
+from app.libs.keyset_utils import KeysetKey, KeysetPaginator
 from datetime import datetime
 import pytz
 
 class CommunitiesRepository:
 
+    @staticmethod
     def increase_view_count(db, community, is_commit=True):
         """
-        커뮤니티 글 조회수 증가 함수
+        커뮤니티 글 조회수 증가 함수 (DB 에서 view_count = view_count + 1)
         """
-        community.view_count += 1
-        db.add(community)
+        from app.repository.counters_repository import CountersRepository
+        CountersRepository.add(db, Communities, community.id, "view_count", 1)
 
         if is_commit:
             db.commit()
@@ -140,10 +142,6 @@ class CommunitiesRepository:
         if params.get("my_only") and params.get("user_id"):
             query = query.filter(Communities.user_id == params["user_id"])
 
-        # 커서 기반 페이징
-        if params.get("cursor"):
-            query = query.filter(Communities.id < params["cursor"])
-
         return query
 
     @staticmethod
@@ -218,6 +216,22 @@ class CommunitiesRepository:
 
         return query
 
+    @staticmethod
+    def build_paginator(sort_by: str = None):
+        """
+        정렬 조건별 keyset paginator
+        - 공지글·고정글 우선 정렬까지 포함한 정렬 키 전체를 cursor 로 사용
+        """
+        keys = [
+            KeysetKey.for_column(Communities.is_notice, "desc"),
+            KeysetKey.for_column(Communities.pinned_at, "desc"),
+        ]
+        if sort_by == "views":
+            keys.append(KeysetKey.for_column(Communities.view_count, "desc"))
+        keys.append(KeysetKey.for_column(Communities.id, "desc"))
+
+        return KeysetPaginator(keys)
+
     @staticmethod
     def get_community_list(session, user_id, params, include=None):
         """
@@ -254,21 +268,9 @@ class CommunitiesRepository:
         query = CommunitiesRepository.build_base_query(session, effective_params, include, base_query=base_query)
         query = CommunitiesRepository.apply_filters(query, effective_params, include)
 
-        # 정렬: is_notice·pinned_at 우선, sort_by 반영
-        sort_by = effective_params.get("sort_by", "latest")
-        if sort_by == "views":
-            query = query.order_by(
-                Communities.is_notice.desc(),
-                Communities.pinned_at.desc(),
-                Communities.view_count.desc(),
-                Communities.id.desc()
-            )
-        else:  # latest (기본값) 및 likes
-            query = query.order_by(
-                Communities.is_notice.desc(),
-                Communities.pinned_at.desc(),
-                Communities.id.desc()
-            )
+        # 정렬: is_notice·pinned_at 우선, sort_by 반영 (latest 기본값 및 likes 는 id 순)
+        paginator = CommunitiesRepository.build_paginator(effective_params.get("sort_by", "latest"))
+        query = paginator.apply(session, query, effective_params.get("cursor"))
 
         # 페이징
         if effective_params.get("limit") is not None:
@@ -0,0 +1,20 @@
+from sqlalchemy import func
+
+class CountersRepository:
+    """
+    카운터 컬럼(view_count, like_count 등) 증감
+    - 파이썬에서 읽고 쓰지 않고 DB 에서 col = col + delta 로 처리 (동시 요청 시 유실 방지)
+    """
+
+    @staticmethod
+    def add(session, model, row_id: int, column: str, delta: int):
+        col = getattr(model, column)
+        session.query(model).filter(model.id == row_id).update(
+            {col: func.greatest(col + delta, 0)},
+            synchronize_session=False
+        )
+
+    @staticmethod
+    def get_value(session, model, row_id: int, column: str) -> int:
+        col = getattr(model, column)
+        return session.query(col).filter(model.id == row_id).scalar() or 0
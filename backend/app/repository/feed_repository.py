@@ -1,6 +1,7 @@
 # app/repositories/feed_repository.py
 from app.models.feeds import Feeds
 from app.models.attaches_files import AttachesFiles
+from app.libs.keyset_utils import KeysetKey, KeysetPaginator
 
 class FeedRepository:
 
@@ -85,6 +86,20 @@ class FeedRepository:
 
         return True
 
+    @staticmethod
+    def build_paginator(order_by: str = None):
+        """
+        정렬 조건별 keyset paginator (마지막 키 id 로 동순위 정렬 고정)
+        """
+        if order_by == "like_count_desc":
+            keys = [KeysetKey.for_column(Feeds.like_count, "desc"), KeysetKey.for_column(Feeds.id, "desc")]
+        elif order_by == "like_count_asc":
+            keys = [KeysetKey.for_column(Feeds.like_count, "asc"), KeysetKey.for_column(Feeds.id, "asc")]
+        else:
+            keys = [KeysetKey.for_column(Feeds.created_at, "desc"), KeysetKey.for_column(Feeds.id, "desc")]
+
+        return KeysetPaginator(keys)
+
     @staticmethod
     def get_list(session, params: dict, extra: dict = {}):
 
@@ -102,12 +117,6 @@ class FeedRepository:
         limit = extra.get("limit", 20)
         offset = extra.get("offset", 0)
 
-        order_by = Feeds.created_at.desc()
-        if extra.get("order_by") == "like_count_desc":
-            order_by = Feeds.like_count.desc()
-        elif extra.get("order_by") == "like_count_asc":
-            order_by = Feeds.like_count.asc()
-
         # 서브쿼리: 각 피드의 태그들을 콤마로 연결
         subquery = (
             session.query(
@@ -221,7 +230,6 @@ class FeedRepository:
             eq(Feeds.meal_stage_detail, "meal_stage_detail"),
             Feeds.user_id == params["my_user_id"] if params.get("view_type") == "mine" else None,
             ~Feeds.user_id.in_(params["deny_user_ids"]) if params.get("deny_user_ids") else None,
-            Feeds.id < params["cursor"] if params.get("cursor") else None,
         ]))
 
         # target_user_id가 있으면 해당 사용자의 피드만 조회
@@ -235,21 +243,30 @@ class FeedRepository:
 
         query = query.filter(*conditions)
 
-        result = query.order_by(order_by).offset(offset).limit(limit).all()
-        return QueryResult(result)
+        # 정렬 + cursor seek (cursor 가 있으면 offset 무시)
+        paginator = FeedRepository.build_paginator(extra.get("order_by"))
+        query = paginator.apply(session, query, params.get("cursor"))
+
+        if not params.get("cursor"):
+            query = query.offset(offset)
+
+        result = query.limit(limit).all()
+        next_cursor = paginator.encode(result[-1]) if result else None
+        return QueryResult(result, next_cursor)
 
 class QueryResult:
     """쿼리 결과를 감싸는 래퍼 클래스 - 체이닝 패턴 지원"""
 
-    def __init__(self, results):
+    def __init__(self, results, next_cursor: str = None):
         self._results = results
+        self._next_cursor = next_cursor
 
     def getData(self):
         """직렬화된 Pydantic 모델 리스트 반환"""
         from app.schemas.feeds_schemas import FeedsResponse, FeedsUserResponse
         from app.schemas.users_schemas import UserChildItemSchema, AllergyItemSchema
 
-        return [
+        data = [
             FeedsResponse(
                 id=v.id,
                 user_id=v.user_id,
@@ -294,6 +311,16 @@ class QueryResult:
             for v in self._results
         ]
 
+        # 다음 페이지 cursor 는 마지막 항목에 설정
+        if data:
+            data[-1].cursor = self._next_cursor
+
+        return data
+
+    def getNextCursor(self):
+        """다음 페이지 cursor 토큰 반환"""
+        return self._next_cursor
+
     def toDict(self):
         """딕셔너리 리스트 반환"""
         return [
@@ -8,6 +8,21 @@ class IngredientsMappersRepository:
             IngredientsMappers.meal_id == meal_id
         ).all()
 
+    @staticmethod
+    def get_pairs_by_meal_ids(db, meal_ids: list, chunk_size: int = 1000):
+        """
+        여러 식단의 (meal_id, ingredient_id) - IN 절 크기 제한을 위해 나눠서 조회
+        """
+        rows = []
+        for start in range(0, len(meal_ids), chunk_size):
+            chunk = meal_ids[start:start + chunk_size]
+            rows.extend(
+                db.query(IngredientsMappers.meal_id, IngredientsMappers.ingredient_id).filter(
+                    IngredientsMappers.meal_id.in_(chunk)
+                ).all()
+            )
+        return rows
+
     @staticmethod
     def create_mapper(db, data):
         ingredient_mapper = IngredientsMappers(**data)
@@ -26,4 +41,12 @@ class IngredientsMappersRepository:
             return False
 
         db.flush()
-        return True
\ No newline at end of file
+        return True
+
+    @staticmethod
+    def delete_by_meal_ids(db, meal_ids: list) -> int:
+        if not meal_ids:
+            return 0
+        return db.query(IngredientsMappers).filter(
+            IngredientsMappers.meal_id.in_(meal_ids)
+        ).delete(synchronize_session=False)
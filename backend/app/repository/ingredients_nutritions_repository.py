@@ -1,12 +1,12 @@
+from sqlalchemy import func
+
+from app.models.ingredients import Ingredients
 from app.models.ingredients_nutritions import IngredientsNutritions
+from app.models.nutrients import Nutrients
 class IngredientsNutritionsRepository:
 
     @staticmethod
     def get_ingredient_mapper(session, ingredient_id):
-
-        from app.models.nutrients import Nutrients
-        from app.models.ingredients import Ingredients
-
         query = session.query(
             IngredientsNutritions.amount,
             Nutrients.name.label("nutrient_name"),
@@ -16,4 +16,24 @@ class IngredientsNutritionsRepository:
         query = query.join(Nutrients, Nutrients.id == IngredientsNutritions.nutrient_id)
         query = query.join(Ingredients, Ingredients.id == IngredientsNutritions.ingredient_id)
         query = query.filter(IngredientsNutritions.ingredient_id == ingredient_id)
-        return query.all()
\ No newline at end of file
+        return query.all()
+
+    @staticmethod
+    def get_version(session) -> tuple:
+        """
+        영양소 데이터 버전 (행 수 / 최대 id / 함량 합계 + 재료 / 영양소 행 수 / 최대 id)
+        - 추가 / 삭제 / 함량 수정 시 값이 바뀜 - 영양소 행렬 캐시 갱신 판단용
+        """
+        mapping = session.query(
+            func.count(IngredientsNutritions.id),
+            func.coalesce(func.max(IngredientsNutritions.id), 0),
+            func.coalesce(func.sum(IngredientsNutritions.amount), 0),
+        ).one()
+        ingredients = session.query(func.count(Ingredients.id), func.coalesce(func.max(Ingredients.id), 0)).one()
+        nutrients = session.query(func.count(Nutrients.id), func.coalesce(func.max(Nutrients.id), 0)).one()
+
+        return (
+            int(mapping[0]), int(mapping[1]), str(mapping[2]),
+            int(ingredients[0]), int(ingredients[1]),
+            int(nutrients[0]), int(nutrients[1]),
+        )
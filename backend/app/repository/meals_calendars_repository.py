@@ -1,15 +1,15 @@
-from sqlalchemy import case, func
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import aliased
 
 from app.models.meals_calendar import MealsCalendars
 from app.models.categories_codes import CategoriesCodes
 from app.models.ingredients_mappers import IngredientsMappers
-from app.models.meals_scraps import MealsScrap
-from app.models.ingredients import Ingredients
-from app.models.attaches_files import AttachesFiles
 from app.models.meals_likes import MealsLikes
+from app.models.meals_feed_projection import MealsFeedProjections
 from app.models.users import Users
 from app.models.users_childs import UsersChilds
 from app.models.users_childs_allergies import UsersChildsAllergies
+from app.libs.keyset_utils import KeysetKey, KeysetPaginator
 
 class MealsCalendarsRepository:
     @staticmethod
@@ -25,6 +25,76 @@ class MealsCalendarsRepository:
             )
         return query.all()
 
+    @staticmethod
+    def get_deleted_meal_ids(db, search_date: str, after_id: int = 0, limit: int = 500):
+        """
+        정리 대상(삭제 후 search_date 경과) 식단 id - id 오름차순 keyset 청크
+        """
+        rows = db.query(MealsCalendars.id).filter(
+            MealsCalendars.is_active == "N",
+            MealsCalendars.deleted_at < search_date,
+            MealsCalendars.id > after_id
+        ).order_by(MealsCalendars.id.asc()).limit(limit).all()
+        return [row.id for row in rows]
+
+    @staticmethod
+    def get_week_meal_rows(session, start_date: str, end_date: str, user_ids: list = None):
+        """
+        기간 내 활성 식단 (전체 사용자, 주간 리포트 배치용)
+        - 식단 자녀(child_id) 정보와 사용자 대표 자녀 정보를 함께 조회 (식단에 자녀가 없으면 대표 자녀로 집계)
+        """
+        meal_child = aliased(UsersChilds)
+        agent_child_subquery = (
+            session.query(
+                UsersChilds.user_id,
+                func.max(UsersChilds.id).label("agent_child_id"),
+            )
+            .filter(UsersChilds.is_agent == "Y")
+            .group_by(UsersChilds.user_id)
+            .subquery()
+        )
+        agent_child = aliased(UsersChilds)
+
+        query = session.query(
+            MealsCalendars.id.label("meal_id"),
+            MealsCalendars.user_id,
+            MealsCalendars.input_date,
+            CategoriesCodes.value.label("category_name"),
+            meal_child.id.label("child_id"),
+            meal_child.child_name,
+            meal_child.child_gender,
+            meal_child.child_birth,
+            agent_child.id.label("agent_child_id"),
+            agent_child.child_name.label("agent_child_name"),
+            agent_child.child_gender.label("agent_child_gender"),
+            agent_child.child_birth.label("agent_child_birth"),
+        ).outerjoin(
+            CategoriesCodes, CategoriesCodes.id == MealsCalendars.category_code
+        ).outerjoin(
+            meal_child, meal_child.id == MealsCalendars.child_id
+        ).outerjoin(
+            agent_child_subquery, agent_child_subquery.c.user_id == MealsCalendars.user_id
+        ).outerjoin(
+            agent_child, agent_child.id == agent_child_subquery.c.agent_child_id
+        ).filter(
+            MealsCalendars.is_active == "Y",
+            MealsCalendars.input_date >= start_date,
+            MealsCalendars.input_date <= end_date,
+        )
+
+        if user_ids:
+            query = query.filter(MealsCalendars.user_id.in_(user_ids))
+
+        return query.order_by(MealsCalendars.user_id, MealsCalendars.input_date, MealsCalendars.id).all()
+
+    @staticmethod
+    def delete_by_ids(db, meal_ids: list) -> int:
+        if not meal_ids:
+            return 0
+        return db.query(MealsCalendars).filter(
+            MealsCalendars.id.in_(meal_ids)
+        ).delete(synchronize_session=False)
+
     @staticmethod
     def get_calendars_by_user_id(session, user_id: int):
         return session.query(MealsCalendars).filter(
@@ -44,6 +114,15 @@ class MealsCalendarsRepository:
             MealsCalendars.id == calendar_id
         ).first()
 
+    @staticmethod
+    def get_calendars_by_ids(session, calendar_ids: list):
+        if not calendar_ids:
+            return []
+
+        return session.query(MealsCalendars).filter(
+            MealsCalendars.id.in_(calendar_ids)
+        ).all()
+
     @staticmethod
     def create(session, params, is_commit=True):
 
@@ -150,23 +229,14 @@ class MealsCalendarsRepository:
             else:
                 query = query.add_columns(literal(False).label("is_liked"))
 
-        if "comment_count" in include:
-            from app.models.meals_comments import MealsComments
-            comment_count_subquery = (
-                session.query(
-                    MealsComments.meal_id.label("meal_id"),
-                    sql_func.count(MealsComments.id).label("comment_count")
-                )
-                .filter(MealsComments.is_active == "Y")
-                .group_by(MealsComments.meal_id)
-                .subquery()
-            )
+        # 댓글 수/대표 이미지/재료 태그/스크랩 집계는 meals_feed_projection 에서 조인
+        # (매 요청마다 전체 테이블 GROUP BY 서브쿼리를 만들지 않도록 쓰기 시점에 갱신된 값을 사용)
+        projection = MealsFeedProjections
+        if set(include) & {"comment_count", "image", "tags", "scrap"}:
+            query = query.outerjoin(projection, MealsCalendars.id == projection.meal_id)
 
-            query = query.add_columns(sql_func.coalesce(comment_count_subquery.c.comment_count, 0).label("comment_count"))
-            query = query.outerjoin(
-                comment_count_subquery,
-                MealsCalendars.id == comment_count_subquery.c.meal_id
-            )
+        if "comment_count" in include:
+            query = query.add_columns(sql_func.coalesce(projection.comment_count, 0).label("comment_count"))
 
         if "user" in include:
             query = query.join(Users, MealsCalendars.user_id == Users.id).add_columns(
@@ -192,66 +262,20 @@ class MealsCalendarsRepository:
             )
 
         if "image" in include:
-            image_subquery = (
-                session.query(
-                    AttachesFiles.img_model_id.label("meal_id"),
-                    sql_func.min(AttachesFiles.image_url).label("image_url")
-                )
-                .filter(
-                    AttachesFiles.img_model == "Meals",
-                    AttachesFiles.is_active == "Y"
-                )
-                .group_by(AttachesFiles.img_model_id)
-                .subquery()
-            )
-
-            query = query.add_columns(image_subquery.c.image_url)
-            query = query.outerjoin(
-                image_subquery,
-                MealsCalendars.id == image_subquery.c.meal_id
-            )
+            query = query.add_columns(projection.image_url.label("image_url"))
 
         if "tags" in include:
-            tags_subquery = (
-                session.query(
-                    IngredientsMappers.meal_id.label("meal_id"),
-                    sql_func.group_concat(IngredientsMappers.score).label('mapped_scores'),
-                    sql_func.group_concat(Ingredients.name).label('mapped_tags'),
-                    sql_func.group_concat(Ingredients.id).label('mapped_ids')
-                )
-                .join(Ingredients, IngredientsMappers.ingredient_id == Ingredients.id)
-                .group_by(IngredientsMappers.meal_id)
-                .subquery()
-            )
-
-            query = query.add_columns(tags_subquery.c.mapped_tags, tags_subquery.c.mapped_scores, tags_subquery.c.mapped_ids)
-            query = query.outerjoin(
-                tags_subquery,
-                MealsCalendars.id == tags_subquery.c.meal_id
+            query = query.add_columns(
+                projection.mapped_tags.label("mapped_tags"),
+                projection.mapped_scores.label("mapped_scores"),
+                projection.mapped_ids.label("mapped_ids"),
             )
 
         if "scrap" in include:
-            # is_scrap 추가
-            scrap_subquery = (
-                session.query(
-                    MealsScrap.meal_id.label("meal_id"),
-                    sql_func.max(case((MealsScrap.is_active == "Y", 1), else_=0)).label("is_scrap"),
-                    sql_func.max(
-                        case((MealsScrap.sort_order > 0, 1), else_=0)
-                    ).label("is_pinned")
-                )
-                .group_by(MealsScrap.meal_id)
-                .subquery()
-            )
-
+            # is_scrap / is_pinned
             query = query.add_columns(
-                scrap_subquery.c.is_scrap,
-                scrap_subquery.c.is_pinned,
-            )
-
-            query = query.outerjoin(
-                scrap_subquery,
-                MealsCalendars.id == scrap_subquery.c.meal_id
+                case((projection.scrap_count > 0, 1), else_=0).label("is_scrap"),
+                case((projection.pinned_count > 0, 1), else_=0).label("is_pinned"),
             )
 
         if "child" in include:
@@ -317,9 +341,6 @@ class MealsCalendarsRepository:
 
             ~MealsCalendars.user_id.in_(params["deny_user_ids"])
             if params.get("deny_user_ids") else None,
-
-            MealsCalendars.id < params["cursor"]
-            if params.get("cursor") else None,
         ]
 
         # 날짜
@@ -373,14 +394,17 @@ class MealsCalendarsRepository:
         return query.count()
 
     @staticmethod
-    def get_meals_list(session, params, extra=None):
+    def normalize_list_params(params, extra=None):
+        """
+        limit/offset/order_by 를 params 기준으로 정리
+        - extra 의 값은 params 에 없을 때만 사용
+        - order_by 가 *_asc|*_desc 형태면 order_by / order_direction 으로 분리
+        """
         if extra is None:
             extra = {}
 
         effective_params = dict(params or {})
 
-        include = extra.get("include", [])
-
         if extra.get("limit") is not None and effective_params.get("limit") is None:
             effective_params["limit"] = extra.get("limit")
 
@@ -410,34 +434,68 @@ class MealsCalendarsRepository:
             if effective_params.get("order_direction") is None:
                 effective_params["order_direction"] = direction
 
-        query = MealsCalendarsRepository.build_base_query(session, effective_params, include)
+        return effective_params
 
-        # 모델 컬럼 목록 가져오기
-        query = MealsCalendarsRepository.apply_filters(session, query, effective_params)
+    @staticmethod
+    def build_paginator(effective_params):
+        """
+        정렬 조건에 맞는 keyset paginator
+        - 식재료 필터: (매칭 수, 정렬 컬럼, id)
+        - 그 외: (정렬 컬럼, id)
+        """
+        order_by = effective_params.get("order_by") or "id"
+        order_direction = effective_params.get("order_direction") or "desc"
 
-        # 정렬
-        order_by = effective_params.get("order_by", "id")
-        order_direction = effective_params.get("order_direction", "desc")
+        keys = []
 
         # 식재료 필터가 있을 때: 매칭 수 많은 순으로 우선 정렬
         if effective_params.get("ingredient_ids"):
-
             from sqlalchemy import func as sql_func, select as sa_select
 
-            ingredient_ids = effective_params["ingredient_ids"]
-
             match_count = (
                 sa_select(sql_func.count())
                 .where(
                     IngredientsMappers.meal_id == MealsCalendars.id,
-                    IngredientsMappers.ingredient_id.in_(ingredient_ids)
+                    IngredientsMappers.ingredient_id.in_(effective_params["ingredient_ids"])
                 )
                 .correlate(MealsCalendars)
                 .scalar_subquery()
             )
-            query = query.order_by(match_count.desc())
+            keys.append(KeysetKey("match_count", match_count, "desc"))
+
+        if order_by != "id" and order_by in MealsCalendars.__table__.c:
+            keys.append(KeysetKey.for_column(getattr(MealsCalendars, order_by), order_direction))
+        else:
+            order_direction = "desc"
+
+        keys.append(KeysetKey.for_column(MealsCalendars.id, order_direction))
+
+        return KeysetPaginator(keys, id_column=MealsCalendars.id)
+
+    @staticmethod
+    def encode_cursor(session, params, last_id: int, extra=None):
+        """
+        목록 마지막 행 기준 다음 페이지 cursor 토큰
+        """
+        effective_params = MealsCalendarsRepository.normalize_list_params(params, extra)
+        return MealsCalendarsRepository.build_paginator(effective_params).encode_by_id(session, last_id)
+
+    @staticmethod
+    def get_meals_list(session, params, extra=None):
+        if extra is None:
+            extra = {}
+
+        include = extra.get("include", [])
+
+        effective_params = MealsCalendarsRepository.normalize_list_params(params, extra)
+
+        query = MealsCalendarsRepository.build_base_query(session, effective_params, include)
+
+        # 모델 컬럼 목록 가져오기
+        query = MealsCalendarsRepository.apply_filters(session, query, effective_params)
 
         meal_ids = effective_params.get("meal_ids") or []
+        cursor = effective_params.get("cursor")
 
         if meal_ids:
             # meal_ids 입력 순서를 그대로 유지 (예: 스크랩 최신순)
@@ -448,15 +506,43 @@ class MealsCalendarsRepository:
             )
 
             query = query.order_by(order_index.asc())
+            cursor = None
 
-        elif hasattr(MealsCalendars, order_by):
-            col = getattr(MealsCalendars, order_by)
-            query = query.order_by(col.desc() if order_direction == "desc" else col.asc())
         else:
-            query = query.order_by(MealsCalendars.id.desc())
-
-        # 페이징
-        if effective_params.get("offset") is not None and effective_params.get("limit") is not None:
+            # 정렬 + cursor 가 있으면 정렬 키 전체 기준 seek
+            paginator = MealsCalendarsRepository.build_paginator(effective_params)
+            query = paginator.apply(session, query, cursor)
+
+        # 페이징 (cursor 가 있으면 offset 무시)
+        if cursor and effective_params.get("limit") is not None:
+            query = query.limit(effective_params["limit"])
+        elif effective_params.get("offset") is not None and effective_params.get("limit") is not None:
             query = query.offset(effective_params["offset"]).limit(effective_params["limit"])
 
-        return query.all()
\ No newline at end of file
+        return query.all()
+
+class AsyncMealsCalendarsRepository:
+    """
+    AsyncSession 용 식단 캘린더 repository
+    - 단건 조회는 select() 로 직접 실행
+    - include 조합이 많은 목록 조회는 run_sync 로 동기 쿼리 빌더(MealsCalendarsRepository)를 재사용
+      (aiomysql 커넥션 위에서 실행되므로 이벤트 루프를 막지 않음)
+    """
+
+    @staticmethod
+    async def find_by_view_hash(session, view_hash: str):
+        result = await session.execute(
+            select(MealsCalendars).filter(MealsCalendars.view_hash == view_hash)
+        )
+        return result.scalars().first()
+
+    @staticmethod
+    async def get_calendar_by_id(session, calendar_id: int):
+        result = await session.execute(
+            select(MealsCalendars).filter(MealsCalendars.id == calendar_id)
+        )
+        return result.scalars().first()
+
+    @staticmethod
+    async def get_meals_list(session, params, extra=None):
+        return await session.run_sync(MealsCalendarsRepository.get_meals_list, params, extra)
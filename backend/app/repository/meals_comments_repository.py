@@ -25,6 +25,12 @@ class MealsCommentsRepository:
         session.flush()
         return True
 
+    @staticmethod
+    def delete_by_meal_ids(session, meal_ids: list) -> int:
+        if not meal_ids:
+            return 0
+        return session.query(MealsComments).filter(MealsComments.meal_id.in_(meal_ids)).delete(synchronize_session=False)
+
     @staticmethod
     def soft_delete(session, comment, is_commit=True):
         comment.deleted_at = datetime.datetime.now(pytz.timezone("Asia/Seoul"))
@@ -0,0 +1,109 @@
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+from app.models.meals_feed_projection import MealsFeedProjections
+from app.models.meals_comments import MealsComments
+from app.models.attaches_files import AttachesFiles
+from app.models.ingredients_mappers import IngredientsMappers
+from app.models.ingredients import Ingredients
+from app.models.meals_scraps import MealsScrap
+
+class MealsFeedProjectionsRepository:
+    """
+    meals_feed_projection 갱신
+    - meal_ids 가 있으면 해당 식단만, 없으면 전체를 다시 계산 (재구성 배치용)
+    - 집계 대상이 모두 사라진 경우를 위해 먼저 컬럼을 초기화한 뒤 INSERT ... SELECT ... ON DUPLICATE KEY UPDATE
+    """
+
+    @staticmethod
+    def _reset(session, meal_ids, values: dict):
+        query = session.query(MealsFeedProjections)
+        if meal_ids is not None:
+            query = query.filter(MealsFeedProjections.meal_id.in_(meal_ids))
+        query.update(values, synchronize_session=False)
+
+    @staticmethod
+    def _upsert_from_select(session, columns: list, select_query):
+        stmt = mysql_insert(MealsFeedProjections).from_select(["meal_id", *columns], select_query)
+        stmt = stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in columns})
+        session.execute(stmt)
+
+    @staticmethod
+    def refresh_comment_count(session, meal_ids=None):
+        MealsFeedProjectionsRepository._reset(session, meal_ids, {"comment_count": 0})
+
+        query = (
+            select(MealsComments.meal_id, func.count(MealsComments.id))
+            .where(MealsComments.is_active == "Y")
+            .group_by(MealsComments.meal_id)
+        )
+        if meal_ids is not None:
+            query = query.where(MealsComments.meal_id.in_(meal_ids))
+
+        MealsFeedProjectionsRepository._upsert_from_select(session, ["comment_count"], query)
+
+    @staticmethod
+    def refresh_image(session, meal_ids=None):
+        MealsFeedProjectionsRepository._reset(session, meal_ids, {"image_url": None})
+
+        query = (
+            select(AttachesFiles.img_model_id, func.min(AttachesFiles.image_url))
+            .where(
+                AttachesFiles.img_model == "Meals",
+                AttachesFiles.is_active == "Y"
+            )
+            .group_by(AttachesFiles.img_model_id)
+        )
+        if meal_ids is not None:
+            query = query.where(AttachesFiles.img_model_id.in_(meal_ids))
+
+        MealsFeedProjectionsRepository._upsert_from_select(session, ["image_url"], query)
+
+    @staticmethod
+    def refresh_tags(session, meal_ids=None):
+        MealsFeedProjectionsRepository._reset(session, meal_ids, {
+            "mapped_tags": None,
+            "mapped_scores": None,
+            "mapped_ids": None,
+        })
+
+        query = (
+            select(
+                IngredientsMappers.meal_id,
+                func.group_concat(Ingredients.name),
+                func.group_concat(IngredientsMappers.score),
+                func.group_concat(Ingredients.id),
+            )
+            .join(Ingredients, IngredientsMappers.ingredient_id == Ingredients.id)
+            .group_by(IngredientsMappers.meal_id)
+        )
+        if meal_ids is not None:
+            query = query.where(IngredientsMappers.meal_id.in_(meal_ids))
+
+        MealsFeedProjectionsRepository._upsert_from_select(session, ["mapped_tags", "mapped_scores", "mapped_ids"], query)
+
+    @staticmethod
+    def refresh_scrap(session, meal_ids=None):
+        MealsFeedProjectionsRepository._reset(session, meal_ids, {"scrap_count": 0, "pinned_count": 0})
+
+        query = (
+            select(
+                MealsScrap.meal_id,
+                func.sum(case((MealsScrap.is_active == "Y", 1), else_=0)),
+                func.sum(case((MealsScrap.sort_order > 0, 1), else_=0)),
+            )
+            .group_by(MealsScrap.meal_id)
+        )
+        if meal_ids is not None:
+            query = query.where(MealsScrap.meal_id.in_(meal_ids))
+
+        MealsFeedProjectionsRepository._upsert_from_select(session, ["scrap_count", "pinned_count"], query)
+
+    @staticmethod
+    def delete_by_meal_ids(session, meal_ids: list):
+        if not meal_ids:
+            return
+
+        session.query(MealsFeedProjections).filter(
+            MealsFeedProjections.meal_id.in_(meal_ids)
+        ).delete(synchronize_session=False)
@@ -9,6 +9,24 @@ class MealsLikesRepository:
         db.query(MealsLikes).filter(MealsLikes.meal_id == meal_calendar_id).delete()
         db.flush()
 
+    @staticmethod
+    def count_by_user_for_meal_ids(db, meal_ids: list) -> dict:
+        """
+        식단 id 묶음의 좋아요 수를 누른 회원별로 집계 {user_id: count}
+        """
+        if not meal_ids:
+            return {}
+        rows = db.query(MealsLikes.user_id, func.count(MealsLikes.id)).filter(
+            MealsLikes.meal_id.in_(meal_ids)
+        ).group_by(MealsLikes.user_id).all()
+        return {user_id: count for user_id, count in rows}
+
+    @staticmethod
+    def delete_by_meal_ids(db, meal_ids: list) -> int:
+        if not meal_ids:
+            return 0
+        return db.query(MealsLikes).filter(MealsLikes.meal_id.in_(meal_ids)).delete(synchronize_session=False)
+
     def get_likes_by_user_id(session, user_id: int):
         return session.query(MealsLikes).filter(MealsLikes.user_id == user_id).all()
 
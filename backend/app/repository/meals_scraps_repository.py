@@ -1,3 +1,5 @@
+from sqlalchemy import select
+
 from app.models.meals_scraps import MealsScrap
 
 class MealsScrapsRepository:
@@ -65,4 +67,86 @@ class MealsScrapsRepository:
         session.add(scrap)
         session.flush()
         session.refresh(scrap)
-        return scrap
\ No newline at end of file
+        return scrap
+
+    @staticmethod
+    def delete_by_meal_ids(session, meal_ids: list) -> int:
+        """
+        식단 영구 삭제 시 해당 식단 스크랩 삭제
+        """
+        if not meal_ids:
+            return 0
+        return session.query(MealsScrap).filter(MealsScrap.meal_id.in_(meal_ids)).delete(synchronize_session=False)
+
+
+class AsyncMealsScrapsRepository:
+    """
+    AsyncSession 용 스크랩 repository
+    """
+
+    @staticmethod
+    async def get_scrap_by_max_sort_order(session, user_id):
+        """
+        사용자별 최대 정렬 순서 조회
+        """
+        result = await session.execute(
+            select(MealsScrap.sort_order).filter(MealsScrap.user_id == user_id).order_by(MealsScrap.sort_order.desc()).limit(1)
+        )
+        max_sort_order = result.scalar()
+        return max_sort_order if max_sort_order else 0
+
+    @staticmethod
+    async def get_scrap_list_by_user_id(session, user_id):
+        """
+        사용자별 스크랩 리스트 조회
+        """
+        result = await session.execute(
+            select(MealsScrap).filter(MealsScrap.user_id == user_id, MealsScrap.is_active == "Y").order_by(MealsScrap.sort_order.desc())
+        )
+        return result.scalars().all()
+
+    @staticmethod
+    async def get_scrap_by_user_and_meal(session, user_id, meal_id):
+        """
+        사용자와 식단 ID로 스크랩 정보 조회
+        """
+        result = await session.execute(
+            select(MealsScrap).filter(MealsScrap.user_id == user_id, MealsScrap.meal_id == meal_id)
+        )
+        return result.scalars().first()
+
+    @staticmethod
+    async def create(session, params):
+        """
+        스크랩 정보 생성
+        """
+        scrap = MealsScrap(
+            user_id=params.get("user_id"),
+            meal_id=params.get("meal_id"),
+            is_active=params.get("is_active", "Y"),
+            sort_order=params.get("sort_order", 0),
+            memo=params.get("memo", "")
+        )
+        session.add(scrap)
+        await session.flush()
+        await session.refresh(scrap)
+        return scrap
+
+    @staticmethod
+    async def update(session, scrap, is_active=None, memo=None, sort_order=None):
+        """
+        스크랩 정보 업데이트
+        """
+        if is_active is not None:
+            scrap.is_active = is_active
+
+        if memo is not None:
+            scrap.memo = memo
+
+        if sort_order is not None:
+            scrap.sort_order = sort_order
+
+        session.add(scrap)
+        await session.flush()
+        await session.refresh(scrap)
+        return scrap
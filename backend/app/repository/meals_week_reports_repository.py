@@ -0,0 +1,29 @@
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+from app.models.meals_week_reports import MealsWeekReports
+
+class MealsWeekReportsRepository:
+
+    @staticmethod
+    def get_done_keys(session, week_start) -> set:
+        """
+        완료된 (user_id, child_id) - 배치 재실행 시 건너뛰기용
+        """
+        rows = session.query(MealsWeekReports.user_id, MealsWeekReports.child_id).filter(
+            MealsWeekReports.week_start == week_start,
+            MealsWeekReports.status == "R"
+        ).all()
+        return {(row.user_id, row.child_id) for row in rows}
+
+    @staticmethod
+    def upsert(session, params: dict):
+        """
+        (user_id, child_id, week_start) 기준 저장 (실패 후 재실행 시 덮어씀)
+        """
+        statement = mysql_insert(MealsWeekReports).values(**params)
+        update_columns = {
+            key: statement.inserted[key]
+            for key in params
+            if key not in ("user_id", "child_id", "week_start")
+        }
+        session.execute(statement.on_duplicate_key_update(**update_columns))
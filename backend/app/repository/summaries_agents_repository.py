@@ -22,7 +22,10 @@ class SummariesAgentsRepository:
     @staticmethod
     def get_summary_by_model_recipe_data(session, model: str, model_id: int, recipe_list: list):
         recipe_hash = SummariesAgentsRepository.get_recipe_hash(recipe_list)
+        return SummariesAgentsRepository.get_summary_by_recipe_hash(session, model, model_id, recipe_hash)
 
+    @staticmethod
+    def get_summary_by_recipe_hash(session, model: str, model_id: int, recipe_hash: str):
         return session.query(SummariesAgents).filter(
             SummariesAgents.model == model,
             SummariesAgents.model_id == model_id,
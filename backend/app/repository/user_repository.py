@@ -1,29 +1,12 @@
 from datetime import datetime, timedelta
 import pytz
-from sqlalchemy import text
+from sqlalchemy import select
 from app.libs.hash_utils import generate_sha256_hash
 from app.libs.password_utils import hash_password, verify_password
 from app.models.users import Users
 
 class UserRepository:
 
-    @staticmethod
-    def get_user_like_count(session, user_id: int):
-        query = text("""
-        SELECT
-            COUNT(DISTINCT fl.id) AS like_count,
-            COUNT(DISTINCT mc.id) AS meal_calendar_count
-        FROM `users` u
-        LEFT JOIN `feeds_likes` fl ON u.id = fl.user_id
-        LEFT JOIN `meals_calendars` mc ON u.id = mc.user_id
-        WHERE u.id = :user_id
-        """)
-        result = session.execute(query, {"user_id": user_id}).fetchone()
-        return {
-            "like_count": result.like_count if result.like_count else 0,
-            "meal_count": result.meal_calendar_count if result.meal_calendar_count else 0
-        }
-
     @staticmethod
     def get_users_last_login(session, days: int, is_push_agree: int = None):
         """
@@ -43,6 +26,32 @@ class UserRepository:
             query = query.filter(Users.push_agree == is_push_agree)
         return query.all()
 
+    @staticmethod
+    def iter_users_last_login(session, days: int, is_push_agree: int = None, batch_size: int = 1000):
+        """
+        마지막 로그인 시간이 days일 이상인 사용자 스트리밍 조회 (id / fcm_token / push_agree 만)
+        - 서버 사이드 커서로 batch_size 행씩 읽어 전체 결과를 메모리에 올리지 않음
+        - 순회가 끝날 때까지 같은 세션으로 다른 쿼리를 실행하지 않아야 함 (MySQL 스트리밍 커서 제약)
+        """
+        kst = pytz.timezone("Asia/Seoul")
+        now = datetime.now(kst)
+        threshold_date = now - timedelta(days=days)
+
+        statement = select(Users.id, Users.fcm_token, Users.push_agree).where(
+            Users.last_login_at < threshold_date,
+            Users.fcm_token != None,
+            Users.fcm_token != ''
+        )
+
+        if is_push_agree is not None:
+            statement = statement.where(Users.push_agree == is_push_agree)
+
+        result = session.execute(statement.execution_options(yield_per=batch_size))
+        try:
+            yield from result
+        finally:
+            result.close()
+
     @staticmethod
     def get_user_by_nickname(session, nickname: str):
         """
@@ -95,6 +104,16 @@ class UserRepository:
         """
         return session.query(Users).filter(Users.id == user_id).first()
 
+    @staticmethod
+    def findByIds(session, user_ids: list):
+        """
+        PK 목록으로 회원 조회
+        """
+        if not user_ids:
+            return []
+
+        return session.query(Users).filter(Users.id.in_(user_ids)).all()
+
     @staticmethod
     def find_by_view_hash(session, view_hash: str):
         """
@@ -318,4 +337,38 @@ class UserRepository:
         if is_commit:
             session.commit()
             session.refresh(user)
-        return user
\ No newline at end of file
+        return user
+
+    @staticmethod
+    def clear_fcm_tokens(session, fcm_tokens: list, chunk_size: int = 1000) -> int:
+        """
+        FCM 토큰 일괄 삭제 (토큰값이 일치하는 회원만, 커밋은 호출부에서), 변경 행 수 반환
+        """
+        count = 0
+        for start in range(0, len(fcm_tokens), chunk_size):
+            chunk = fcm_tokens[start:start + chunk_size]
+            count += session.query(Users).filter(
+                Users.fcm_token.in_(chunk)
+            ).update({Users.fcm_token: ''}, synchronize_session=False)
+        return count
+
+class AsyncUserRepository:
+    """
+    AsyncSession 용 회원 조회 (get_async_db 를 사용하는 라우트에서 사용)
+    """
+
+    @staticmethod
+    async def findById(session, user_id: int):
+        """
+        PK로 회원 조회
+        """
+        result = await session.execute(select(Users).filter(Users.id == user_id))
+        return result.unique().scalars().first()
+
+    @staticmethod
+    async def find_by_view_hash(session, view_hash: str):
+        """
+        view_hash로 회원 조회
+        """
+        result = await session.execute(select(Users).filter(Users.view_hash == view_hash))
+        return result.unique().scalars().first()
@@ -0,0 +1,95 @@
+from sqlalchemy import func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+from app.models.feeds_likes import FeedsLikes
+from app.models.meals_calendar import MealsCalendars
+from app.models.meals_likes import MealsLikes
+from app.models.users import Users
+from app.models.users_stats import UsersStats
+
+STAT_COLUMNS = ("like_count", "meal_count", "public_meal_count")
+
+class UsersStatsRepository:
+
+    @staticmethod
+    def get(session, user_id: int):
+        return session.query(UsersStats).filter(UsersStats.user_id == user_id).first()
+
+    @staticmethod
+    def add(session, user_id: int, deltas: dict):
+        """
+        집계 증감 (커밋은 호출부에서)
+        - 행이 있는 회원만 DB 에서 col = GREATEST(col + delta, 0) 로 처리
+        - 행이 없으면 건너뜀 (증감값으로 행을 만들면 기존 데이터가 빠지므로, 첫 조회 시 원본 테이블에서 계산)
+        """
+        deltas = {column: delta for column, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        session.query(UsersStats).filter(UsersStats.user_id == user_id).update({
+            column: func.greatest(getattr(UsersStats, column) + delta, 0)
+            for column, delta in deltas.items()
+        }, synchronize_session=False)
+
+    @staticmethod
+    def add_many(session, column: str, user_deltas: dict):
+        """
+        여러 회원의 같은 집계 증감 ({user_id: delta})
+        """
+        for user_id, delta in user_deltas.items():
+            UsersStatsRepository.add(session, user_id, {column: delta})
+
+    @staticmethod
+    def compute(session, user_ids: list) -> dict:
+        """
+        원본 테이블 기준 집계 {user_id: {like_count, meal_count, public_meal_count}}
+        - 테이블별 GROUP BY 로 따로 집계 (조인 곱 없음)
+        """
+        stats = {user_id: dict.fromkeys(STAT_COLUMNS, 0) for user_id in user_ids}
+        if not user_ids:
+            return stats
+
+        for model in (FeedsLikes, MealsLikes):
+            rows = session.query(model.user_id, func.count(model.id)).filter(
+                model.user_id.in_(user_ids)
+            ).group_by(model.user_id).all()
+            for user_id, count in rows:
+                stats[user_id]["like_count"] += count
+
+        rows = session.query(
+            MealsCalendars.user_id,
+            func.count(MealsCalendars.id),
+            func.coalesce(func.sum(MealsCalendars.is_public == "Y"), 0),
+        ).filter(
+            MealsCalendars.user_id.in_(user_ids),
+            MealsCalendars.is_active == "Y"
+        ).group_by(MealsCalendars.user_id).all()
+        for user_id, meal_count, public_meal_count in rows:
+            stats[user_id]["meal_count"] = meal_count
+            stats[user_id]["public_meal_count"] = int(public_meal_count)
+
+        return stats
+
+    @staticmethod
+    def replace(session, stats: dict):
+        """
+        집계값 덮어쓰기 (재계산 결과 저장)
+        """
+        if not stats:
+            return
+
+        statement = mysql_insert(UsersStats).values([
+            {"user_id": user_id, **values} for user_id, values in stats.items()
+        ])
+        session.execute(statement.on_duplicate_key_update(**{
+            column: statement.inserted[column] for column in STAT_COLUMNS
+        }))
+
+    @staticmethod
+    def get_user_ids_after(session, after_id: int = 0, limit: int = 1000) -> list:
+        """
+        재계산 대상 회원 id (id 순 keyset)
+        """
+        return list(session.execute(
+            select(Users.id).where(Users.id > after_id).order_by(Users.id).limit(limit)
+        ).scalars())
@@ -15,6 +15,65 @@ router = APIRouter()
 def dashboard(request: Request, db: Session = Depends(get_db)):
     return admins_service.init_stat(db)
 
+# ====================================================================================
+# 시스템 상태 엔드포인트
+# ====================================================================================
+@router.get("/system/db-pool")
+def db_pool_status(request: Request):
+    """
+    DB 커넥션 풀 상태/대기시간 조회 API 엔드포인트
+    """
+    from app.core.db_metrics import pool_metrics
+    return CommonResponse(success=True, data=pool_metrics.snapshot())
+
+@router.get("/system/crop-pool")
+def crop_pool_status(request: Request):
+    """
+    이미지 crop 풀 대기열/처리시간 조회 API 엔드포인트
+    """
+    from app.libs.crop_jobs import crop_metrics
+    return CommonResponse(success=True, data=crop_metrics.snapshot())
+
+@router.get("/system/image-jobs")
+def image_jobs_status(request: Request):
+    """
+    업로드 이미지 변환 처리 수 / 단계별 소요시간 조회 API 엔드포인트
+    """
+    from app.libs.image_jobs import image_job_metrics
+    return CommonResponse(success=True, data=image_job_metrics.snapshot())
+
+@router.get("/system/openai")
+def openai_status(request: Request):
+    """
+    OpenAI 호출 대기열/지연시간/토큰 사용량 조회 API 엔드포인트
+    """
+    from app.libs.open_ai import openai_metrics
+    return CommonResponse(success=True, data=openai_metrics.snapshot())
+
+@router.get("/system/summary-cache")
+def summary_cache_status(request: Request):
+    """
+    AI 식단 요약 캐시 적중률 조회 API 엔드포인트
+    """
+    from app.libs.summary_cache import summary_cache
+    return CommonResponse(success=True, data=summary_cache.snapshot())
+
+@router.get("/system/summary-jobs")
+def summary_jobs_status(request: Request):
+    """
+    AI 요약 작업 실행 현황 조회 API 엔드포인트
+    """
+    from app.libs.summary_jobs import summary_jobs
+    return CommonResponse(success=True, data=summary_jobs.snapshot())
+
+@router.get("/system/prompts")
+def prompts_status(request: Request):
+    """
+    프롬프트 템플릿 목록 / hash 조회 API 엔드포인트
+    """
+    from app.libs.prompt_registry import prompt_registry
+    return CommonResponse(success=True, data=prompt_registry.snapshot())
+
 # ====================================================================================
 # 공지사항 엔드포인트
 # ====================================================================================
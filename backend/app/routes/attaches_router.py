@@ -1,22 +1,53 @@
-from fastapi import APIRouter
-from fastapi.responses import FileResponse, Response
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
+import glob
 import os
-import mimetypes
+
+from app.libs.attach_serving import file_response, get_stat, IMMUTABLE_CACHE_CONTROL
+from app.libs.file_utils import IMAGE_SIZES, SOURCE_SUFFIX, split_variant_path
+from app.libs.image_variants import get_variant
 
 router = APIRouter()
 
+def find_pending_source(full_path: str):
+    """
+    사이즈 변환 대기 중인 이미지는 원본({base}_source.*) 경로 반환
+    """
+    base, size_name = split_variant_path(full_path)
+    if not base:
+        return None
+
+    sources = glob.glob(glob.escape(base + SOURCE_SUFFIX) + ".*")
+    return sources[0] if sources else None
+
 @router.get("/{file_path:path}")
-async def serve_attach(file_path: str):
-    full_path = os.path.join("attaches", file_path)
+async def serve_attach(request: Request, file_path: str):
+    full_path = os.path.normpath(os.path.join("attaches", file_path))
 
-    if not os.path.exists(full_path):
+    # attaches 밖으로 벗어나는 경로 차단
+    if not full_path.startswith("attaches" + os.sep):
         return Response(status_code=404)
 
-    # 기본 mime 추론
-    media_type, _ = mimetypes.guess_type(full_path)
+    stat_result = get_stat(full_path)
+    if stat_result is None:
+        # 업로드 시 만들지 않은 사이즈는 원본에서 생성 (디스크 캐시)
+        base, size_name = split_variant_path(full_path)
+        try:
+            variant_path = await get_variant(base, IMAGE_SIZES[size_name]) if base else None
+        except Exception as e:
+            # 원본 손상 / 디코딩 실패 - 아래에서 원본으로 응답
+            print(f"⚠️ 이미지 사이즈 변환 실패 ({full_path}): {str(e)}")
+            variant_path = None
+        variant_stat = get_stat(variant_path) if variant_path else None
+        if variant_stat:
+            return file_response(request, variant_path, variant_stat, cache_control=IMMUTABLE_CACHE_CONTROL)
+
+        # 변환이 끝나기 전에는 원본으로 응답 (캐시 금지)
+        source_path = find_pending_source(full_path)
+        source_stat = get_stat(source_path) if source_path else None
+        if source_stat is None:
+            return Response(status_code=404)
 
-    # webp 강제 지정 (핵심)
-    if full_path.lower().endswith(".webp"):
-        media_type = "image/webp"
+        return file_response(request, source_path, source_stat, cache_control="no-store")
 
-    return FileResponse(full_path, media_type=media_type)
\ No newline at end of file
+    return file_response(request, full_path, stat_result)
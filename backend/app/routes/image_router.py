@@ -1,10 +1,14 @@
-from fastapi import APIRouter, UploadFile, File, Form
-from fastapi.responses import JSONResponse
-from PIL import Image, ImageOps
-import io
+from fastapi import APIRouter, UploadFile, File, Form, Query, Request
+from fastapi.responses import JSONResponse, Response
 import os
 import uuid
 
+from app.libs.attach_serving import file_response, get_stat, IMMUTABLE_CACHE_CONTROL
+from app.libs.image_variants import get_variant, VARIANT_WIDTHS
+from app.core.config import settings
+from app.libs import crop_jobs
+from app.libs.file_utils import VARIANT_FORMATS, read_upload_limited, probe_image, write_stream_atomic
+
 router = APIRouter()
 
 CROP_DIR = os.path.join(os.getcwd(), "attaches", "crops")
@@ -21,27 +25,32 @@ async def crop_image(
     quality: int = Form(80),
 ):
     try:
-        contents = await file.read()
-        img = Image.open(io.BytesIO(contents))
-        # EXIF 방향 적용 - React Native Image.getSize()와 동일한 기준으로 맞춤
-        img = ImageOps.exif_transpose(img)
-
-        img_w, img_h = img.size
-        # clamp to image bounds
-        origin_x = max(0, min(origin_x, img_w - 1))
-        origin_y = max(0, min(origin_y, img_h - 1))
-        width = max(1, min(width, img_w - origin_x))
-        height = max(1, min(height, img_h - origin_y))
-
-        cropped = img.crop((origin_x, origin_y, origin_x + width, origin_y + height))
+        # 청크 단위로 읽으며 크기 제한, 디코딩 전에 형식 / 해상도 확인
+        try:
+            spool, _, _ = await read_upload_limited(file, max_size=settings.UPLOAD_CROP_MAX_MB * 1024 * 1024)
+        except ValueError as e:
+            return JSONResponse(status_code=413, content={"success": False, "error": str(e)})
 
         filename = f"{uuid.uuid4().hex}.jpg"
         filepath = os.path.join(CROP_DIR, filename)
 
-        if cropped.mode in ("RGBA", "P"):
-            cropped = cropped.convert("RGB")
+        with spool:
+            try:
+                probe_image(spool)
+            except ValueError as e:
+                return JSONResponse(status_code=400, content={"success": False, "error": str(e)})
+
+            # 워커 프로세스에 넘길 원본 (처리 후 워커에서 삭제, 남은 파일은 crops 정리 배치에서 삭제)
+            source_path = os.path.join(CROP_DIR, f".{uuid.uuid4().hex}.upload")
+            write_stream_atomic(spool, source_path)
 
-        cropped.save(filepath, "JPEG", quality=quality)
+        # 디코딩 / crop / 인코딩은 crop 워커에서 처리
+        try:
+            await crop_jobs.crop(source_path, filepath, origin_x, origin_y, width, height, quality)
+        except crop_jobs.CropQueueFull as e:
+            if os.path.exists(source_path):
+                os.remove(source_path)
+            return JSONResponse(status_code=503, content={"success": False, "error": str(e)})
 
         return JSONResponse(content={
             "success": True,
@@ -52,3 +61,34 @@ async def crop_image(
             status_code=500,
             content={"success": False, "error": str(e)},
         )
+
+
+@router.get("/variants/{file_path:path}")
+async def image_variant(request: Request, file_path: str, w: int, fmt: str = Query("webp", alias="format")):
+    """
+    요청한 width / 형식 이미지 (처음 요청 시 생성 후 디스크 캐시)
+    - file_path: attaches_files.image_url 에서 /attaches/ 제외한 경로
+    ex) /image/variants/blobs/ab/cd/abcd...ef?w=400&format=jpeg
+    """
+    if w not in VARIANT_WIDTHS or fmt not in VARIANT_FORMATS:
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "error": f"지원하지 않는 크기 또는 형식입니다. (width: {VARIANT_WIDTHS}, format: {list(VARIANT_FORMATS)})"},
+        )
+
+    base_path = os.path.normpath(os.path.join("attaches", file_path))
+    if not base_path.startswith("attaches" + os.sep):
+        return Response(status_code=404)
+
+    try:
+        variant_path = await get_variant(base_path, w, fmt)
+    except Exception as e:
+        # 원본 손상 / 디코딩 실패
+        print(f"⚠️ 이미지 변환 실패 ({base_path}, w={w}, format={fmt}): {str(e)}")
+        return Response(status_code=404)
+
+    variant_stat = get_stat(variant_path) if variant_path else None
+    if not variant_stat:
+        return Response(status_code=404)
+
+    return file_response(request, variant_path, variant_stat, cache_control=IMMUTABLE_CACHE_CONTROL)
@@ -2,8 +2,9 @@ from fastapi import APIRouter, Depends, Request, Query, File, UploadFile, Form
 from typing import Optional
 import json
 from app.services import meals_service
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.common_schemas import CommonResponse
 from app.schemas.meals_schemas import CalendarCopyRequest, FeedListRequest, MealsCalendarInsertRequest
 router = APIRouter()
@@ -205,7 +206,7 @@ async def copy_meal_calendar(request: Request, body: CalendarCopyRequest, db: Se
     return await meals_service.copy_meal_calendar(db, user_hash, params)
 
 @router.post("/scrap/{meal_hash}/pin")
-async def scrap_pinned(request:Request, meal_hash: str, db: Session = Depends(get_db)):
+async def scrap_pinned(request:Request, meal_hash: str, db: AsyncSession = Depends(get_async_db)):
     user_hash = getattr(request.state, "user_hash", None)
 
     if not user_hash:
@@ -219,7 +220,7 @@ async def scrap_pinned(request:Request, meal_hash: str, db: Session = Depends(ge
     return await meals_service.scrap_pinned(db, params)
 
 @router.post("/scrap/{meal_hash}")
-async def scrap_meal(request:Request, meal_hash: str, db: Session = Depends(get_db)):
+async def scrap_meal(request:Request, meal_hash: str, db: AsyncSession = Depends(get_async_db)):
     user_hash = getattr(request.state, "user_hash", None)
 
     if not user_hash:
@@ -233,7 +234,7 @@ async def scrap_meal(request:Request, meal_hash: str, db: Session = Depends(get_
     return await meals_service.scrap_meal(db, params)
 
 @router.get('/scrap')
-async def get_scrap_list(request: Request, db: Session = Depends(get_db)):
+async def get_scrap_list(request: Request, db: AsyncSession = Depends(get_async_db)):
     user_hash = getattr(request.state, "user_hash", None)
 
     if not user_hash:
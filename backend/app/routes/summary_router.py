@@ -18,6 +18,30 @@ async def feed_summary(request: Request, body: SummaryFeedRequest, db: Session =
     params['user_hash'] = getattr(request.state, "user_hash", None)
     return await summary_service.feed_summary(db, params)
 
+""" 요약 작업 등록 (바로 job_id 반환, 결과는 /jobs/{job_id} 로 조회) """
+@router.post("/meal/temp_summary/jobs")
+async def enqueue_temp_meal_summary(request: Request, body: TempMealSummaryRequest, db: Session = Depends(get_db)):
+    params = body.dict()
+    params['user_hash'] = getattr(request.state, "user_hash", None)
+    return await summary_service.enqueue_temp_meal_summary(db, params)
+
+@router.post("/feed/item/jobs")
+async def enqueue_feed_summary(request: Request, body: SummaryFeedRequest, db: Session = Depends(get_db)):
+    params = body.dict()
+    params['user_hash'] = getattr(request.state, "user_hash", None)
+    return await summary_service.enqueue_feed_summary(db, params)
+
+""" 요약 작업 상태 / 결과 조회 (wait 초 동안 완료 대기) """
+@router.get("/jobs/{job_id}")
+async def get_summary_job(
+    request: Request,
+    job_id: str,
+    wait: float = Query(0, description="완료 대기 시간(초)"),
+    db: Session = Depends(get_db)
+):
+    user_hash = getattr(request.state, "user_hash", None)
+    return await summary_service.get_summary_job(db, user_hash, job_id, wait)
+
 """ 프론트용 : AI 요약 검색 """
 @router.get("/search")
 async def search_summary(
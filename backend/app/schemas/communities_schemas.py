@@ -13,7 +13,7 @@ class CommunityListReqest(BaseModel):
     start_date: Optional[str] = None
     end_date: Optional[str] = None
     sort_by: Optional[str] = "latest"
-    cursor: Optional[int] = None
+    cursor: Optional[str] = None
     my_only: Optional[str] = None
     limit: int = 20
 
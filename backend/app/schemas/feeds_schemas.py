@@ -9,7 +9,7 @@ class FeedListRequest(BaseModel):
     view_type: str = "all"
     limit: int = Field(10, ge=1)
     offset: int = Field(0, ge=0)
-    cursor: Optional[int] = None
+    cursor: Optional[str] = None
     title: Optional[str] = None
     nickname: Optional[str] = None
     sort_by: str = "created_at"
@@ -89,4 +89,5 @@ class FeedsResponse(BaseModel):
     user_hash: Optional[str] = None
     user: Optional[FeedsUserResponse] = None
     childs: Optional[UserChildItemSchema] = None
-    comments: List[FeedsCommentResponse] = []
\ No newline at end of file
+    comments: List[FeedsCommentResponse] = []
+    cursor: Optional[str] = None  # 다음 페이지 cursor (목록 마지막 항목에만 설정)
\ No newline at end of file
@@ -55,7 +55,7 @@ class FeedListRequest(BaseModel):
     view_type: str = "all"
     limit: int = Field(10, ge=1)
     offset: int = Field(0, ge=0)
-    cursor: Optional[int] = None
+    cursor: Optional[str] = None
     title: Optional[str] = None
     nickname: Optional[str] = None
     sort_by: str = "created_at"
@@ -77,7 +77,7 @@ class FeedListRequest(BaseModel):
         view_type: str = Query("all"),
         limit: int = Query(10, ge=1),
         offset: int = Query(0, ge=0),
-        cursor: Optional[int] = Query(None),
+        cursor: Optional[str] = Query(None),
         title: Optional[str] = Query(None),
         nickname: Optional[str] = Query(None),
         sort_by: str = Query("created_at"),
@@ -138,6 +138,7 @@ class MealsCalendarResponse(BaseModel):
     view_hash: str
     user:FeedsUserResponse
     childs: Optional[UserChildItemSchema] = None
+    cursor: Optional[str] = None  # 다음 페이지 cursor (목록 마지막 항목에만 설정)
 class MealItem(BaseModel):
     meal_id: int
     category_code: str
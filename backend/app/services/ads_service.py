@@ -1,11 +1,94 @@
 from app.repository.ads_repository import AdsRepository
-from app.repository.ads_clicks_logs_repository import AdsClicksLogsRepository
 from app.repository.advertisers_repository import AdvertiserRepository
 from app.schemas.common_schemas import CommonResponse
+from app.core.config import settings
+from app.core.ads_click_buffer import ads_click_buffer
+from app.libs.cache_utils import TTLCache
+from datetime import date
 import hashlib
 
 from app.services.attaches_files_service import upload_file, save_upload_file
 
+# 피드 목록 N개당 광고 1개 삽입
+AD_INTERLEAVE_EVERY = 7
+
+# 날짜별 노출 광고 인벤토리 (광고 등록/수정 시 무효화, 그 외에는 TTL 만료 시 재조회)
+ads_inventory_cache = TTLCache(ttl=settings.ADS_INVENTORY_CACHE_TTL, maxsize=4)
+
+def invalidate_ads_inventory():
+    ads_inventory_cache.invalidate()
+
+def load_active_ads(db, period_date):
+    """
+    해당 날짜에 노출 가능한 광고 조회 (캐시 저장용 dict 로 변환)
+    """
+    ads_list, total_count = AdsRepository.get_ads_list(db, {
+        "period_date": period_date,
+        "is_active": "Y",
+    })
+
+    inventory = []
+    if total_count > 0:
+        for ad, account_image, account_name, company, advertiser_view_hash, account_id, ad_images in ads_list:
+            inventory.append({
+                "id": ad.id,
+                "contents": ad.contents,
+                "images": ad_images.split(",") if ad_images else [],
+                "view_hash": ad.view_hash,
+                "target_link": ad.target_link,
+                "profile_image": account_image,
+                "company": company,
+                "account_id": account_id,
+                "advertiser_view_hash": advertiser_view_hash,
+            })
+
+    return tuple(inventory)
+
+def get_active_ads_inventory(db, period_date=None):
+    """
+    오늘 노출할 광고 목록 (캐시)
+    """
+    period_date = period_date or date.today()
+    return ads_inventory_cache.get_or_set(period_date, lambda: load_active_ads(db, period_date))
+
+def build_feed_ad_item(ad: dict, image_key: str = "images"):
+    """
+    목록 삽입용 광고 항목
+    - image_key: 목록별 이미지 필드명 (식단 피드: image_url, 커뮤니티: images)
+    """
+    return {
+        "is_ad": True,
+        "id": ad["id"],
+        "contents": ad["contents"],
+        image_key: list(ad["images"]),
+        "view_hash": ad["view_hash"],
+        "target_link": ad["target_link"],
+        "user": {
+            "profile_image": ad["profile_image"],
+            "nickname": ad["company"],
+            "id": ad["account_id"],
+            "user_hash": ad["advertiser_view_hash"]
+        }
+    }
+
+def interleave_ads(db, items: list, image_key: str = "images", every: int = AD_INTERLEAVE_EVERY):
+    """
+    목록 every 개마다 광고 1개씩 분산 삽입 (광고가 남아있을 경우)
+    """
+    inventory = get_active_ads_inventory(db)
+    if not inventory:
+        return items
+
+    final_result = []
+    ad_index = 0
+    for i, item in enumerate(items):
+        final_result.append(item)
+        if (i + 1) % every == 0 and ad_index < len(inventory):
+            final_result.append(build_feed_ad_item(inventory[ad_index], image_key))
+            ad_index += 1
+
+    return final_result
+
 def validate_body(body):
     if not body.advertiser_hash:
         raise ValueError("광고주 해시는 필수입니다.")
@@ -76,6 +159,7 @@ async def add_ads(db, body, image_files=None):
                 await save_upload_file(db, "Ads", ad.id, upload_result)
 
         db.commit()
+        invalidate_ads_inventory()
         return CommonResponse(success=True, message="광고가 성공적으로 추가되었습니다.")
 
     except Exception as e:
@@ -114,6 +198,7 @@ async def edit_ads(db, view_hash, body, image_files=None):
                 await save_upload_file(db, "Ads", ad.id, upload_result)
 
         db.commit()
+        invalidate_ads_inventory()
         return CommonResponse(success=True, message="광고가 성공적으로 수정되었습니다.")
 
     except Exception as e:
@@ -172,20 +257,13 @@ async def click_ad(db, user_hash, view_hash, ip, user_agent):
         if not ad:
             raise ValueError("존재하지 않는 광고입니다.")
 
-        # 클릭 수 증가
-        new_click_count = ad.click_count + 1
-        updated_ad = AdsRepository.set_click_count(db, ad.id, new_click_count)
+        # 클릭 수 증가 / 클릭 로그 저장은 버퍼에 기록 후 주기적으로 일괄 반영
+        ads_click_buffer.add(ad.id, user.id, ip, user_agent)
 
-        # 클릭 로그 저장
-        add_log_result = AdsClicksLogsRepository.add_log(db, ad.id, user.id, ip, user_agent)
-        if not updated_ad or not add_log_result:
-            raise Exception("광고 클릭 기록에 실패했습니다.")
-
-        db.commit()
         return CommonResponse(
             success=True,
             message="광고 링크로 이동합니다.",
-            data={"target_link": updated_ad.target_link}
+            data={"target_link": ad.target_link}
         )
 
     except ValueError as ve:
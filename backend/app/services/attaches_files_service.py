@@ -6,6 +6,14 @@ import os
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.repository.attaches_files_repository import AttachesFilesRepository
+from app.services.meals_feed_projections_service import refresh_meal_feed_projection
+from app.libs import image_jobs
+from app.libs.image_variants import variant_cache
+from app.libs.file_utils import SOURCE_SUFFIX, get_blob_dir, has_all_variants
+
+# attaches_files 로 참조를 관리하는 모델 - 내용 주소 저장소(attaches/blobs) 사용
+# (Users / Advertiser 등 자체 컬럼에 경로를 저장하는 모델은 참조 수 관리가 안되므로 기존 경로 사용)
+BLOB_MODELS = {"Meals", "Communities", "Ads"}
 
 def get_attache_files_by_model_id(db, model: str, model_id: int):
     attache_list = AttachesFilesRepository.get_attache_files_by_model_id(db, model=model, model_id=model_id)
@@ -23,6 +31,9 @@ async def upload_file(model_id: int, file, path: str = "Meals"):
     ex) /attaches/Feeds/45/12345/20260123120000_abc123_medium.webp
 
     DB에는 확장자와 사이즈 접미사 없이 저장: /attaches/Feeds/45/12345/20260123120000_abc123
+
+    BLOB_MODELS 는 내용 해시 경로에 저장 (같은 내용은 파일을 다시 만들지 않음)
+    ex) /attaches/blobs/ab/cd/abcd...ef_medium.webp
     """
     from app.libs.file_utils import save_upload_file_with_resize, get_file_url
 
@@ -38,7 +49,9 @@ async def upload_file(model_id: int, file, path: str = "Meals"):
         )
 
         # 이미지 리사이징 및 저장
-        success, result, original_filename, created_files = await save_upload_file_with_resize(file, destination_path)
+        success, result, original_filename, created_files = await save_upload_file_with_resize(
+            file, destination_path, content_addressed=path in BLOB_MODELS
+        )
 
         if not success:
             return None
@@ -55,11 +68,13 @@ async def upload_file(model_id: int, file, path: str = "Meals"):
         # 이미지 크기 정보 (medium 사이즈 기준)
         medium_file = next((f for f in created_files if f['size'] == 'medium'), created_files[0])
 
-        # DB에 이미지 정보 저장
+        # DB에 이미지 정보 저장 (사이즈 변환 대기 중이면 status P)
         image_params = {
             "image_url": "/" + image_path,
             "width": medium_file['width'],
             "height": medium_file['height'],
+            "status": "P" if medium_file.get('pending') else "R",
+            "content_hash": medium_file.get('content_hash'),
         }
 
         return image_params
@@ -77,16 +92,33 @@ async def save_upload_file(db, model: str, model_id: int, result: dict):
     if "image_url" not in result:
         raise ValueError("이미지 URL 정보가 누락되었습니다.")
 
-    AttachesFilesRepository.create(
+    new_file = AttachesFilesRepository.create(
         db,
         model=model,
         model_id=model_id,
         image_url=result['image_url'],
         width=result['width'],
         height=result['height'],
-        sort_order=result.get('sort_order', 0)
+        sort_order=result.get('sort_order', 0),
+        status=result.get('status', "R"),
+        content_hash=result.get('content_hash')
     )
 
+    # 공유 파일 재사용 - 행 추가 후(삭제 중인 같은 해시가 있으면 그 커밋까지 대기) 파일이 남아 있는지 확인
+    if new_file.content_hash:
+        db.flush()
+        if not blob_exists(new_file.content_hash):
+            raise ValueError("이미지 저장에 실패했습니다. 다시 시도해주세요.")
+
+    # 행 생성 전에 변환이 끝난 경우
+    if new_file.status == "P" and image_jobs.is_ready(new_file.image_url):
+        new_file.status = "R"
+        db.flush()
+
+    # 피드 목록 대표 이미지 갱신
+    if model == "Meals":
+        refresh_meal_feed_projection(db, model_id, ["image"])
+
 """
 해당 경로의 이미지 파일을 삭제하는 메소드
 """
@@ -100,10 +132,15 @@ def delete_attache_files_by_model_id(attache_files: list, is_delete: bool = Fals
     }
 
     for file in attache_files:
+        # 공유 파일은 참조 수가 0 이 될 때 delete_unreferenced_blobs 에서 삭제
+        if file.content_hash:
+            continue
+
         abs_base = os.path.join(BASE_DIR, file.image_url.lstrip('/').replace('/', os.sep))
 
         try:
-            matching_files = glob(abs_base + '_*.webp')
+            # 사이즈 변환 대기 중이면 원본(_source.*) 포함
+            matching_files = glob(abs_base + '_*.webp') + glob(abs_base + SOURCE_SUFFIX + '.*')
 
             if not matching_files:
                 result["missing_files"] += 1
@@ -132,11 +169,84 @@ def delete_attache_files_by_model_id(attache_files: list, is_delete: bool = Fals
                     os.rename(file_path, new_path)
                     result["renamed_files"] += 1
 
+            # 요청 시 생성된 사이즈 캐시
+            if is_delete:
+                variant_cache.remove_for(file.image_url.lstrip('/'))
+
         except Exception as e:
             result["error"] = str(e)
 
     return result
 
+def blob_exists(content_hash: str) -> bool:
+    """
+    공유 파일이 남아 있는지 (사이즈 파일이 모두 있거나, 변환 대기 중인 원본이 있음)
+    """
+    save_dir = os.path.join(BASE_DIR, get_blob_dir(content_hash))
+    return has_all_variants(content_hash, save_dir) or bool(glob(os.path.join(save_dir, content_hash + SOURCE_SUFFIX + '.*')))
+
+def delete_unreferenced_blobs(session, content_hashes: list):
+    """
+    참조하는 attaches_files 행이 남지 않은 공유 파일 삭제 (행 삭제 flush 이후, 커밋 전에 호출)
+    - 참조 수는 잠금 조회 - 같은 내용의 동시 업로드는 이 트랜잭션 커밋까지 행 추가를 대기하고,
+      이후 save_upload_file 에서 파일이 없음을 확인
+    """
+    result = {"deleted_files": 0, "error": None}
+
+    content_hashes = list({content_hash for content_hash in content_hashes if content_hash})
+    if not content_hashes:
+        return result
+
+    ref_counts = AttachesFilesRepository.count_by_content_hashes(session, content_hashes, for_update=True)
+
+    for content_hash in content_hashes:
+        if ref_counts.get(content_hash, 0) > 0:
+            continue
+
+        abs_base = os.path.join(BASE_DIR, get_blob_dir(content_hash), content_hash)
+        try:
+            for file_path in glob(abs_base + '_*.webp') + glob(abs_base + SOURCE_SUFFIX + '.*'):
+                os.remove(file_path)
+                result["deleted_files"] += 1
+            variant_cache.remove_for(os.path.join(get_blob_dir(content_hash), content_hash))
+        except Exception as e:
+            result["error"] = str(e)
+
+    return result
+
+def collect_attache_file_paths(session, attache_files: list) -> list:
+    """
+    영구 삭제할 실제 파일 경로 수집 (삭제 배치의 일괄 unlink 용)
+    - attaches_files 행 삭제 flush 이후 호출
+    - 공유 파일은 제외 - 커밋 후 삭제하면 동시 업로드와 겹칠 수 있으므로 delete_unreferenced_blobs 로 커밋 전에 삭제
+    - 파일마다 glob 하지 않고 디렉토리별로 한 번만 scandir
+    """
+    # 디렉토리 -> 파일명 접두어 ({base}_ : 사이즈 / 원본(_source) / soft delete(_delete) 파일 모두 포함)
+    prefixes = {}
+
+    def add_base(base_path: str):
+        for abs_base in (
+            os.path.join(BASE_DIR, base_path),
+            os.path.join(BASE_DIR, variant_cache.base_for(base_path)),
+        ):
+            prefixes.setdefault(os.path.dirname(abs_base), set()).add(os.path.basename(abs_base) + "_")
+
+    for file in attache_files:
+        if not file.content_hash:
+            add_base(file.image_url.lstrip('/').replace('/', os.sep))
+
+    paths = []
+    for dir_path, dir_prefixes in prefixes.items():
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.startswith(tuple(dir_prefixes)):
+                        paths.append(entry.path)
+        except FileNotFoundError:
+            continue
+
+    return paths
+
 def soft_delete_file_by_model_id(session, model: str, model_id: int):
 
     result = {
@@ -160,6 +270,8 @@ def soft_delete_file_by_model_id(session, model: str, model_id: int):
     # DB 삭제
     try:
         AttachesFilesRepository.soft_delete_attache_files(session, model=model, model_id=model_id)
+        if model == "Meals":
+            refresh_meal_feed_projection(session, model_id, ["image"])
         result["db_deleted"] = True
         result["success"] = True
 
@@ -195,6 +307,12 @@ def hard_delete_file(session, model: str, model_id: int):
             session, model=model, model_id=model_id
         )
 
+        # 참조 수가 0 이 된 공유 파일 삭제
+        blob_result = delete_unreferenced_blobs(session, [file.content_hash for file in attache_files])
+        result["deleted_files"] += blob_result["deleted_files"]
+        if model == "Meals":
+            refresh_meal_feed_projection(session, model_id, ["image"])
+
         result["db_deleted"] = True
         result["success"] = True
 
@@ -209,6 +327,16 @@ def copy_attache_file(origin_model: str, origin_model_instance, target_model: st
     from datetime import datetime
     import shutil
 
+    # 내용 주소 파일은 복사 없이 같은 파일을 참조 (행만 추가)
+    if origin_model_instance.content_hash:
+        return {
+            "image_url": origin_model_instance.image_url,
+            "width": origin_model_instance.width,
+            "height": origin_model_instance.height,
+            "status": origin_model_instance.status,
+            "content_hash": origin_model_instance.content_hash,
+        }
+
     try:
         import glob
         original_file_base = origin_model_instance.image_url.lstrip('/')
@@ -11,7 +11,8 @@ from app.services.meals_comments_service import build_comment_tree
 from app.services.users_childs_service import get_agent_childs
 from app.services.communities_comments_service import get_comment_by_hash, sort_delete_comment, validate_comment_by_hash, update_community_comment, crreate_community_comment, get_community_comments_list
 from app.services.attaches_files_service import  upload_file, save_upload_file, get_attache_files_by_model_id
-from app.repository.ads_repository import AdsRepository
+from app.services.ads_service import interleave_ads
+from app.services.counters_service import increase_view_count, change_like_count
 
 def validate_community_by_hash(db, community_hash):
     community = get_community_by_hash(db, community_hash)
@@ -54,9 +55,9 @@ def get_parent_id_by_hash(db, parent_hash):
 
     return parent_id
 
-def increate_community_view_count(db, community):
-    """커뮤니티 글 조회수 증가 서비스 함수"""
-    CommunitiesRepository.increase_view_count(db, community, is_commit=False)
+def increate_community_view_count(db, community, viewer_key=None):
+    """커뮤니티 글 조회수 증가 서비스 함수 (카운터 버퍼에 기록 후 주기적으로 반영)"""
+    increase_view_count(community, viewer_key=viewer_key)
 
 def get_community_list(db, user_hash, params) -> CommonResponse:
     """커뮤니티 리스트 조회 서비스 함수"""
@@ -84,6 +85,7 @@ def get_community_list(db, user_hash, params) -> CommonResponse:
 
         # 베스트 글 조회
         # - 각 카테고리 별로 좋아요 수 상위 3개 글 조회
+        next_cursor = None
         if db_params["category_code"] == 9999:
             category_list = get_category_list(db, {"type": "TOPIC_GROUP", "is_active": "Y"})
 
@@ -99,57 +101,21 @@ def get_community_list(db, user_hash, params) -> CommonResponse:
             community_list = CommunitiesRepository.get_community_list(db, user.id, db_params)
             communities = [item._data for item in serialize_communities_list(community_list)]
 
-        total_cummunity_count = CommunitiesRepository.get_community_count(db, user.id, db_params)
+            # 다음 페이지 cursor (정렬 키 전체를 인코딩한 토큰)
+            if community_list:
+                next_cursor = CommunitiesRepository.build_paginator(db_params.get("sort_by")).encode(community_list[-1])
 
-        # 광고 데이터를 조회
-        # meal_list 7개당 광고 1개 삽입
-        from datetime import date
-        today = date.today()
+        total_cummunity_count = CommunitiesRepository.get_community_count(db, user.id, db_params)
 
-        params = {
-            "period_date": today,
-            "is_active": "Y",
-        }
-        ads_list, total_count = AdsRepository.get_ads_list(db, params)
-
-        if total_count > 0:
-            # 광고 데이터 리스트 생성
-            ads_to_insert = []
-            for ad, account_image, account_name, company, advertiser_view_hash, account_id, ad_images in ads_list:
-                ad_data = {
-                    "is_ad": True,
-                    "id": ad.id,
-                    "contents": ad.contents,
-                    "images": ad_images.split(","),
-                    "view_hash": ad.view_hash,
-                    "target_link": ad.target_link,
-                    "user": {
-                        "profile_image": account_image,
-                        "nickname": company,
-                        "user_hash": advertiser_view_hash
-                    }
-                }
-                ads_to_insert.append(ad_data)
-
-            # 7개마다 광고 1개씩 분산 삽입
-            if ads_to_insert:
-                final_result = []
-                ad_index = 0
-                for i, meal in enumerate(communities):
-                    final_result.append(meal)
-                    # 7개의 식단 후에 광고 삽입 (광고가 남아있을 경우)
-                    if (i + 1) % 7 == 0 and ad_index < len(ads_to_insert):
-                        final_result.append(ads_to_insert[ad_index])
-                        ad_index += 1
-
-                communities = final_result
+        # 광고 삽입 (광고 인벤토리는 날짜별 캐시 사용)
+        communities = interleave_ads(db, communities, image_key="images")
 
         return CommonResponse(
             success=True,
             data={
                 "communities": communities,
                 "total_count": total_cummunity_count,
-                "cursor": communities[-1]['id'] if communities else None,
+                "cursor": next_cursor,
             }
         )
 
@@ -214,10 +180,7 @@ def get_community_detail(db, user_hash, community_hash) -> CommonResponse:
 
         target_user = validate_user_id(db, community.user_id)
 
-        increate_community_view_count(db, community)
-
-        db.commit()
-        db.refresh(community)
+        increate_community_view_count(db, community, viewer_key=user.id)
 
         user_child = get_agent_childs(db, {"user_id": community.user_id})
 
@@ -345,18 +308,14 @@ def like_community(db, user_hash, community_hash) -> CommonResponse:
 
             db.delete(existing_like)
             # 좋아요 수 감소
-            if community.like_count > 0:
-                community.like_count -= 1
-            else:
-                community.like_count = 0
+            change_like_count(db, community, -1)
         else:
 
             CommunitiesLikes.create(db, community.id, user.id)
             # 좋아요 수 증가
-            community.like_count += 1
+            change_like_count(db, community, 1)
 
         db.commit()
-        db.refresh(community)
 
     except Exception as e:
         return CommonResponse(success=False, message=str(e))
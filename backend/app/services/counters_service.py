@@ -0,0 +1,32 @@
+"""
+조회수/좋아요 수 카운터 service
+- 조회수: counter_buffer 에 모아서 주기적으로 반영 (viewer_key 기준 중복 조회 제외)
+- 좋아요 수: 좋아요 행 변경과 같은 트랜잭션에서 DB 측 col = col + delta 로 즉시 반영
+- 응답에 쓰이는 ORM 객체 값은 set_committed_value 로만 갱신 (dirty 로 잡혀 절대값 UPDATE 되지 않도록)
+"""
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.counter_buffer import counter_buffer
+from app.repository.counters_repository import CountersRepository
+
+def increase_view_count(row, viewer_key=None) -> bool:
+    """
+    조회수 증가 (버퍼 기록)
+    - 반환값: 집계 여부 (중복 조회면 False)
+    """
+    model = type(row)
+    counted = counter_buffer.incr(model, row.id, "view_count", viewer_key=viewer_key)
+
+    # 아직 반영되지 않은 증가분을 포함한 값으로 응답
+    pending = counter_buffer.pending(model, row.id, "view_count")
+    set_committed_value(row, "view_count", (row.view_count or 0) + pending)
+
+    return counted
+
+def change_like_count(db, row, delta: int):
+    """
+    좋아요 수 증감 (호출부 트랜잭션에서 커밋)
+    """
+    model = type(row)
+    CountersRepository.add(db, model, row.id, "like_count", delta)
+    set_committed_value(row, "like_count", CountersRepository.get_value(db, model, row.id, "like_count"))
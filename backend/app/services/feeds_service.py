@@ -13,6 +13,7 @@ from app.services.users_childs_service import get_agent_childs, validate_agent_c
 from app.services.denies_users_service import get_denies_user_id_list
 from app.services.attaches_files_service import copy_attache_file, get_attache_files_by_model_id, save_upload_file
 from app.services.users_childs_allergies_service import get_user_child_allergies
+from app.services import counters_service
 
 """
 부모 hash 가 넘어오면 부모 id 를 반환
@@ -27,12 +28,11 @@ def get_parent_id_by_hash(db, parent_hash):
 
     return parent_comment.id
 
-def increase_view_count(db, feed, is_commit=True):
-    feed.view_count += 1
-    if is_commit:
-        db.commit()
-    else:
-        db.flush()  # 변경사항을 DB에 반영하지만 커밋하지는 않음
+def increase_view_count(db, feed, viewer_key=None):
+    """
+    조회수 증가 - 카운터 버퍼에 기록 후 주기적으로 반영 (읽기 경로에서 쓰기 트랜잭션 없음)
+    """
+    counters_service.increase_view_count(feed, viewer_key=viewer_key)
     return
 
 
@@ -83,7 +83,7 @@ async def copy_feed(db, user_hash: str, params):
         if not new_calcendar:
             raise Exception("식단 복사에 실패했습니다.")
 
-        # 이미지 복사 - 기존 이미지의 파일을 물리적으로 복사하여 새로운 식단에 연결
+        # 이미지 복사 - 내용 주소 파일은 참조만 추가, 이전 업로드 파일은 물리적으로 복사하여 새로운 식단에 연결
         attache_files = get_attache_files_by_model_id(db, "Meals", target_meal.id)
 
         for feeds_image in attache_files:
@@ -1,4 +1,5 @@
 from app.repository.ingredients_mappers_repository import IngredientsMappersRepository
+from app.services.meals_feed_projections_service import refresh_meal_feed_projection
 
 def get_ingredient_mappers_by_meal_id(db, meal_id):
     return IngredientsMappersRepository.get_ingredient_mappers_by_meal_id(db, meal_id)
@@ -11,10 +12,14 @@ def insert_ingredient_mapper(db, model_id, ingredients):
             "score": ingredient.get("score", 0)
         })
         db.flush()
+
+    # 피드 목록 재료 태그 갱신
+    refresh_meal_feed_projection(db, model_id, ["tags"])
     return True
 
 def delete_ingredient_mapper(db, model_id):
     IngredientsMappersRepository.delete_mapper(db, model_id)
+    refresh_meal_feed_projection(db, model_id, ["tags"])
 
 
 def get_ingredient_mappers_by_meal_id(db, meal_id):
@@ -1,24 +1,68 @@
+import threading
+import time
 
+from app.core.config import settings
+from app.libs.nutrient_matrix import NutrientMatrix
 from app.repository.ingredients_nutritions_repository import IngredientsNutritionsRepository
-def get_ingredient_mapper(db, ingredient):
-    result = IngredientsNutritionsRepository.get_ingredient_mapper(db, ingredient.get("ingredient_id"))
-    # 직렬화
+from app.repository.ingredients_repository import IngredientsRepository
+
+# 재료 × 영양소 행렬 (워커 프로세스 공용)
+# - NUTRIENT_MATRIX_CHECK_INTERVAL 초마다 버전 쿼리 1회로 변경 여부 확인, 바뀐 경우만 다시 적재
+_matrix = None
+_checked_at = 0.0
+_matrix_lock = threading.Lock()
+
+def get_nutrient_matrix(db) -> NutrientMatrix:
+    global _matrix, _checked_at
+
+    matrix = _matrix
+    if matrix is not None and time.monotonic() - _checked_at < settings.NUTRIENT_MATRIX_CHECK_INTERVAL:
+        return matrix
 
-    data = {}
-    for r in result:
-        name = r.ingredient_name
-        # 100g 담 기준이기 떄문에 score 계산 필요
-        amount = float(r.amount) * ingredient.get("score", 0)  # score는 0~1 사이의 소수
+    with _matrix_lock:
+        # 대기 중 다른 스레드가 갱신했으면 그대로 사용
+        if _matrix is not None and time.monotonic() - _checked_at < settings.NUTRIENT_MATRIX_CHECK_INTERVAL:
+            return _matrix
 
-        if name not in data:
-            data[name] = []
+        version = IngredientsNutritionsRepository.get_version(db)
+        if _matrix is None or _matrix.version != version:
+            rows = IngredientsRepository.get_ingredients_join_nutrient(db)
+            _matrix = NutrientMatrix.from_rows(rows, version)
 
-        data[name].append({
-            "amount": amount,
-            "nutrient_name": r.nutrient_name,
-            "nutrient_unit": r.nutrient_unit,
-            "ingredient_name": r.ingredient_name
-        })
+        _checked_at = time.monotonic()
+        return _matrix
 
-    return data
+def invalidate_nutrient_matrix():
+    global _checked_at
+    _checked_at = 0.0
 
+def get_nutrient_totals(db, pairs) -> dict:
+    """
+    [(ingredient_id, score)] -> 영양소 합계 {영양소명: {amount, unit}}
+    - score 는 100g 대비 비율 (영양소 함량이 100g 기준)
+    """
+    matrix = get_nutrient_matrix(db)
+    return matrix.to_named(matrix.total(pairs))
+
+def get_ingredient_mapper(db, ingredient):
+    matrix = get_nutrient_matrix(db)
+    ingredient_id = ingredient.get("ingredient_id")
+
+    # 100g 담 기준이기 떄문에 score 계산 필요
+    nutrients = matrix.ingredient_nutrients(ingredient_id, ingredient.get("score", 0))  # score는 0~1 사이의 소수
+    if not nutrients:
+        return {}
+
+    # 직렬화
+    name = matrix.ingredient_names[ingredient_id]
+    return {
+        name: [
+            {
+                "amount": info["amount"],
+                "nutrient_name": nutrient_name,
+                "nutrient_unit": info["unit"],
+                "ingredient_name": name
+            }
+            for nutrient_name, info in nutrients.items()
+        ]
+    }
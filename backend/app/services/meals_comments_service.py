@@ -1,4 +1,5 @@
 from app.repository.meals_comments_repository import MealsCommentsRepository
+from app.services.meals_feed_projections_service import refresh_meal_feed_projection
 
 """댓글 트리 구조 생성 - Pydantic 모델용"""
 def build_comment_tree(comments):
@@ -36,6 +37,10 @@ def create_meal_comment(db, params: dict):
     if not new_comment:
         raise Exception("댓글 생성에 실패했습니다.")
 
+    # 피드 목록 댓글 수 갱신
+    refresh_meal_feed_projection(db, new_comment.meal_id, ["comment"])
+    db.commit()
+
     return new_comment
 
 """
@@ -48,8 +53,13 @@ def delete_meal_comment(db, comment, user_id: int):
     if comment.user_id != user_id:
         raise Exception("댓글 삭제 권한이 없습니다.")
 
-    if not MealsCommentsRepository.soft_delete(db, comment):
+    if not MealsCommentsRepository.soft_delete(db, comment, is_commit=False):
         raise Exception("댓글 삭제에 실패했습니다.")
+
+    # 피드 목록 댓글 수 갱신 (커밋은 호출부에서)
+    refresh_meal_feed_projection(db, comment.meal_id, ["comment"])
+    return True
+
 """
 댓글 리스트
 """
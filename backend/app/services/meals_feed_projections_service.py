@@ -0,0 +1,32 @@
+"""
+피드 목록용 식단 집계(meals_feed_projection) service
+- 쓰기 경로에서 호출하여 해당 식단의 집계만 갱신 (커밋은 호출부 트랜잭션을 따름)
+"""
+from app.repository.meals_feed_projections_repository import MealsFeedProjectionsRepository
+
+PROJECTION_PARTS = {
+    "comment": MealsFeedProjectionsRepository.refresh_comment_count,
+    "image": MealsFeedProjectionsRepository.refresh_image,
+    "tags": MealsFeedProjectionsRepository.refresh_tags,
+    "scrap": MealsFeedProjectionsRepository.refresh_scrap,
+}
+
+def refresh_meal_feed_projection(db, meal_id: int, parts: list = None):
+    """
+    식단 1건의 집계 갱신
+    - parts: ["comment", "image", "tags", "scrap"] 중 변경된 항목 (None 이면 전체)
+    """
+    for part in parts or PROJECTION_PARTS.keys():
+        PROJECTION_PARTS[part](db, [meal_id])
+    db.flush()
+
+def rebuild_meal_feed_projection(db):
+    """
+    전체 식단 집계 재구성 (최초 적재 / 정합성 보정용)
+    """
+    for refresh in PROJECTION_PARTS.values():
+        refresh(db, None)
+    db.flush()
+
+def delete_meal_feed_projection(db, meal_ids: list):
+    MealsFeedProjectionsRepository.delete_by_meal_ids(db, meal_ids)
@@ -1,6 +1,8 @@
 from app.repository.meals_likes_repository import MealsLikesRepository
 from app.schemas.common_schemas import CommonResponse
 from app.schemas.meals_likes_schemas import LikeToggleResponse
+from app.services.counters_service import change_like_count
+from app.services.users_stats_service import change_like_stats
 
 def get_likes_by_user_id(db, user_id):
     result = MealsLikesRepository.get_likes_by_user_id(db, user_id)
@@ -21,17 +23,17 @@ def delete_meal_like(db, meal_calendar, user_id):
 def get_list_of_likes_by_user(db, user_id, limit=30, offset=0):
     return MealsLikesRepository.get_like_user_id(db, user_id, limit, offset)
 
-def increase_meal_like_count(meal_calendar):
+def increase_meal_like_count(db, meal_calendar):
     """
     좋아요 증가
     """
-    meal_calendar.like_count += 1
+    change_like_count(db, meal_calendar, 1)
 
-def decrease_meal_like_count(meal_calendar):
+def decrease_meal_like_count(db, meal_calendar):
     """
     좋아요 감소
     """
-    meal_calendar.like_count = max(0, meal_calendar.like_count - 1)
+    change_like_count(db, meal_calendar, -1)
 
 def set_toggle_like_process(db, user_id: int, meal_calendar):
 
@@ -42,13 +44,15 @@ def set_toggle_like_process(db, user_id: int, meal_calendar):
             # 좋아요 삭제
             delete_meal_like(db, meal_calendar, user_id)
             # 식단의 좋아요 카운트 감소
-            decrease_meal_like_count(meal_calendar)
+            decrease_meal_like_count(db, meal_calendar)
+            change_like_stats(db, user_id, -1)
             is_liked = False
         else:
             # 좋아요 추가
             create_meal_like(db, meal_calendar, user_id)
             # 식단의 좋아요 카운트 증가
-            increase_meal_like_count(meal_calendar)  # 좋아요 카운트 증가
+            increase_meal_like_count(db, meal_calendar)  # 좋아요 카운트 증가
+            change_like_stats(db, user_id, 1)
             is_liked = True
 
         # 한 번에 커밋
@@ -0,0 +1,150 @@
+"""
+삭제된 식단 영구 삭제 (set_clear_meal_data 배치)
+- 대상 식단 id 를 청크 단위(keyset)로 가져와 테이블별 DELETE ... WHERE meal_id IN (...) 로 일괄 삭제
+- 청크마다 커밋 후 실제 파일은 스레드풀에서 병렬 unlink
+  (참조가 없어진 공유 파일(attaches/blobs)은 동시 업로드와 겹치지 않도록 잠금 조회 후 커밋 전에 삭제)
+- 체크포인트 파일에 마지막 처리 id / 아직 지우지 못한 파일 목록을 기록 -> 중단 후 재실행 시 이어서 처리
+"""
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.repository.attaches_files_repository import AttachesFilesRepository
+from app.repository.ingredients_mappers_repository import IngredientsMappersRepository
+from app.repository.meals_calendars_repository import MealsCalendarsRepository
+from app.repository.meals_comments_repository import MealsCommentsRepository
+from app.repository.meals_feed_projections_repository import MealsFeedProjectionsRepository
+from app.repository.meals_likes_repository import MealsLikesRepository
+from app.repository.meals_scraps_repository import MealsScrapsRepository
+from app.services.attaches_files_service import collect_attache_file_paths, delete_unreferenced_blobs
+from app.services.users_stats_service import remove_like_stats_for_meals
+
+
+def _load_checkpoint(checkpoint_path: str) -> dict:
+    if not os.path.exists(checkpoint_path):
+        return {}
+    try:
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ 체크포인트 읽기 실패 (처음부터 진행): {str(e)}")
+        return {}
+
+
+def _save_checkpoint(checkpoint_path: str, checkpoint: dict):
+    os.makedirs(os.path.dirname(checkpoint_path) or ".", exist_ok=True)
+    temp_path = f"{checkpoint_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    os.replace(temp_path, checkpoint_path)
+
+
+def _unlink(path: str) -> bool:
+    try:
+        os.remove(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def unlink_files(paths: list, workers: int = 8) -> int:
+    """
+    파일 병렬 삭제, 삭제한 파일 수 반환 (이미 없는 파일은 제외)
+    """
+    if not paths:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return sum(executor.map(_unlink, paths))
+
+
+def delete_meals_chunk(db, meal_ids: list) -> dict:
+    """
+    식단 id 묶음과 연관 데이터 삭제 (커밋은 호출부에서), 삭제할 파일 경로 반환
+    """
+    # 사라지는 좋아요만큼 누른 회원의 집계 차감
+    remove_like_stats_for_meals(db, meal_ids)
+
+    rows = {
+        "meals_likes": MealsLikesRepository.delete_by_meal_ids(db, meal_ids),
+        "meals_comments": MealsCommentsRepository.delete_by_meal_ids(db, meal_ids),
+        "meals_scraps": MealsScrapsRepository.delete_by_meal_ids(db, meal_ids),
+        "ingredients_mappers": IngredientsMappersRepository.delete_by_meal_ids(db, meal_ids),
+    }
+
+    attache_files = AttachesFilesRepository.get_by_model_ids(db, "Meals", meal_ids)
+    rows["attaches_files"] = AttachesFilesRepository.hard_delete_by_model_ids(db, "Meals", meal_ids)
+
+    MealsFeedProjectionsRepository.delete_by_meal_ids(db, meal_ids)
+    rows["meals_calendars"] = MealsCalendarsRepository.delete_by_ids(db, meal_ids)
+    db.flush()
+
+    # 행 삭제 이후 참조 수 계산 - 참조가 없어진 공유 파일은 잠금 조회 후 커밋 전에 삭제
+    blob_result = delete_unreferenced_blobs(db, [file.content_hash for file in attache_files])
+    if blob_result["error"]:
+        print(f"⚠️ 공유 이미지 파일 삭제 실패: {blob_result['error']}")
+    file_paths = collect_attache_file_paths(db, attache_files)
+
+    return {"rows": rows, "file_paths": file_paths, "blob_files": blob_result["deleted_files"]}
+
+
+def purge_deleted_meals(db, search_date: str, chunk_size: int = 500, checkpoint_path: str = None, unlink_workers: int = 8) -> dict:
+    """
+    deleted_at < search_date 인 삭제 식단 영구 삭제
+
+    Returns:
+        통계 (테이블별 삭제 행 수, 삭제 파일 수, 초당 처리량)
+    """
+    started = time.perf_counter()
+    checkpoint = _load_checkpoint(checkpoint_path) if checkpoint_path else {}
+
+    stats = {"meals": 0, "rows": {}, "files": 0, "chunks": 0}
+    last_id = checkpoint.get("last_id", 0)
+
+    # 이전 실행에서 DB 삭제 후 지우지 못한 파일
+    if checkpoint.get("pending_files"):
+        stats["files"] += unlink_files(checkpoint["pending_files"], unlink_workers)
+        if checkpoint_path:
+            _save_checkpoint(checkpoint_path, {"last_id": last_id, "pending_files": []})
+
+    while True:
+        meal_ids = MealsCalendarsRepository.get_deleted_meal_ids(db, search_date, after_id=last_id, limit=chunk_size)
+        if not meal_ids:
+            break
+
+        try:
+            result = delete_meals_chunk(db, meal_ids)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        last_id = meal_ids[-1]
+
+        # 커밋된 청크의 파일 목록을 먼저 기록한 뒤 삭제 (중단 시 재실행에서 마저 삭제)
+        if checkpoint_path:
+            _save_checkpoint(checkpoint_path, {"last_id": last_id, "pending_files": result["file_paths"]})
+
+        stats["files"] += unlink_files(result["file_paths"], unlink_workers)
+        stats["files"] += result["blob_files"]
+
+        if checkpoint_path:
+            _save_checkpoint(checkpoint_path, {"last_id": last_id, "pending_files": []})
+
+        stats["meals"] += len(meal_ids)
+        stats["chunks"] += 1
+        for table, count in result["rows"].items():
+            stats["rows"][table] = stats["rows"].get(table, 0) + count
+
+    # 전체 완료 - 다음 실행은 처음부터
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    elapsed = time.perf_counter() - started
+    total_rows = sum(stats["rows"].values())
+    stats["elapsed_sec"] = round(elapsed, 3)
+    stats["rows_per_sec"] = round(total_rows / elapsed, 1) if elapsed > 0 else 0
+    stats["files_per_sec"] = round(stats["files"] / elapsed, 1) if elapsed > 0 else 0
+
+    return stats
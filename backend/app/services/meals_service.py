@@ -1,22 +1,24 @@
 """
 식단 캘린더 service 가이드
 """
-from app.repository.meals_calendars_repository import MealsCalendarsRepository
+from app.repository.meals_calendars_repository import MealsCalendarsRepository, AsyncMealsCalendarsRepository
 from app.schemas.common_schemas import CommonResponse
 from app.schemas.meals_schemas import FeedListRequest
 from app.libs.hash_utils import generate_sha256_hash
 from app.services.ingredients_service import  process_tags, get_ingredient_by_name
 from app.services.ingredients_mappers_service import get_ingredient_mappers_by_meal_id, insert_ingredient_mapper, delete_ingredient_mapper
 from app.services.attaches_files_service import get_attache_files_by_model_id, soft_delete_file_by_model_id, upload_file, save_upload_file
-from app.services.users_service import validate_user, validate_user_id
+from app.services.users_service import validate_user, validate_user_id, validate_user_async
 from app.services.feeds_images_service import create_meal_image
 from app.services.denies_users_service import get_denies_user_id_list
 from app.services.users_childs_service import get_agent_childs
 from app.services.categories_codes_service import get_category_code_by_id
 from app.services.meals_calendars_images_service import get_user_month_image_map, delete_calendar_image_by_month, upload_calendar_image
 from app.services.meals_comments_service import build_comment_tree, get_comment_list_by_user_meal_id
+from app.services.meals_feed_projections_service import refresh_meal_feed_projection
+from app.services.users_stats_service import change_meal_stats, change_meal_visibility_stats
 from app.serializer.meals_serialize import feed_detail_response, get_feed_type_calendars_data
-from app.repository.ads_repository import AdsRepository
+from app.services.ads_service import interleave_ads
 
 def get_meals_count(db, params={}):
     return MealsCalendarsRepository.get_count(db, params)
@@ -24,6 +26,7 @@ def get_meals_count(db, params={}):
 def get_meals_list(db, params={}, include=[]):
 
     final = []
+    mapped_meals = []
     result = MealsCalendarsRepository.get_meals_list(db, params, extra={"include": include})
 
     for row in result:
@@ -78,23 +81,46 @@ def get_meals_list(db, params={}, include=[]):
         else:
             meal.is_liked = False
 
+        final.append(meal)
+        mapped_meals.append(meal)
+
+    attach_refer_info(db, mapped_meals)
+
+    return final
+
+def attach_refer_info(db, meals):
+    """
+    참조 식단(refer_feed_id) 정보 일괄 조회
+    - 페이지 내 참조 식단 / 작성자를 IN 쿼리 2번으로 조회해서 메모리에서 연결
+    """
+    from app.repository.user_repository import UserRepository
+
+    refer_ids = {meal.refer_feed_id for meal in meals if meal.refer_feed_id and meal.refer_feed_id > 0}
+
+    refer_meals = {}
+    refer_users = {}
+    if refer_ids:
+        refer_meals = {m.id: m for m in MealsCalendarsRepository.get_calendars_by_ids(db, list(refer_ids))}
+        refer_user_ids = {m.user_id for m in refer_meals.values()}
+        refer_users = {u.id: u for u in UserRepository.findByIds(db, list(refer_user_ids))}
+
+    for meal in meals:
         meal.refer_info = None
         meal.refer_meal_hash = None
         meal.refer_user_hash = None
-        if meal.refer_feed_id and meal.refer_feed_id > 0:
-            try:
-                refer_meal = validate_meal_calendar_id(db, meal.refer_feed_id)
-                refer_user = validate_user_id(db, refer_meal.user_id)
-                meal.refer_info = True
-                meal.refer_meal_hash = refer_meal.view_hash
-                meal.refer_user_hash = refer_user.view_hash
-                meal.refer_user_nickname = refer_user.nickname if refer_user else "알 수 없음"
-            except Exception:
-                pass
 
-        final.append(meal)
+        refer_meal = refer_meals.get(meal.refer_feed_id)
+        if not refer_meal:
+            continue
 
-    return final
+        refer_user = refer_users.get(refer_meal.user_id)
+        if not refer_user:
+            continue
+
+        meal.refer_info = True
+        meal.refer_meal_hash = refer_meal.view_hash
+        meal.refer_user_hash = refer_user.view_hash
+        meal.refer_user_nickname = refer_user.nickname
 
 def validate_meal_calendar_id(db, meal_id):
     meal_calendar = get_meal_calendar_by_id(db, meal_id)
@@ -327,8 +353,8 @@ def get_user_calendar_detail(db, user_hash, target_user_hash, meal_hash):
     # Lazy import to avoid circular dependency
     from app.services.feeds_service import get_child_and_allergies, increase_view_count
 
-    # 조회수 증가
-    increase_view_count(db, meal_calendar, is_commit=True)
+    # 조회수 증가 (같은 사용자의 재조회는 중복 방지 윈도우 동안 제외)
+    increase_view_count(db, meal_calendar, viewer_key=user.id)
 
     # 태그 목록 조회
     tags = get_ingredient_mappers_by_meal_id(db, meal_calendar.id)
@@ -372,48 +398,12 @@ def get_feed_type_calendar(db, user_hash, filters: FeedListRequest) -> CommonRes
         meal_list = get_meals_list(db, search_params, include=["user", "category", "image", "tags", "child", "comment_count", "scrap"])
         meal_result = get_feed_type_calendars_data(meal_list)
 
-        # 광고 데이터를 조회
-        # meal_list 7개당 광고 1개 삽입
-        from datetime import date
-        today = date.today()
+        # 다음 페이지 cursor (정렬 키 전체를 인코딩한 토큰)
+        if meal_result:
+            meal_result[-1].cursor = MealsCalendarsRepository.encode_cursor(db, search_params, meal_list[-1].id)
 
-        params = {
-            "period_date": today,
-            "is_active": "Y",
-        }
-        ads_list, total_count = AdsRepository.get_ads_list(db, params)
-        if total_count > 0:
-            # 광고 데이터 리스트 생성
-            ads_to_insert = []
-            for ad, account_image, account_name, company, advertiser_view_hash, account_id, ad_images in ads_list:
-                ad_data = {
-                    "is_ad": True,
-                    "id": ad.id,
-                    "contents": ad.contents,
-                    "image_url": ad_images.split(","),
-                    "view_hash": ad.view_hash,
-                    "target_link": ad.target_link,
-                    "user": {
-                        "profile_image": account_image,
-                        "nickname": company,
-                        "id": account_id,
-                        "user_hash": advertiser_view_hash
-                    }
-                }
-                ads_to_insert.append(ad_data)
-
-            # 7개마다 광고 1개씩 분산 삽입
-            if ads_to_insert:
-                final_result = []
-                ad_index = 0
-                for i, meal in enumerate(meal_result):
-                    final_result.append(meal)
-                    # 7개의 식단 후에 광고 삽입 (광고가 남아있을 경우)
-                    if (i + 1) % 7 == 0 and ad_index < len(ads_to_insert):
-                        final_result.append(ads_to_insert[ad_index])
-                        ad_index += 1
-
-                meal_result = final_result
+        # 광고 삽입 (광고 인벤토리는 날짜별 캐시 사용)
+        meal_result = interleave_ads(db, meal_result, image_key="image_url")
 
         return CommonResponse(success=True, error=None, data=meal_result)
     except ValueError as e:
@@ -549,6 +539,8 @@ async def insert_meal_proccess(db, user, category_code, body):
 
     meal_calendar = MealsCalendarsRepository.create(db, meal_data, is_commit=False)
     db.flush()  # meal_calendar.id를 얻기 위해 flush로 먼저 DB에 반영
+
+    change_meal_stats(db, user.id, 1, meal_data["is_public"] == "Y")
     return meal_calendar
 
 async def upload_meal_image(db, meal_calendar, body):
@@ -670,12 +662,17 @@ async def update_meal(db, body: dict) -> CommonResponse:
             "meal_stage_detail": body.get('meal_stage_detail', meal_calendar.meal_stage_detail),
         }
 
+        was_public = meal_calendar.is_public == "Y"
         success = update_meal_process(db, meal_calendar, update_params)
 
         if not success:
             db.rollback()
             raise Exception("식단 캘린더 업데이트에 실패했습니다.")
 
+        # 삭제된 식단은 집계에서 이미 빠져 있음
+        if meal_calendar.is_active == "Y":
+            change_meal_visibility_stats(db, user.id, was_public, update_params["is_public"] == "Y")
+
         # -------------------------
         # 5. 재료 동기화 (replace 방식)
         # -------------------------
@@ -742,6 +739,8 @@ async def delete_meal(db, body: dict) -> CommonResponse:
         # -------------------------
         # 3. meal_calendar 삭제 (soft delete)
         # -------------------------
+        if meal_calendar.is_active == "Y":
+            change_meal_stats(db, user.id, -1, meal_calendar.is_public == "Y")
         MealsCalendarsRepository.soft_delete(db, meal_calendar, is_commit=False)
 
         db.commit()
@@ -757,20 +756,22 @@ async def delete_meal(db, body: dict) -> CommonResponse:
 async def get_scrap_list(db, params: dict) -> CommonResponse:
     """
     스크랩한 식단 캘린더 리스트 조회
+    - db 는 AsyncSession (get_async_db)
     """
-    from app.repository.meals_scraps_repository import MealsScrapsRepository
+    from app.repository.meals_scraps_repository import AsyncMealsScrapsRepository
 
     try:
-        user = validate_user(db, params.get('user_hash'))
+        user = await validate_user_async(db, params.get('user_hash'))
 
-        scrap_list = MealsScrapsRepository.get_scrap_list_by_user_id(db, user.id)
+        scrap_list = await AsyncMealsScrapsRepository.get_scrap_list_by_user_id(db, user.id)
         scrap_ids = [scrap.meal_id for scrap in scrap_list]
 
         search_params = {
             "meal_ids": scrap_ids,
         }
 
-        meal_list = get_meals_list(db, search_params, include=["user", "category", "image", "tags", "child", "comment_count", "scrap"])
+        # 목록 가공(get_meals_list)은 동기 서비스 로직을 그대로 재사용
+        meal_list = await db.run_sync(get_meals_list, search_params, ["user", "category", "image", "tags", "child", "comment_count", "scrap"])
 
         scrap_data = get_feed_type_calendars_data(meal_list)
         return CommonResponse(success=True, error=None, data=scrap_data)
@@ -784,26 +785,28 @@ async def get_scrap_list(db, params: dict) -> CommonResponse:
 async def scrap_pinned(db, params: dict) -> CommonResponse:
     """
     식단 캘린더 핀 고정/해제
+    - db 는 AsyncSession (get_async_db)
     """
-    from app.repository.meals_scraps_repository import MealsScrapsRepository
+    from app.repository.meals_scraps_repository import AsyncMealsScrapsRepository
 
     try:
-        user = validate_user(db, params.get('user_hash'))
-        meal_calendar = MealsCalendarsRepository.find_by_view_hash(db, params['meal_hash'])
+        user = await validate_user_async(db, params.get('user_hash'))
+        meal_calendar = await AsyncMealsCalendarsRepository.find_by_view_hash(db, params['meal_hash'])
         if not meal_calendar:
             return CommonResponse(success=False, error="핀 고정할 식단 캘린더 정보를 찾을 수 없습니다.", data=None)
 
-        meal_scrap = MealsScrapsRepository.get_scrap_by_user_and_meal(db, user.id, meal_calendar.id)
+        meal_scrap = await AsyncMealsScrapsRepository.get_scrap_by_user_and_meal(db, user.id, meal_calendar.id)
         if not meal_scrap:
             return CommonResponse(success=False, error="스크랩된 식단이 확인되지않습니다.", data=None)
 
         if meal_scrap.sort_order and meal_scrap.sort_order >= 1000:
             # 이미 핀 고정된 상태 -> 해제
-            MealsScrapsRepository.update(db, meal_scrap, sort_order=0)
-            db.commit()
+            await AsyncMealsScrapsRepository.update(db, meal_scrap, sort_order=0)
+            await db.run_sync(refresh_meal_feed_projection, meal_calendar.id, ["scrap"])
+            await db.commit()
             return CommonResponse(success=True, message="식단 캘린더 핀 고정이 해제되었습니다.", data=None)
 
-        max_sort_order = MealsScrapsRepository.get_scrap_by_max_sort_order(db, user.id)
+        max_sort_order = await AsyncMealsScrapsRepository.get_scrap_by_max_sort_order(db, user.id)
 
         if max_sort_order == 0:
             new_sort_order = 1000
@@ -812,54 +815,58 @@ async def scrap_pinned(db, params: dict) -> CommonResponse:
         else:
             new_sort_order = 0
 
-        MealsScrapsRepository.update(db, meal_scrap, sort_order=new_sort_order)
-        db.commit()
+        await AsyncMealsScrapsRepository.update(db, meal_scrap, sort_order=new_sort_order)
+        await db.run_sync(refresh_meal_feed_projection, meal_calendar.id, ["scrap"])
+        await db.commit()
         return CommonResponse(success=True, message="식단 캘린더 핀 고정이 처리되었습니다.", data=None)
 
     except ValueError as e:
-        db.rollback()
+        await db.rollback()
         return CommonResponse(success=False, error=str(e), data=None)
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return CommonResponse(success=False, error=str(e), data=None)
 
 async def scrap_meal(db, params: dict) -> CommonResponse:
     """
     식단 캘린더 스크랩
+    - db 는 AsyncSession (get_async_db)
     """
-    from app.repository.meals_scraps_repository import MealsScrapsRepository
+    from app.repository.meals_scraps_repository import AsyncMealsScrapsRepository
 
     try:
-        user = validate_user(db, params.get('user_hash'))
-        meal_calendar = MealsCalendarsRepository.find_by_view_hash(db, params['meal_hash'])
+        user = await validate_user_async(db, params.get('user_hash'))
+        meal_calendar = await AsyncMealsCalendarsRepository.find_by_view_hash(db, params['meal_hash'])
 
         if not meal_calendar:
             return CommonResponse(success=False, error="스크랩할 식단 캘린더 정보를 찾을 수 없습니다.", data=None)
 
         # 이미 스크랩 했는지 체크
         # 이미 있을때는 is_active 토글, 없을때는 새로 생성
-        meal_scrap = MealsScrapsRepository.get_scrap_by_user_and_meal(db, user.id, meal_calendar.id)
+        meal_scrap = await AsyncMealsScrapsRepository.get_scrap_by_user_and_meal(db, user.id, meal_calendar.id)
         if meal_scrap:
             is_active = "Y" if meal_scrap.is_active == "N" else "N"
 
-            MealsScrapsRepository.update(db, meal_scrap, is_active=is_active)
+            await AsyncMealsScrapsRepository.update(db, meal_scrap, is_active=is_active)
 
         else:
-            MealsScrapsRepository.create(db, {
+            await AsyncMealsScrapsRepository.create(db, {
                 "user_id": user.id,
                 "meal_id": meal_calendar.id,
                 "is_active": "Y"
             })
 
-        db.commit()
+        # 피드 목록 스크랩/핀 집계 갱신
+        await db.run_sync(refresh_meal_feed_projection, meal_calendar.id, ["scrap"])
+        await db.commit()
         return CommonResponse(success=True, message="식단 캘린더 스크랩이 성공적으로 처리되었습니다.", data=None)
 
     except ValueError as e:
-        db.rollback()
+        await db.rollback()
         return CommonResponse(success=False, error=str(e), data=None)
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return CommonResponse(success=False, error=str(e), data=None)
 
@@ -0,0 +1,39 @@
+"""
+푸시 알림 일괄 전송 (send_user_noti 배치)
+- PushDispatcher 로 multicast 묶음 동시 전송
+- FCM 이 무효라고 응답한 토큰은 전송 후 한 번에 삭제
+"""
+from app.core.config import settings
+from app.libs.push_dispatch import PushDispatcher
+from app.repository.user_repository import UserRepository
+
+
+def send_push_to_tokens(db, tokens, title: str, body: str, data: dict = None, dispatcher: PushDispatcher = None) -> dict:
+    """
+    tokens: FCM 토큰 iterable (같은 묶음 안의 중복은 한 번만 전송)
+
+    Returns:
+        PushDispatcher 통계 + cleared (삭제한 토큰 수)
+    """
+    if dispatcher is None:
+        from app.libs.utils.fcm import init_firebase
+
+        # 워커 스레드가 시작되기 전에 한 번 초기화
+        init_firebase()
+        dispatcher = PushDispatcher(
+            batch_size=settings.FCM_BATCH_SIZE,
+            workers=settings.FCM_PUSH_WORKERS,
+        )
+
+    stats = dispatcher.dispatch(tokens, title, body, data)
+
+    stats["cleared"] = 0
+    if stats["invalid_tokens"]:
+        try:
+            stats["cleared"] = UserRepository.clear_fcm_tokens(db, stats["invalid_tokens"])
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ 무효 FCM 토큰 삭제 실패: {str(e)}")
+
+    return stats
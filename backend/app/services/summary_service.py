@@ -3,13 +3,17 @@
 - sns_login_type 이 EMAIL 인 경우 password는 필수
 - 그 외 sns_login_type 인 경우 sns_id 는 필수
 """
-from pathlib import Path
 import re
 import json
 
+import anyio
+
 from app.core.config import settings
 from app.libs.open_ai import openai_call
-from app.libs.age_utils import format_child_age
+from app.libs.summary_jobs import summary_jobs, STATUS_DONE, STATUS_FAILED
+from app.libs.age_utils import format_child_age, get_age_bucket
+from app.libs.summary_cache import summary_cache, make_summary_cache_key
+from app.libs.prompt_registry import prompt_registry, PromptTemplate
 
 from app.repository.user_repository import UserRepository
 from app.repository.feed_repository import FeedRepository
@@ -45,12 +49,12 @@ def set_openai_question(system_prompt: str, user_prompt: str) -> list:
     ]
     return messages
 
-def call_openapi(messages) -> list:
+async def call_openapi(messages) -> list:
     """
     agent 호출 함수
     """
     try:
-        response = openai_call(messages)
+        response = await openai_call(messages)
 
         # OpenAI API 응답에서 에러 체크
         if "error" in response:
@@ -86,36 +90,68 @@ def get_week_report_user_prompt(summary_data, child_gender, child_birth):
 #============================================
 # 서비스 함수 정의
 #============================================
-def get_week_report(summary_data, child_gender, child_birth):
+async def get_week_report(summary_data, child_gender, child_birth) -> dict:
+    """
+    주간 리포트 AI 분석 (실패 시 Exception)
+    - call_openapi 는 content 문자열을 반환하므로 JSON 으로 파싱해서 반환
+    """
     system_prompt = load_prompt_template("week_report.md").strip()
     user_prompt = get_week_report_user_prompt(summary_data, child_gender, child_birth)
 
     messages = set_openai_question(system_prompt, user_prompt)
-    is_success, response = call_openapi(messages)
-    if not is_success or is_success == False:
-        return CommonResponse(
-            success=False,
-            message=response,
-            data=[]
-        )
+    is_success, response = await call_openapi(messages)
+    if not is_success:
+        raise Exception(response)
 
-    return response.get("choices", [{}])[0].get("message", {}).get("content", "")
+    return parse_openai_response(response)
 
-async def temp_meal_summary(db, data) -> CommonResponse:
+def _meal_summary_result(meal_summary) -> dict:
+    from app.schemas.summary_schemas import TempMealSummaryResponse
+
+    return TempMealSummaryResponse(
+        ai_hash=meal_summary.view_hash,
+        total_score=meal_summary.total_score,
+        total_summary=meal_summary.total_summary,
+        analysis_json=meal_summary.analysis_json,
+        suggestion=meal_summary.suggestion
+    ).dict()
+
+def _save_temp_meal_summary(params) -> dict:
     """
-    임시 식단요약
-    - AI 모델을 호출하여 식단 요약 생성
-    - 가등록 단계에서 ai에게 질의를 하고 결과를 받아서 임시 테이블에 저장
-    - 프론트에서는 실제 등록 시 ai_hash로 결과 조회
+    요약 작업에서 임시 식단 요약 저장 (요청과 별개의 세션)
+    - 다른 워커가 같은 view_hash 를 먼저 저장했으면 그 결과 반환
+    """
+    from app.core.database import SessionLocal
+    from app.services.meals_summaries_service import create_meal_summary
+
+    db = SessionLocal()
+    try:
+        try:
+            meal_summary = create_meal_summary(db, params)
+            db.commit()
+        except Exception:
+            db.rollback()
+            meal_summary = get_meal_summary_by_view_hash(db, params["view_hash"])
+
+        if not meal_summary:
+            raise Exception("임시 식단 요약 저장에 실패했습니다.")
+
+        return _meal_summary_result(meal_summary)
+    finally:
+        db.close()
+
+def submit_temp_meal_summary(db, data) -> dict:
+    """
+    임시 식단요약 작업 등록 (검증 실패 시 Exception), 작업 상태 반환
+    - 이미 저장된 요약이 있으면 작업 없이 바로 완료 상태 반환
+    - job_id: "meal:{view_hash}" - 같은 입력의 작업이 진행 중이면 합침
     """
     from app.services.users_service import validate_user
     from app.services.users_childs_service import get_child_by_id
     from app.services.ingredients_nutritions_services import get_ingredient_mapper
     from app.services.categories_codes_service import get_category_code_by_id
     from app.services.meals_service import get_meal_stage_text
-    from app.services.meals_summaries_service import create_meal_summary, create_ingredient_hash
-
-    from app.schemas.summary_schemas import TempMealSummaryResponse
+    from app.services.meals_summaries_service import create_ingredient_hash
 
     user_hash = data.get("user_hash")
     category_code = data.get("category_code")
@@ -126,71 +162,83 @@ async def temp_meal_summary(db, data) -> CommonResponse:
     meal_stage_detail = data.get("meal_stage_detail")
     ingredients = data.get("ingredients", [])
 
-    try:
-        # user 검증
-        user = validate_user(db, user_hash)
-        child = get_child_by_id(db, child_id)
-        if child is None:
-            raise Exception("존재하지 않는 아이정보 입니다.")
-
-        category = get_category_code_by_id(db, category_code)
-        if category is None or category.type != "MEALS_GROUP":
-            raise Exception("유효하지 않은 카테고리입니다.")
-
-        ingredient_data = []
-        for ingredient in ingredients:
-            mapper_data = get_ingredient_mapper(db, ingredient)  # 재료 유효성 검증
-
-            if mapper_data:
-                ingredient_data.append(mapper_data)
-
-        ingredient_names = [ingredient.get("name") for ingredient in ingredients if ingredient.get("name")]
-
-        view_hash = create_ingredient_hash(
-            user.id,
-            input_date,
-            category.code,
-            child_id,
-            contents,
-            meal_stage,
-            meal_stage_detail,
-            ingredient_names,
-        )
-
-        exist_meal_summary = get_meal_summary_by_view_hash(db, view_hash)  # 동일한 해시가 있는지 확인하여 중복 생성 방지
-        if exist_meal_summary:
-            data = TempMealSummaryResponse(
-                ai_hash=exist_meal_summary.view_hash,
-                total_score=exist_meal_summary.total_score,
-                total_summary=exist_meal_summary.total_summary,
-                analysis_json=exist_meal_summary.analysis_json,
-                suggestion=exist_meal_summary.suggestion
-            )
-            return CommonResponse(success=True, message="식단 요약 생성 성공", data=data)
-
-        meal_stage_text, meal_stage_detail_text = get_meal_stage_text(meal_stage, meal_stage_detail)  # 단계 텍스트로 변환 (예: 이유식 초기)
-
-        system_prompt = load_prompt_template("temp_meal_summary.md")
-
-        final_prompt = f"아이 이름 : {child.child_name}"
-        final_prompt += f"\n아이 성별 : {'남아' if child.child_gender == 'M' else '여아'}"
-        final_prompt += f"\n아이의 나이: {format_child_age(child.child_birth)}"
-        final_prompt += f"\n식단 내용: {contents}"
-        final_prompt += f"\n식단 형태: {category.value}"
-        final_prompt += f"\n식단 단계: {meal_stage_text} ({meal_stage_detail_text})"
-        final_prompt += f"\n식사 성분: {ingredient_data}"
-
-        messages = set_openai_question(system_prompt, final_prompt)
-        is_success, response = call_openapi(messages)
-        if not is_success:
-            return CommonResponse(success=False, message=response, data=[])
-
-        data = parse_openai_response(response)
+    # user 검증
+    user = validate_user(db, user_hash)
+    child = get_child_by_id(db, child_id)
+    if child is None:
+        raise Exception("존재하지 않는 아이정보 입니다.")
+
+    category = get_category_code_by_id(db, category_code)
+    if category is None or category.type != "MEALS_GROUP":
+        raise Exception("유효하지 않은 카테고리입니다.")
+
+    ingredient_data = []
+    for ingredient in ingredients:
+        mapper_data = get_ingredient_mapper(db, ingredient)  # 재료 유효성 검증
+
+        if mapper_data:
+            ingredient_data.append(mapper_data)
+
+    ingredient_names = [ingredient.get("name") for ingredient in ingredients if ingredient.get("name")]
+
+    view_hash = create_ingredient_hash(
+        user.id,
+        input_date,
+        category.code,
+        child_id,
+        contents,
+        meal_stage,
+        meal_stage_detail,
+        ingredient_names,
+    )
+    job_id = f"meal:{view_hash}"
+
+    exist_meal_summary = get_meal_summary_by_view_hash(db, view_hash)  # 동일한 해시가 있는지 확인하여 중복 생성 방지
+    if exist_meal_summary:
+        return {"job_id": job_id, "kind": "meal", "status": STATUS_DONE, "result": _meal_summary_result(exist_meal_summary), "error": None}
+
+    meal_stage_text, meal_stage_detail_text = get_meal_stage_text(meal_stage, meal_stage_detail)  # 단계 텍스트로 변환 (예: 이유식 초기)
+
+    prompt_template = get_prompt_template("temp_meal_summary.md")
+    system_prompt = prompt_template.content
+
+    # 영양 입력(나이 구간 / 성별 / 단계 / 카테고리 / 재료 양)이 같은 분석 결과가 있으면 재사용
+    cache_key = make_summary_cache_key(
+        get_age_bucket(child.child_birth),
+        child.child_gender,
+        meal_stage,
+        meal_stage_detail,
+        category.code,
+        ingredients,
+        prompt_template.hash,
+    )
+
+    final_prompt = f"아이 이름 : {child.child_name}"
+    final_prompt += f"\n아이 성별 : {'남아' if child.child_gender == 'M' else '여아'}"
+    final_prompt += f"\n아이의 나이: {format_child_age(child.child_birth)}"
+    final_prompt += f"\n식단 내용: {contents}"
+    final_prompt += f"\n식단 형태: {category.value}"
+    final_prompt += f"\n식단 단계: {meal_stage_text} ({meal_stage_detail_text})"
+    final_prompt += f"\n식사 성분: {ingredient_data}"
+
+    messages = set_openai_question(system_prompt, final_prompt)
+    user_id = user.id
+    child_name = child.child_name
+
+    async def run():
+        data = summary_cache.get(cache_key, child_name)
+        if data is None:
+            is_success, response = await call_openapi(messages)
+            if not is_success:
+                raise Exception(response)
+
+            data = parse_openai_response(response)
+            summary_cache.set(cache_key, data, child_name)
 
         suggestion = "_AND_".join(data.get("improvement_suggestions", []))
 
         params = {
-            "user_id": user.id,
+            "user_id": user_id,
             "total_score": data.get("total_score", 0),
             "total_summary": data.get("summary", ""),
             "analysis_json": data.get("nutrient_analysis", ""),
@@ -200,25 +248,43 @@ async def temp_meal_summary(db, data) -> CommonResponse:
         }
 
         # 임시 테이블에 저장
-        temp_meal_summary = create_meal_summary(db, params)
-        db.commit()
-        if not temp_meal_summary:
-            raise Exception("임시 식단 요약 저장에 실패했습니다.")
+        return await anyio.to_thread.run_sync(_save_temp_meal_summary, params)
 
-        data = TempMealSummaryResponse(
-            ai_hash=temp_meal_summary.view_hash,
-            total_score=temp_meal_summary.total_score,
-            total_summary=temp_meal_summary.total_summary,
-            analysis_json=temp_meal_summary.analysis_json,
-            suggestion=temp_meal_summary.suggestion
-        )
+    return summary_jobs.submit(job_id, "meal", run, owner_id=user_id).to_dict()
+
+async def temp_meal_summary(db, data) -> CommonResponse:
+    """
+    임시 식단요약
+    - AI 모델을 호출하여 식단 요약 생성
+    - 가등록 단계에서 ai에게 질의를 하고 결과를 받아서 임시 테이블에 저장
+    - 프론트에서는 실제 등록 시 ai_hash로 결과 조회
+    - 작업으로 등록 후 완료될 때까지 대기 (기존 응답 형식), 바로 반환은 enqueue_temp_meal_summary
+    """
+    try:
+        job = submit_temp_meal_summary(db, data)
+        if job["status"] != STATUS_DONE:
+            # 검증 조회의 트랜잭션을 끝내 AI 응답 대기 동안 커넥션을 풀에 돌려줌
+            db.rollback()
+            job = (await summary_jobs.wait(summary_jobs.get(job["job_id"]))).to_dict()
+
+        if job["status"] == STATUS_FAILED:
+            return CommonResponse(success=False, message=job["error"], data=[])
 
-        return CommonResponse(success=True, message="식단 요약 생성 성공", data=data)
+        return CommonResponse(success=True, message="식단 요약 생성 성공", data=job["result"])
 
     except Exception as e:
         print("⭕⭕", str(e))
         return CommonResponse(success=False, message=f"{str(e)}", data=[])
 
+async def enqueue_temp_meal_summary(db, data) -> CommonResponse:
+    """
+    임시 식단요약 작업 등록 후 바로 반환 - 결과는 /summaries/jobs/{job_id} 로 조회
+    """
+    try:
+        return CommonResponse(success=True, message="식단 요약 작업 등록 성공", data=submit_temp_meal_summary(db, data))
+    except Exception as e:
+        return CommonResponse(success=False, message=f"{str(e)}", data=[])
+
 async def search_summary(db, user_hash: str, model: str, model_id: int, query: str, limit: int, offset: int) -> CommonResponse:
     """
     나의 요약 검색 내역 조회
@@ -257,25 +323,23 @@ async def search_summary(db, user_hash: str, model: str, model_id: int, query: s
 
     return CommonResponse(success=True, message="요약 검색 성공", data=data)
 
+def get_prompt_template(template_name: str) -> PromptTemplate:
+    """
+    프롬프트 템플릿 조회 (내용 + content hash)
+    - template_name: 템플릿 파일명 (예: "recipe_summary.txt")
+    """
+    template = prompt_registry.get(template_name)
+    if template is None:
+        raise Exception(f"프롬프트 템플릿을 찾을 수 없습니다: {template_name}")
+    return template
+
 def load_prompt_template(template_name: str) -> str:
     """
     프롬프트 템플릿 로드 함수
     - template_name: 템플릿 파일명 (예: "recipe_summary.txt")
     - 반환값: 템플릿 문자열
     """
-    template_path = Path(settings.PROMPT_TEMPLATES_DIR) / template_name
-
-    # 상대경로인 경우 이 파일 기준으로 절대경로 변환 (backend/prompts/)
-    if not template_path.is_absolute():
-        base_dir = Path(__file__).resolve().parent.parent.parent
-        template_path = base_dir / settings.PROMPT_TEMPLATES_DIR / template_name
-
-    try:
-        with open(template_path, 'r', encoding='utf-8') as file:
-            template_content = file.read()
-        return template_content
-    except FileNotFoundError:
-        raise Exception(f"프롬프트 템플릿을 찾을 수 없습니다: {template_name}")
+    return get_prompt_template(template_name).content
 
 """
 관리자에서 사용할 리스트
@@ -318,21 +382,36 @@ def getAiPromptQuestion(prompt: str, recipe: list, desc: str, child_birth: str =
         f_prompt += f"음식 설명: {desc}\n\n"
     return f_prompt
 
-"""
-피드요약
-- 재료, 상세설명을 참고하여 영양성분을 분석하여 요약을 생성
-"""
-async def feed_summary(db, data) -> CommonResponse:
+def _save_feed_summary(summary_params) -> str:
+    """
+    요약 작업에서 피드 요약 기록 저장 (요청과 별개의 세션)
+    """
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        summary_agent = SummariesAgentsRepository.create(db, summary_params, is_commit=True)
+        if not summary_agent:
+            raise Exception("요약 기록 생성에 실패했습니다.")
+        return summary_params["answer"]
+    finally:
+        db.close()
 
+def submit_feed_summary(db, data) -> dict:
+    """
+    피드요약 작업 등록 (검증 실패 시 Exception), 작업 상태 반환
+    - 같은 피드 / 재료의 요약이 있으면 작업 없이 바로 완료 상태 반환
+    - job_id: "feed:{feed_id}:{recipe_hash}" - 같은 작업이 진행 중이면 합침
+    """
     model = data.get("model", "gpt-4o-mini")
     prompt = data['prompt']
 
     if data['prompt'].strip() == "":
-        return CommonResponse(success=False, message="프롬프트를 입력해주세요.", data=[])
+        raise Exception("프롬프트를 입력해주세요.")
 
     user = UserRepository.find_by_view_hash(db, data["user_hash"])
     if not user:
-        return CommonResponse(success=False, message="존재하지 않는 회원입니다.", data=[])
+        raise Exception("존재하지 않는 회원입니다.")
 
     # used_count = SummariesAgentsRepository.findUsedCountByUserId(db, user.id)
     # if used_count >= settings.FREE_SUMMARY_AGENT_COUNT:
@@ -340,7 +419,7 @@ async def feed_summary(db, data) -> CommonResponse:
 
     feed = FeedRepository.findById(db, data["feed_id"])
     if not feed:
-        return CommonResponse(success=False, message="존재하지 않는 피드입니다.", data=[])
+        raise Exception("존재하지 않는 피드입니다.")
 
     meal_calendar = MealsCalendarsRepository.get_calendar_by_id(db, feed.ref_meal)
     child_id = meal_calendar.child_id if meal_calendar else None
@@ -353,11 +432,12 @@ async def feed_summary(db, data) -> CommonResponse:
 
     # recipe_list : ["고구마", "브로콜리"]
     recipe_list = sorted(FeedsTagsMappersRepository.get_tags_mapper_by_model_and_model_id(db, "Feeds", feed.id))
+    job_id = f"feed:{feed.id}:{SummariesAgentsRepository.get_recipe_hash(recipe_list)}"
 
     # # 동일한 요약이 있는 경우 재사용
     exist_summary = SummariesAgentsRepository.get_summary_by_model_recipe_data(db, "Feeds", feed.id, recipe_list)
     if exist_summary:
-        return CommonResponse(success=True, message="요약 검색 성공", data=exist_summary.answer)
+        return {"job_id": job_id, "kind": "feed", "status": STATUS_DONE, "result": exist_summary.answer, "error": None}
 
     system_prompt = load_prompt_template("system.md").strip()
     final_prompt  = getAiPromptQuestion(prompt, recipe_list, feed.content, child_birth)
@@ -377,47 +457,131 @@ async def feed_summary(db, data) -> CommonResponse:
             ]
         }
     ]
+    user_id = user.id
+    feed_id = feed.id
 
-    try:
-        response = openai_call(messages, model=model)
+    async def run():
+        response = await openai_call(messages, model=model)
 
         # OpenAI API 응답에서 에러 체크
         if "error" in response:
-            return CommonResponse(
-                success=False,
-                message=f"OpenAI API 오류: {response['error']}",
-                data=[]
-            )
+            raise Exception(f"OpenAI API 오류: {response['error']}")
 
         # OpenAI API 응답 구조: choices[0].message.content
         output_text = response.get("choices", [{}])[0].get("message", {}).get("content", "")
 
         summary_params = {
-            "user_id": user.id,
+            "user_id": user_id,
             "model": "Feeds",
-            "model_id": feed.id,
+            "model_id": feed_id,
             "recipe_json": recipe_list,
             "question": prompt,
             "answer": output_text,
         }
 
-        summary_agent = SummariesAgentsRepository.create(db, summary_params, is_commit=True)
-        if not summary_agent:
-            return CommonResponse(
-                success=False,
-                message="요약 기록 생성에 실패했습니다.",
-                data=[]
-            )
+        return await anyio.to_thread.run_sync(_save_feed_summary, summary_params)
+
+    return summary_jobs.submit(job_id, "feed", run).to_dict()
 
+"""
+피드요약
+- 재료, 상세설명을 참고하여 영양성분을 분석하여 요약을 생성
+- 작업으로 등록 후 완료될 때까지 대기 (기존 응답 형식), 바로 반환은 enqueue_feed_summary
+"""
+async def feed_summary(db, data) -> CommonResponse:
+    try:
+        job = submit_feed_summary(db, data)
     except Exception as e:
+        return CommonResponse(success=False, message=f"{str(e)}", data=[])
+
+    if job["status"] == STATUS_DONE:
+        return CommonResponse(success=True, message="요약 검색 성공", data=job["result"])
+
+    # 검증 조회의 트랜잭션을 끝내 AI 응답 대기 동안 커넥션을 풀에 돌려줌
+    db.rollback()
+    job = (await summary_jobs.wait(summary_jobs.get(job["job_id"]))).to_dict()
+    if job["status"] == STATUS_FAILED:
         return CommonResponse(
             success=False,
-            message=f"요청 처리 중 오류가 발생했습니다: {str(e)}",
+            message=f"요청 처리 중 오류가 발생했습니다: {job['error']}",
             data=[]
         )
 
     return CommonResponse(
         success=True,
         message="요약 성공",
-        data=output_text
-    )
\ No newline at end of file
+        data=job["result"]
+    )
+
+async def enqueue_feed_summary(db, data) -> CommonResponse:
+    """
+    피드요약 작업 등록 후 바로 반환 - 결과는 /summaries/jobs/{job_id} 로 조회
+    """
+    try:
+        return CommonResponse(success=True, message="피드 요약 작업 등록 성공", data=submit_feed_summary(db, data))
+    except Exception as e:
+        return CommonResponse(success=False, message=f"{str(e)}", data=[])
+
+def _find_saved_job_result(db, job_id: str, user_id: int):
+    """
+    다른 워커에서 처리된 작업 - DB 에 저장된 결과 조회 (없거나 다른 회원의 식단 요약이면 None)
+    """
+    kind, _, key = job_id.partition(":")
+
+    if kind == "meal":
+        meal_summary = get_meal_summary_by_view_hash(db, key)
+        if not meal_summary or meal_summary.user_id != user_id:
+            return None
+        return _meal_summary_result(meal_summary)
+
+    if kind == "feed":
+        feed_id, _, recipe_hash = key.partition(":")
+        if not feed_id.isdigit():
+            return None
+        summary = SummariesAgentsRepository.get_summary_by_recipe_hash(db, "Feeds", int(feed_id), recipe_hash)
+        return summary.answer if summary else None
+
+    return None
+
+async def get_summary_job(db, user_hash: str, job_id: str, wait: float = 0) -> CommonResponse:
+    """
+    요약 작업 상태 조회
+    - 등록한 회원만 조회 가능 (피드 요약은 피드 / 재료 기준 공유 결과라 회원 검증만)
+    - wait 초 동안 완료를 기다림 (long-polling, 최대 SUMMARY_JOB_MAX_WAIT)
+    - 이 워커에 없는 작업은 DB 에 저장된 결과로 확인 (SUMMARY_JOB_POLL_INTERVAL 초 간격)
+    """
+    from app.services.users_service import validate_user
+
+    try:
+        user_id = validate_user(db, user_hash).id
+    except ValueError as e:
+        return CommonResponse(success=False, message=str(e), data=[])
+
+    wait = min(max(wait or 0, 0), settings.SUMMARY_JOB_MAX_WAIT)
+    deadline = anyio.current_time() + wait
+
+    # 대기 전에 회원 조회 트랜잭션 종료
+    db.rollback()
+
+    while True:
+        job = summary_jobs.get(job_id)
+        if job is not None:
+            if job.owner_id is not None and job.owner_id != user_id:
+                return CommonResponse(success=False, message="존재하지 않거나 만료된 요약 작업입니다.", data=[])
+
+            job = await summary_jobs.wait(job, deadline - anyio.current_time())
+            return CommonResponse(success=True, message="요약 작업 조회 성공", data=job.to_dict())
+
+        result = _find_saved_job_result(db, job_id, user_id)
+        if result is not None:
+            data = {"job_id": job_id, "kind": job_id.partition(":")[0], "status": STATUS_DONE, "result": result, "error": None}
+            return CommonResponse(success=True, message="요약 작업 조회 성공", data=data)
+
+        # 세션이 트랜잭션 스냅샷을 잡고 있지 않도록 종료 후 재조회
+        db.rollback()
+
+        remaining = deadline - anyio.current_time()
+        if remaining <= 0:
+            return CommonResponse(success=False, message="존재하지 않거나 만료된 요약 작업입니다.", data=[])
+
+        await anyio.sleep(min(settings.SUMMARY_JOB_POLL_INTERVAL, remaining))
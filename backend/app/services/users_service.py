@@ -3,7 +3,7 @@
 - sns_login_type 이 EMAIL 인 경우 password는 필수
 - 그 외 sns_login_type 인 경우 sns_id 는 필수
 """
-from app.repository.user_repository import UserRepository
+from app.repository.user_repository import UserRepository, AsyncUserRepository
 from app.repository.meals_comments_repository import MealsCommentsRepository
 
 from app.schemas.users_schemas import UserResponse
@@ -18,6 +18,7 @@ from app.services.meals_mappers_service import create_meal_mapper, meal_mapper_l
 from app.services.categories_codes_service import get_category_code_by_id
 from app.services.foods_items_service import get_allergy_details_by_codes
 from app.services.users_childs_allergies_service import bulk_create_user_child_allergies, delete_user_child_allergies
+from app.services.users_stats_service import get_user_stats
 
 def get_users_last_login(db, days: int, is_push_agree: int = None):
     """
@@ -25,11 +26,21 @@ def get_users_last_login(db, days: int, is_push_agree: int = None):
     """
     return UserRepository.get_users_last_login(db, days, is_push_agree)
 
+def iter_users_last_login(db, days: int, is_push_agree: int = None, batch_size: int = 1000):
+    """
+    마지막 로그인 시간이 days일 이상인 사용자 스트리밍 조회 (id / fcm_token / push_agree 행)
+    """
+    return UserRepository.iter_users_last_login(db, days, is_push_agree, batch_size)
+
 def get_user_like_count(db, user_id):
     """
-    회원의 좋아요 수 조회
+    회원의 좋아요 수 / 식단 수 조회 (users_stats)
     """
-    return UserRepository.get_user_like_count(db, user_id)
+    stats = get_user_stats(db, user_id)
+    return {
+        "like_count": stats["like_count"],
+        "meal_count": stats["meal_count"]
+    }
 
 def get_user_count(db, params={}):
     """
@@ -85,6 +96,15 @@ def validate_user(db, user_hash):
         raise ValueError("회원 정보를 찾을 수 없습니다.")
     return user
 
+async def validate_user_async(db, user_hash):
+    """
+    AsyncSession 용 validate_user
+    """
+    user = await AsyncUserRepository.find_by_view_hash(db, user_hash)
+    if not user:
+        raise ValueError("회원 정보를 찾을 수 없습니다.")
+    return user
+
 def get_sns_user(db, sns_login_type, sns_id):
     return UserRepository.get_user_by_sns_account(db, sns_login_type, sns_id)
 
@@ -137,12 +157,7 @@ async def confirm_password_reset(db, data) -> CommonResponse:
 def get_my_info(db, data) -> CommonResponse:
     try:
         user = validate_user(db, data["user_hash"])
-        like_count, meal_count = get_user_like_count(db, user.id).values()
-
-        result = {
-            "like_count": like_count,
-            "meal_count": meal_count
-        }
+        result = get_user_like_count(db, user.id)
 
         return CommonResponse(success=True, message="", data=result)
     except ValueError as e:
@@ -451,7 +466,7 @@ def get_user_profile(db, user_hash, target_hash=None):
         search_user = user if not target_hash else validate_user(db, target_hash)
 
         # like_count, meal_count는 조회 대상 기준으로 계산
-        like_count, meal_count = get_user_like_count(db, search_user.id)
+        counts = get_user_like_count(db, search_user.id)
         user_response = UserResponse.model_validate(search_user).model_dump()
 
         # 이미지 경로 정리
@@ -460,8 +475,8 @@ def get_user_profile(db, user_hash, target_hash=None):
             user_response['profile_image'] = profile_image.replace('\\', '/')
 
         user_response.update({
-            "like_count": like_count,
-            "meal_count": meal_count
+            "like_count": counts["like_count"],
+            "meal_count": counts["meal_count"]
         })
         # 직렬화
         user_response = UserResponse.model_validate(user_response).model_dump()
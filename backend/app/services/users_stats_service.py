@@ -0,0 +1,89 @@
+"""
+회원 집계 (users_stats)
+- 프로필 / 내 정보는 users_stats 한 행만 조회
+- 좋아요 토글 / 식단 등록·수정·삭제 / 삭제 식단 정리 시 같은 트랜잭션에서 증감 (커밋은 호출부)
+- 행이 없는 회원은 증감하지 않고, 첫 조회 시 원본 테이블에서 계산해 저장
+- set_users_stats 배치가 전체 회원을 재계산해 어긋난 값 보정
+"""
+import time
+
+from app.repository.users_stats_repository import UsersStatsRepository, STAT_COLUMNS
+
+
+def get_user_stats(db, user_id: int) -> dict:
+    """
+    {like_count, meal_count, public_meal_count}
+    """
+    row = UsersStatsRepository.get(db, user_id)
+    if row is not None:
+        return {column: getattr(row, column) for column in STAT_COLUMNS}
+
+    stats = UsersStatsRepository.compute(db, [user_id])
+    try:
+        UsersStatsRepository.replace(db, stats)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️ 회원 집계 저장 실패 (user_id={user_id}): {str(e)}")
+
+    return stats[user_id]
+
+def change_like_stats(db, user_id: int, delta: int):
+    """
+    좋아요 추가(+1) / 취소(-1)
+    """
+    UsersStatsRepository.add(db, user_id, {"like_count": delta})
+
+def change_meal_stats(db, user_id: int, delta: int, is_public: bool):
+    """
+    식단 등록(+1) / 삭제(-1)
+    """
+    UsersStatsRepository.add(db, user_id, {
+        "meal_count": delta,
+        "public_meal_count": delta if is_public else 0,
+    })
+
+def change_meal_visibility_stats(db, user_id: int, was_public: bool, is_public: bool):
+    """
+    식단 공개 여부 변경
+    """
+    if was_public != is_public:
+        UsersStatsRepository.add(db, user_id, {"public_meal_count": 1 if is_public else -1})
+
+def remove_like_stats_for_meals(db, meal_ids: list):
+    """
+    식단 영구 삭제로 사라지는 좋아요를 누른 회원별로 차감 (좋아요 행 삭제 전에 호출)
+    """
+    from app.repository.meals_likes_repository import MealsLikesRepository
+
+    user_counts = MealsLikesRepository.count_by_user_for_meal_ids(db, meal_ids)
+    UsersStatsRepository.add_many(db, "like_count", {user_id: -count for user_id, count in user_counts.items()})
+
+def reconcile_users_stats(db, chunk_size: int = 1000) -> dict:
+    """
+    전체 회원 집계 재계산 (회원 id 순 청크 단위 커밋)
+    """
+    started = time.perf_counter()
+    stats = {"users": 0, "chunks": 0}
+    last_id = 0
+
+    while True:
+        user_ids = UsersStatsRepository.get_user_ids_after(db, last_id, chunk_size)
+        if not user_ids:
+            break
+
+        try:
+            UsersStatsRepository.replace(db, UsersStatsRepository.compute(db, user_ids))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        last_id = user_ids[-1]
+        stats["users"] += len(user_ids)
+        stats["chunks"] += 1
+
+    elapsed = time.perf_counter() - started
+    stats["elapsed_sec"] = round(elapsed, 3)
+    stats["users_per_sec"] = round(stats["users"] / elapsed, 1) if elapsed > 0 else 0
+    return stats
@@ -0,0 +1,139 @@
+"""
+주간 식단 리포트 (set_summaries_week 배치)
+- 기간 내 전체 사용자 식단 / 재료 매핑을 집합 쿼리 몇 번으로 조회 (사용자별 / 식단별 반복 조회 없음)
+- 영양소는 재료 × 영양소 행렬(NutrientMatrix)로 합산
+- AI 분석은 동시 실행 수 / 분당 호출 수를 제한한 asyncio 작업으로 병렬 처리
+- 결과는 meals_week_reports 에 저장, 재실행 시 완료(R)된 자녀는 건너뜀 (실패(F)는 다시 시도)
+"""
+import asyncio
+import json
+import time
+from collections import Counter, defaultdict
+
+from app.libs.nutrient_matrix import NutrientMatrix
+from app.libs.rate_limit import AsyncRateLimiter
+from app.repository.ingredients_mappers_repository import IngredientsMappersRepository
+from app.repository.meals_calendars_repository import MealsCalendarsRepository
+from app.repository.meals_week_reports_repository import MealsWeekReportsRepository
+from app.services.ingredients_nutritions_services import get_nutrient_matrix
+
+
+def build_week_payloads(db, matrix: NutrientMatrix, start_date: str, end_date: str, user_ids: list = None) -> dict:
+    """
+    (user_id, child_id) 별 AI 입력 데이터 / 영양소 합계
+    - summary: date → child_name → category → ingredient → nutrient (week_report.md 데이터 구조)
+    """
+    meal_rows = MealsCalendarsRepository.get_week_meal_rows(db, start_date, end_date, user_ids)
+
+    meal_ingredients = defaultdict(list)
+    for pair in IngredientsMappersRepository.get_pairs_by_meal_ids(db, [row.meal_id for row in meal_rows]):
+        meal_ingredients[pair.meal_id].append(pair.ingredient_id)
+
+    groups = {}
+    for row in meal_rows:
+        # 식단에 자녀가 없으면 대표 자녀로 집계
+        if row.child_id:
+            child_id, child_name, child_gender, child_birth = row.child_id, row.child_name, row.child_gender, row.child_birth
+        elif row.agent_child_id:
+            child_id, child_name, child_gender, child_birth = row.agent_child_id, row.agent_child_name, row.agent_child_gender, row.agent_child_birth
+        else:
+            continue
+
+        group = groups.get((row.user_id, child_id))
+        if group is None:
+            group = groups[(row.user_id, child_id)] = {
+                "child_name": child_name,
+                "child_gender": child_gender,
+                "child_birth": child_birth,
+                "meal_count": 0,
+                "counts": defaultdict(Counter),
+                "totals": matrix.zeros(),
+            }
+
+        group["meal_count"] += 1
+        counts = group["counts"][(str(row.input_date), row.category_name or "알 수 없음")]
+        for ingredient_id in meal_ingredients.get(row.meal_id, []):
+            if matrix.accumulate(group["totals"], ingredient_id):
+                counts[ingredient_id] += 1
+
+    payloads = {}
+    for key, group in groups.items():
+        summary = {}
+        for (input_date, category_name), counts in group["counts"].items():
+            meals = summary.setdefault(input_date, {}).setdefault(group["child_name"], {})
+            ingredients = meals.setdefault(category_name, {})
+            for ingredient_id, count in counts.items():
+                ingredients[matrix.ingredient_names[ingredient_id]] = matrix.ingredient_nutrients(ingredient_id, count)
+
+        payloads[key] = {
+            "child_name": group["child_name"],
+            "child_gender": group["child_gender"],
+            "child_birth": group["child_birth"],
+            "meal_count": group["meal_count"],
+            "summary": summary,
+            "totals": matrix.to_named(group["totals"]),
+        }
+
+    return payloads
+
+
+async def generate_week_reports(db, start_date: str, end_date: str, user_ids: list = None, concurrency: int = 4, rate_per_minute: float = 60) -> dict:
+    """
+    주간 리포트 생성 후 저장, 통계 반환
+    - DB 작업은 이 코루틴(단일 세션)에서만, AI 호출만 동시 실행
+    """
+    from app.services.summary_service import get_week_report
+
+    started = time.perf_counter()
+
+    matrix = get_nutrient_matrix(db)
+    payloads = build_week_payloads(db, matrix, start_date, end_date, user_ids)
+    done_keys = MealsWeekReportsRepository.get_done_keys(db, start_date)
+    targets = [(key, payload) for key, payload in payloads.items() if key not in done_keys]
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = AsyncRateLimiter(rate_per_minute)
+
+    async def run_one(key, payload):
+        async with semaphore:
+            await limiter.wait()
+            try:
+                report = await get_week_report(payload["summary"], payload["child_gender"], payload["child_birth"])
+                return key, payload, report, None
+            except Exception as e:
+                return key, payload, None, str(e)
+
+    stats = {"targets": len(targets), "skipped": len(payloads) - len(targets), "done": 0, "failed": 0}
+
+    for future in asyncio.as_completed([run_one(key, payload) for key, payload in targets]):
+        (user_id, child_id), payload, report, error = await future
+
+        try:
+            MealsWeekReportsRepository.upsert(db, {
+                "user_id": user_id,
+                "child_id": child_id,
+                "week_start": start_date,
+                "week_end": end_date,
+                "meal_count": payload["meal_count"],
+                "totals_json": json.dumps(payload["totals"], ensure_ascii=False),
+                "report_json": json.dumps(report, ensure_ascii=False) if report is not None else None,
+                "status": "F" if error else "R",
+                "error": error[:500] if error else None,
+            })
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ 주간 리포트 저장 실패 (user_id={user_id}, child_id={child_id}): {str(e)}")
+            stats["failed"] += 1
+            continue
+
+        if error:
+            print(f"⚠️ 주간 리포트 생성 실패 (user_id={user_id}, child_id={child_id}): {error}")
+            stats["failed"] += 1
+        else:
+            stats["done"] += 1
+
+    elapsed = time.perf_counter() - started
+    stats["elapsed_sec"] = round(elapsed, 3)
+    stats["reports_per_min"] = round(stats["done"] / elapsed * 60, 1) if elapsed > 0 else 0
+    return stats
@@ -0,0 +1,14 @@
+-- 피드 목록용 식단별 집계 테이블 (app/models/meals_feed_projection.py)
+-- 코드 배포 전에 적용 후, 기존 식단은 app/batch/set_meals_feed_projection.py 로 최초 적재
+CREATE TABLE IF NOT EXISTS `meals_feed_projection` (
+    `meal_id` BIGINT NOT NULL COMMENT 'meals_calendars.pk',
+    `comment_count` INT NOT NULL DEFAULT 0 COMMENT '활성 댓글 수',
+    `image_url` VARCHAR(500) DEFAULT NULL COMMENT '대표 이미지 경로',
+    `mapped_tags` TEXT COMMENT '재료명 (콤마 구분)',
+    `mapped_scores` TEXT COMMENT '재료 score (콤마 구분)',
+    `mapped_ids` TEXT COMMENT '재료 pk (콤마 구분)',
+    `scrap_count` INT NOT NULL DEFAULT 0 COMMENT '활성 스크랩 수',
+    `pinned_count` INT NOT NULL DEFAULT 0 COMMENT '핀 고정 스크랩 수',
+    `updated_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '갱신일시',
+    PRIMARY KEY (`meal_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -0,0 +1,4 @@
+-- attaches_files 사이즈 변환 상태 컬럼 (app/models/attaches_files.py)
+-- 코드 배포 전에 적용, 기존 행은 변환 완료(R)로 채워짐
+ALTER TABLE `attaches_files`
+    ADD COLUMN `status` ENUM('P','R','F') NOT NULL DEFAULT 'R' COMMENT '사이즈 변환 상태 (P:대기, R:완료, F:실패)' AFTER `is_active`;
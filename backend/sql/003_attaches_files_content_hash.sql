@@ -0,0 +1,5 @@
+-- attaches_files 내용 해시 컬럼 (app/models/attaches_files.py)
+-- 코드 배포 전에 적용, 기존 행은 NULL (공유 blob 이 아닌 개별 파일)
+ALTER TABLE `attaches_files`
+    ADD COLUMN `content_hash` VARCHAR(64) DEFAULT NULL COMMENT '내용 sha256 (attaches/blobs 공유 파일, 같은 해시 행 수 = 참조 수)' AFTER `status`,
+    ADD KEY `ix_attaches_files_content_hash` (`content_hash`);
@@ -0,0 +1,18 @@
+-- 자녀별 주간 식단 리포트 (app/models/meals_week_reports.py, set_summaries_week 배치)
+-- 배치 배포 전에 적용
+CREATE TABLE IF NOT EXISTS `meals_week_reports` (
+    `id` BIGINT NOT NULL AUTO_INCREMENT,
+    `user_id` INT NOT NULL COMMENT 'users.pk',
+    `child_id` INT NOT NULL DEFAULT 0 COMMENT 'users_childs.pk',
+    `week_start` DATE NOT NULL COMMENT '집계 시작일',
+    `week_end` DATE NOT NULL COMMENT '집계 종료일',
+    `meal_count` INT NOT NULL DEFAULT 0 COMMENT '집계 식단 수',
+    `totals_json` TEXT COMMENT '영양소 합계 JSON',
+    `report_json` TEXT COMMENT 'AI 분석 결과 JSON',
+    `status` VARCHAR(1) NOT NULL DEFAULT 'P' COMMENT '상태 (P:대기, R:완료, F:실패)',
+    `error` VARCHAR(500) DEFAULT NULL COMMENT '실패 사유',
+    `created_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성일시',
+    `updated_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '갱신일시',
+    PRIMARY KEY (`id`),
+    UNIQUE KEY `unq_week_report` (`user_id`, `child_id`, `week_start`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
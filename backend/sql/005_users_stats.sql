@@ -0,0 +1,10 @@
+-- 회원별 집계 (app/models/users_stats.py)
+-- 코드 배포 전에 적용 후 app/batch/set_users_stats.py 로 최초 적재 (행이 없는 회원은 첫 조회 시 계산)
+CREATE TABLE IF NOT EXISTS `users_stats` (
+    `user_id` INT NOT NULL COMMENT 'users.pk',
+    `like_count` INT NOT NULL DEFAULT 0 COMMENT '누른 좋아요 수 (feeds_likes + meals_likes)',
+    `meal_count` INT NOT NULL DEFAULT 0 COMMENT '등록 식단 수 (삭제 제외)',
+    `public_meal_count` INT NOT NULL DEFAULT 0 COMMENT '공개 식단 수 (삭제 제외)',
+    `updated_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '갱신일시',
+    PRIMARY KEY (`user_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
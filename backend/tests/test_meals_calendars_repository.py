@@ -0,0 +1,88 @@
+"""
+MealsCalendarsRepository.get_meals_list - cursor 로 다음 페이지 조회 (sqlite 메모리 DB)
+- encode_cursor 토큰 / 레거시 숫자 cursor(마지막 행 id) 모두 정렬 키 전체 기준으로 이어져야 함
+"""
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.meals_calendar import MealsCalendars
+from app.repository.meals_calendars_repository import MealsCalendarsRepository
+
+BASE_TIME = datetime(2026, 1, 1, 9, 0, 0)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    MealsCalendars.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+
+    # id 와 created_at 순서가 다르도록 (created_at 정렬이 id 정렬과 구분되게)
+    for idx in range(7):
+        db.add(MealsCalendars(
+            id=idx + 1,
+            user_id=1,
+            category_code=idx + 1,
+            month="2026-01",
+            input_date=date(2026, 1, 1),
+            is_public="Y",
+            is_active="Y",
+            created_at=BASE_TIME + timedelta(hours=(idx * 3) % 7),
+        ))
+    db.commit()
+
+    yield db
+
+    db.close()
+    engine.dispose()
+
+
+def fetch_pages(session, extra, legacy_cursor=False):
+    params = {"is_active": "Y", "limit": 3}
+    pages = []
+    while True:
+        rows = MealsCalendarsRepository.get_meals_list(session, params, extra=extra)
+        if not rows:
+            break
+        pages.append([row.id for row in rows])
+        if legacy_cursor:
+            cursor = str(rows[-1].id)
+        else:
+            cursor = MealsCalendarsRepository.encode_cursor(session, params, rows[-1].id, extra=extra)
+        params = {**params, "cursor": cursor}
+    return pages
+
+
+@pytest.mark.parametrize("legacy_cursor", [False, True])
+def test_cursor_pages_default_sort(session, legacy_cursor):
+    pages = fetch_pages(session, {"offset": 0}, legacy_cursor)
+
+    assert pages == [[7, 6, 5], [4, 3, 2], [1]]
+
+
+@pytest.mark.parametrize("legacy_cursor", [False, True])
+def test_cursor_pages_created_at_asc(session, legacy_cursor):
+    pages = fetch_pages(session, {"offset": 0, "order_by": "created_at_asc"}, legacy_cursor)
+
+    expected = [
+        meal.id for meal in sorted(
+            session.query(MealsCalendars).all(),
+            key=lambda meal: (meal.created_at, meal.id),
+        )
+    ]
+    assert pages == [expected[0:3], expected[3:6], expected[6:]]
+    assert expected != sorted(expected)
+
+
+def test_apply_filters_ignores_cursor(session):
+    # cursor 는 KeysetPaginator.apply 에서만 적용 (토큰을 id 와 비교하면 MySQL 에서 0 으로 변환되어 빈 페이지)
+    token = MealsCalendarsRepository.encode_cursor(session, {"is_active": "Y"}, 3)
+    query = session.query(MealsCalendars)
+
+    with_cursor = MealsCalendarsRepository.apply_filters(session, query, {"is_active": "Y", "cursor": token})
+    without_cursor = MealsCalendarsRepository.apply_filters(session, query, {"is_active": "Y"})
+
+    assert str(with_cursor.statement) == str(without_cursor.statement)
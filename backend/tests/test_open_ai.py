@@ -0,0 +1,155 @@
+"""
+openai_call - httpx.MockTransport 로 OpenAI 응답을 흉내 내어 재시도 / 타임아웃 / 실패 응답 형식 확인
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.libs import open_ai
+
+URL = "https://openai.test/v1/chat/completions"
+MESSAGES = [{"role": "user", "content": "hi"}]
+OK_BODY = {"choices": [{"message": {"content": "ok"}}], "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5}}
+
+
+class FakeOpenAI:
+    """
+    요청마다 responses 를 순서대로 반환 (예외 객체면 raise)
+    """
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def __call__(self, request: httpx.Request):
+        self.requests.append(request)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """
+    backoff 대기는 실제로 기다리지 않고 기록만
+    """
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(open_ai.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+@pytest.fixture(autouse=True)
+def openai_settings(monkeypatch):
+    monkeypatch.setattr(open_ai.settings, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(open_ai.settings, "OPENAI_CALL_URL", URL)
+    monkeypatch.setattr(open_ai.settings, "OPENAI_MAX_RETRIES", 2)
+    monkeypatch.setattr(open_ai.settings, "OPENAI_BACKOFF_BASE", 0.5)
+
+
+def call(fake: FakeOpenAI, **kwargs):
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(fake), timeout=httpx.Timeout(60, connect=5))
+
+        def get_client():
+            open_ai._semaphore = asyncio.Semaphore(2)
+            return client
+
+        original = open_ai._get_client
+        open_ai._get_client = get_client
+        try:
+            return await open_ai.openai_call(MESSAGES, **kwargs)
+        finally:
+            open_ai._get_client = original
+            await client.aclose()
+
+    return asyncio.run(run())
+
+
+def test_returns_json_on_success(sleeps):
+    fake = FakeOpenAI(httpx.Response(200, json=OK_BODY))
+
+    result = call(fake)
+
+    assert result == OK_BODY
+    assert len(fake.requests) == 1
+    assert fake.requests[0].headers["authorization"] == "Bearer test-key"
+    assert sleeps == []
+
+
+def test_retries_429_honouring_retry_after(sleeps):
+    fake = FakeOpenAI(
+        httpx.Response(429, headers={"Retry-After": "7"}, json={"error": {"message": "rate limited"}}),
+        httpx.Response(200, json=OK_BODY),
+    )
+
+    result = call(fake)
+
+    assert result == OK_BODY
+    assert len(fake.requests) == 2
+    assert sleeps == [7.0]
+
+
+def test_retries_5xx_with_backoff_then_returns_error_shape(sleeps):
+    fake = FakeOpenAI(
+        httpx.Response(502, text="bad gateway"),
+        httpx.Response(503, text="unavailable"),
+        httpx.Response(500, text="boom"),
+    )
+
+    result = call(fake)
+
+    assert set(result) == {"error"}
+    assert result["error"].startswith("500")
+    assert len(fake.requests) == 3
+    assert len(sleeps) == 2
+    assert all(0 < delay <= open_ai.MAX_BACKOFF_SEC for delay in sleeps)
+
+
+def test_does_not_retry_client_errors(sleeps):
+    fake = FakeOpenAI(httpx.Response(409, text="conflict"))
+
+    result = call(fake)
+
+    assert result["error"].startswith("409")
+    assert len(fake.requests) == 1
+    assert sleeps == []
+
+
+def test_retries_timeouts_and_applies_per_call_timeout(sleeps):
+    fake = FakeOpenAI(
+        httpx.ReadTimeout("read timed out"),
+        httpx.Response(200, json=OK_BODY),
+    )
+
+    result = call(fake, timeout=3)
+
+    assert result == OK_BODY
+    assert len(fake.requests) == 2
+    assert fake.requests[0].extensions["timeout"]["read"] == 3
+    assert len(sleeps) == 1
+
+
+def test_timeouts_exhausting_retries_return_error_shape(sleeps):
+    fake = FakeOpenAI(*(httpx.ConnectTimeout("connect timed out") for _ in range(3)))
+
+    result = call(fake)
+
+    assert set(result) == {"error"}
+    assert result["error"].startswith("ConnectTimeout")
+    assert len(fake.requests) == 3
+
+
+def test_non_json_success_body_returns_error_shape(sleeps):
+    fake = FakeOpenAI(httpx.Response(200, text="<html>gateway</html>"))
+
+    result = call(fake)
+
+    assert set(result) == {"error"}
+    assert "JSON" in result["error"]
+    assert len(fake.requests) == 1
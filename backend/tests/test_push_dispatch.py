@@ -0,0 +1,80 @@
+"""
+PushDispatcher - FCM 대신 가짜 send_batch 로 묶음 / 중복 제거 / 실패 집계 확인
+"""
+import threading
+
+from app.libs.push_dispatch import PushDispatcher
+
+
+class FakeSender:
+    """
+    - "bad-" 로 시작하는 토큰은 무효 토큰으로 응답
+    - fail_on 토큰이 들어 있는 묶음은 예외 (인증 / 네트워크 오류)
+    """
+
+    def __init__(self, fail_on: str = None):
+        self.fail_on = fail_on
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def __call__(self, tokens, title, body, data):
+        with self._lock:
+            self.batches.append(list(tokens))
+
+        if self.fail_on in tokens:
+            raise RuntimeError("fcm unavailable")
+
+        invalid = [token for token in tokens if token.startswith("bad-")]
+        return {"success": len(tokens) - len(invalid), "failure": len(invalid), "invalid_tokens": invalid}
+
+
+def test_batches_at_500():
+    sender = FakeSender()
+    dispatcher = PushDispatcher(send_batch=sender, batch_size=500, workers=4)
+
+    stats = dispatcher.dispatch((f"token-{i}" for i in range(1201)), "title", "body")
+
+    assert sorted(len(batch) for batch in sender.batches) == [201, 500, 500]
+    assert stats["batches"] == 3
+    assert stats["tokens"] == 1201
+    assert stats["success"] == 1201
+    assert stats["failure"] == 0
+    assert stats["failed_batches"] == 0
+
+
+def test_skips_duplicate_and_empty_tokens_within_batch():
+    sender = FakeSender()
+    dispatcher = PushDispatcher(send_batch=sender, batch_size=500, workers=2)
+
+    stats = dispatcher.dispatch(["a", "b", "a", "", None, "c", "b"], "title", "body")
+
+    assert sender.batches == [["a", "b", "c"]]
+    assert stats["tokens"] == 3
+    assert stats["success"] == 3
+
+
+def test_counts_failed_batch_without_marking_tokens_invalid():
+    sender = FakeSender(fail_on="token-700")
+    dispatcher = PushDispatcher(send_batch=sender, batch_size=500, workers=2)
+
+    stats = dispatcher.dispatch([f"token-{i}" for i in range(1000)], "title", "body")
+
+    assert stats["batches"] == 2
+    assert stats["failed_batches"] == 1
+    assert stats["success"] == 500
+    assert stats["failure"] == 500
+    assert stats["invalid_tokens"] == []
+    assert stats["errors"] == ["fcm unavailable"]
+
+
+def test_collects_invalid_tokens_across_batches():
+    sender = FakeSender()
+    dispatcher = PushDispatcher(send_batch=sender, batch_size=3, workers=3)
+    tokens = ["ok-1", "bad-1", "ok-2", "ok-3", "bad-2", "ok-4", "bad-3"]
+
+    stats = dispatcher.dispatch(tokens, "title", "body", {"type": "meal_remind"})
+
+    assert len(sender.batches) == 3
+    assert sorted(stats["invalid_tokens"]) == ["bad-1", "bad-2", "bad-3"]
+    assert stats["success"] == 4
+    assert stats["failure"] == 3
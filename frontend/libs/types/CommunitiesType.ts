@@ -32,7 +32,7 @@ export interface CommunityPost {
 export interface CommunityListResponse {
   communities: CommunityPost[];
   total_count: number;
-  cursor: number;
+  cursor: string | null;
 }
 
 export interface CommunityListRequest {
@@ -45,7 +45,7 @@ export interface CommunityListRequest {
   startDate?: string;
   endDate?: string;
   sortBy?: string;
-  cursor?: number;
+  cursor?: string;
   myOnly?: string;
   limit?: number;
 }
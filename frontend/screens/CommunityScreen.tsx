@@ -65,7 +65,7 @@ export default function CommunityScreen({ navigation }: any) {
   const [isRefreshing, setIsRefreshing] = useState(false);
   const [posts, setPosts] = useState<CommunityListItem[]>([]);
   const [selectedPostId, setSelectedPostId] = useState<string | null>(null);
-  const [cursor, setCursor] = useState<number | undefined>(undefined);
+  const [cursor, setCursor] = useState<string | undefined>(undefined);
   const [deleteDialogVisible, setDeleteDialogVisible] = useState(false);
   const [postToDelete, setPostToDelete] = useState<string | null>(null);
 
@@ -129,7 +129,7 @@ export default function CommunityScreen({ navigation }: any) {
               return true;
             });
           });
-          setCursor(response.data.cursor);
+          setCursor(response.data.cursor ?? undefined);
         } else {
           toastError(response.error || '게시글을 불러오는 데 실패했습니다.');
         }
@@ -178,7 +178,7 @@ export default function CommunityScreen({ navigation }: any) {
 
   // 무한 스크롤
   const handleLoadMore = () => {
-    if (!isLoading && cursor && cursor > 0) {
+    if (!isLoading && cursor) {
       loadCommunities(false);
     }
   };